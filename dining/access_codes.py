@@ -0,0 +1,176 @@
+"""
+Выдача кодов доступа гостей из заранее перемешанного пула свободных кодов.
+
+Вместо случайного перебора с проверкой exists() (чем больше гостей, тем
+больше попыток) код берётся из таблицы FreeAccessCode: первый по position,
+одна запись (DELETE) на выдачу. Выдача и создание гостей идут в одной
+транзакции (reserved_access_codes): если гостя создать не удалось, коды
+остаются в пуле. Коды удалённых гостей (выезд, очистка, админка)
+возвращаются в пул сигналом post_delete (signals.guest_deleted); массовое
+удаление оборачивается в batched_code_release, чтобы коды пачки вернулись
+одним INSERT, а не по одному на гостя. Старый код, заменённый в админке,
+тоже возвращается в пул (admin.GuestAdmin).
+
+Если таблица пуста (первый запуск), пул строится автоматически;
+перестроить вручную можно командой:
+
+    python manage.py rebuild_access_code_pool
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import transaction
+
+from .models import FreeAccessCode, Guest
+
+
+ACCESS_CODE_LENGTH = 4
+
+# сколько раз пробуем выдать коды, если параллельный запрос забрал те же
+MAX_ALLOCATE_ATTEMPTS = 5
+
+_POSITION_MAX = 2 ** 31 - 1
+
+# коды, отложенные внутри batched_code_release (None — пишем сразу)
+_pending_release: ContextVar[list | None] = ContextVar("pending_code_release", default=None)
+
+
+class AccessCodePoolExhausted(Exception):
+    """Свободных кодов доступа не осталось."""
+
+
+class _AllocationConflict(Exception):
+    """Коды забрал параллельный запрос — повторяем выдачу."""
+
+
+def _random_position() -> int:
+    return random.randint(0, _POSITION_MAX)
+
+
+def _is_pool_code(code: str) -> bool:
+    return len(code) == ACCESS_CODE_LENGTH and code.isdigit()
+
+
+def rebuild_access_code_pool() -> int:
+    """
+    Заполняет пул всеми 4-значными кодами, которые не заняты гостями,
+    в случайном порядке. Возвращает размер пула.
+    """
+    used = set(Guest.objects.values_list("access_code", flat=True))
+    free_codes = [
+        code
+        for code in (f"{n:0{ACCESS_CODE_LENGTH}d}" for n in range(10 ** ACCESS_CODE_LENGTH))
+        if code not in used
+    ]
+    random.shuffle(free_codes)
+
+    with transaction.atomic():
+        FreeAccessCode.objects.all().delete()
+        FreeAccessCode.objects.bulk_create(
+            [FreeAccessCode(code=code, position=idx) for idx, code in enumerate(free_codes)],
+            batch_size=1000,
+        )
+    return len(free_codes)
+
+
+def allocate_access_codes(count: int) -> list[str]:
+    """
+    Выдаёт count уникальных кодов доступа (например, для заезда группы).
+    Коды удаляются из пула одним DELETE.
+    """
+    if count <= 0:
+        return []
+
+    rebuilt = False
+    result: list[str] = []
+
+    for _attempt in range(MAX_ALLOCATE_ATTEMPTS):
+        need = count - len(result)
+        rows = list(
+            FreeAccessCode.objects
+            .order_by("position")
+            .values_list("id", "code")[:need]
+        )
+
+        if len(rows) < need and not rebuilt and not FreeAccessCode.objects.exists():
+            # первый запуск: пул ещё не построен
+            rebuild_access_code_pool()
+            rebuilt = True
+            continue
+
+        if not rows:
+            raise AccessCodePoolExhausted("Свободных кодов доступа не осталось.")
+
+        ids = [row_id for row_id, _code in rows]
+        codes = [code for _row_id, code in rows]
+
+        # код мог быть занят вручную (админка, скрипты) — такие просто выбрасываем из пула
+        taken = set(
+            Guest.objects.filter(access_code__in=codes).values_list("access_code", flat=True)
+        )
+
+        try:
+            with transaction.atomic():
+                deleted, _ = FreeAccessCode.objects.filter(id__in=ids).delete()
+                if deleted != len(ids):
+                    raise _AllocationConflict()
+        except _AllocationConflict:
+            continue
+
+        result.extend(code for code in codes if code not in taken)
+        if len(result) >= count:
+            return result
+
+    raise AccessCodePoolExhausted("Не удалось выдать коды доступа, попробуйте ещё раз.")
+
+
+def allocate_access_code() -> str:
+    """Выдаёт один уникальный код доступа."""
+    return allocate_access_codes(1)[0]
+
+
+@contextmanager
+def reserved_access_codes(count: int):
+    """
+    Выдаёт count кодов в транзакции, внутри которой создаются гости:
+
+        with reserved_access_codes(len(rows)) as codes:
+            Guest.objects.bulk_create(...)
+
+    Ошибка внутри блока откатывает и выдачу — коды не теряются из пула.
+    """
+    with transaction.atomic():
+        yield allocate_access_codes(count)
+
+
+@contextmanager
+def batched_code_release():
+    """
+    Коды, освобождённые внутри блока (release_access_codes, в том числе из
+    сигнала удаления гостя), возвращаются в пул одним INSERT при выходе.
+    При ошибке внутри блока коды не возвращаются — вызывать внутри той же
+    транзакции, что и удаление.
+    """
+    pending = []
+    token = _pending_release.set(pending)
+    try:
+        yield
+    finally:
+        _pending_release.reset(token)
+    release_access_codes(pending)
+
+
+def release_access_codes(codes) -> None:
+    """Возвращает коды удалённых гостей в пул (в случайные позиции)."""
+    pending = _pending_release.get()
+    if pending is not None:
+        pending.extend(codes)
+        return
+    entries = [
+        FreeAccessCode(code=code, position=_random_position())
+        for code in set(codes)
+        if code and _is_pool_code(code)
+    ]
+    if entries:
+        FreeAccessCode.objects.bulk_create(entries, ignore_conflicts=True, batch_size=1000)
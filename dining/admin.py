@@ -1,4 +1,5 @@
 from django.contrib import admin
+from .access_codes import release_access_codes
 from .models import Guest, DiningTable, SeatAssignment, Dish, MenuCycle, DailyMenu, MenuItem
 
 admin.site.site_header = "Администрирование санатория"
@@ -10,6 +11,13 @@ class GuestAdmin(admin.ModelAdmin):
     list_display = ("full_name", "start_date", "end_date", "access_code")
     search_fields = ("full_name", "access_code")
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change and "access_code" in form.changed_data:
+            # старый код больше никому не выдан — возвращаем в пул; новый, если
+            # он ещё в пуле, выдача пропустит как занятый (см. access_codes.py)
+            release_access_codes([form.initial["access_code"]])
+
 admin.site.register(DiningTable)
 admin.site.register(SeatAssignment)
 admin.site.register(Dish)
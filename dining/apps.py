@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class DiningConfig(AppConfig):
     name = 'dining'
     verbose_name = "Питание"
+
+    def ready(self):
+        from . import signals  # noqa: F401
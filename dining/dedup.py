@@ -0,0 +1,367 @@
+"""
+Поиск и слияние дублей в справочнике блюд.
+
+Дубли появляются при загрузке меню: одно и то же блюдо записано
+по-разному — "рассып." и "рассыпчатая", латинские буквы вместо русских
+("batон"), другой порядок слов и ингредиентов в скобках. Сравнивать каждое блюдо
+с каждым — N² пар, поэтому кандидаты отбираются блокированием: через
+инвертированный индекс самых редких основ слов названия (_candidate_pairs).
+Для кандидатов считается сходство по словам с учётом сокращений и опечаток
+(триграммы, name_similarity), пары выше порога объединяются в группы.
+
+Результат — CSV для проверки (review_rows): в каждой группе блюдо, которое
+остаётся, и блюда, которые в него вливаются. Одобренные строки
+(read_merge_plan) применяет merge_dishes одной транзакцией: позиции меню
+переводятся на оставшееся блюдо (заказы ссылаются на позиции меню, так что
+история сохраняется), пустые КБЖУ/выход/название для кухни дополняются из
+дубля, дубли удаляются.
+"""
+import csv
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from django.db import transaction
+from django.db.models import Case, Count, IntegerField, Value, When
+from django.utils import timezone
+
+from .menu_cache import bump_menu_version
+from .models import Dish, MenuItem, OrderItem
+from .search import dish_search_text, normalize_search, trigram_similarity
+from .service_sheets import invalidate_service_sheets
+
+
+DUPLICATE_THRESHOLD = 0.85
+# грубый отсев кандидатов: доля общих основ слов (от большего набора)
+MIN_SHARED_KEYS = 0.6
+# сокращение ("рассып") совпадает с полным словом, если оно не короче
+MIN_ABBREVIATION = 4
+# слова с опечаткой совпадают, если сходство по триграммам не ниже
+WORD_TYPO_SIMILARITY = 0.5
+# сколько замен id в одном UPDATE ... CASE
+MERGE_BATCH_SIZE = 500
+
+# поля, которые у оставшегося блюда дополняются из дубля, если пусты
+MERGE_FILL_FIELDS = ("short_name", "proteins", "fats", "carbs", "kcal", "output")
+
+REVIEW_HEADER = ["Группа", "Действие", "Слить", "id блюда", "id основного", "Сходство", "Позиций меню", "Название"]
+ACTION_KEEP = "оставить"
+ACTION_MERGE = "слить"
+APPROVED_MARKS = {"1", "+", "x", "да", "yes"}
+
+_CYRILLIC = re.compile(r"[а-я]")
+_LATIN = re.compile(r"[a-z]")
+# латинские буквы, которыми при наборе подменяют русские
+_LATIN_TO_CYRILLIC = str.maketrans("abcehkmoptxy", "абсенкмортху")
+
+
+class DishMergeError(Exception):
+    """План слияния нельзя применить (нет блюда, цикл в цепочке слияний)."""
+
+
+@dataclass
+class DuplicateMatch:
+    dish: Dish
+    score: float        # сходство с основным блюдом группы
+    menu_items: int
+    # те же слова, что у основного (без сокращений и опечаток) —
+    # только такие строки в файле для проверки сразу отмечены к слиянию
+    exact: bool = False
+
+
+@dataclass
+class DuplicateGroup:
+    keep: Dish
+    keep_menu_items: int
+    duplicates: list[DuplicateMatch] = field(default_factory=list)
+
+
+@dataclass
+class MergeSummary:
+    dishes_merged: int = 0
+    dishes_filled: int = 0          # основных блюд, дополненных КБЖУ и т.п.
+    menu_items_repointed: int = 0
+    menu_items_collapsed: int = 0   # позиции, совпавшие в одном разделе меню после слияния
+    order_items_repointed: int = 0
+
+
+def dish_key_words(name: str) -> list[str]:
+    """
+    Слова названия для сравнения, нормализованные (search.normalize_search);
+    слова из смеси латиницы и кириллицы переведены в кириллицу
+    ("batон" -> "батон"). Состав в скобках остаётся: "рыба (хек)" и
+    "рыба (горбуша)" — разные блюда.
+    """
+    words = normalize_search(name).split()
+    return [
+        word.translate(_LATIN_TO_CYRILLIC) if _CYRILLIC.search(word) and _LATIN.search(word) else word
+        for word in words
+    ]
+
+
+@lru_cache(maxsize=65536)
+def _words_match(a: str, b: str) -> bool:
+    # словарь названий невелик, одни и те же пары слов сравниваются многократно
+    short, long_ = sorted((a, b), key=len)
+    if len(short) >= MIN_ABBREVIATION and long_.startswith(short):
+        return True
+    return len(short) > 3 and trigram_similarity(a, b) >= WORD_TYPO_SIMILARITY
+
+
+def name_similarity(a: list[str], b: list[str]) -> float:
+    """
+    Сходство названий по словам, порядок слов не важен:
+    2 · совпавших слов / (слов в a + слов в b). Слова совпадают точно,
+    как сокращение ("рассып" — "рассыпчатая") или с опечаткой.
+    """
+    if not a or not b:
+        return 0.0
+    count_a, count_b = Counter(a), Counter(b)
+    exact = count_a & count_b
+    matched = sum(exact.values())
+    rest_b = list((count_b - exact).elements())
+    for word in (count_a - exact).elements():
+        for i, other in enumerate(rest_b):
+            if _words_match(word, other):
+                matched += 1
+                del rest_b[i]
+                break
+    return 2 * matched / (len(a) + len(b))
+
+
+def _blocking_keys(words: list[str]) -> set[str]:
+    """Ключи блокирования — основы слов: "рассып" и "рассыпчатая" дают одну основу."""
+    return {word[:MIN_ABBREVIATION] for word in words}
+
+
+def _candidate_pairs(keys: dict[int, set[str]]):
+    """
+    Пары (id, id), у которых общих основ слов не меньше MIN_SHARED_KEYS
+    от большего из наборов. Фильтр по префиксу: у такой пары обязательно
+    есть общая основа среди самых редких основ каждого блюда (первые
+    len - ceil(доля * len) + 1), поэтому индексируются и сравниваются
+    только они — частые основы ("с", "кара", "карт") в блоки не попадают,
+    и пар намного меньше, чем N².
+    """
+    freq = Counter(key for dish_keys in keys.values() for key in dish_keys)
+    index = defaultdict(list)
+    for dish_id in sorted(keys):
+        dish_keys = keys[dish_id]
+        ordered = sorted(dish_keys, key=lambda key: (freq[key], key))
+        prefix = ordered[:len(ordered) - math.ceil(MIN_SHARED_KEYS * len(ordered)) + 1]
+
+        candidates = set()
+        for key in prefix:
+            candidates.update(index[key])
+            index[key].append(dish_id)
+        for other_id in candidates:
+            other_keys = keys[other_id]
+            if len(dish_keys & other_keys) >= MIN_SHARED_KEYS * max(len(dish_keys), len(other_keys)):
+                yield other_id, dish_id
+
+
+def find_duplicate_groups(threshold: float = DUPLICATE_THRESHOLD, queryset=None) -> list[DuplicateGroup]:
+    """
+    Группы похожих блюд. Основное блюдо группы — то, что чаще встречается
+    в меню, затем с заполненными КБЖУ, затем с меньшим id.
+    """
+    qs = Dish.objects.all() if queryset is None else queryset
+    dishes = {dish.id: dish for dish in qs.order_by("id")}
+    words = {dish_id: dish_key_words(dish.name) for dish_id, dish in dishes.items()}
+    keys = {dish_id: _blocking_keys(dish_words) for dish_id, dish_words in words.items() if dish_words}
+
+    scores = {}
+    for a, b in _candidate_pairs(keys):
+        len_a, len_b = len(words[a]), len(words[b])
+        if 2 * min(len_a, len_b) < threshold * (len_a + len_b):
+            continue  # даже если совпадут все слова короткого названия, сходство ниже порога
+        score = name_similarity(words[a], words[b])
+        if score >= threshold:
+            scores[(a, b)] = score
+
+    # группы — компоненты связности (union-find)
+    parent = {}
+
+    def root(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in scores:
+        parent[root(a)] = root(b)
+    members = defaultdict(list)
+    for dish_id in parent:
+        members[root(dish_id)].append(dish_id)
+
+    usage = dict(
+        MenuItem.objects
+        .filter(dish_id__in=parent)
+        .values("dish_id")
+        .annotate(n=Count("id"))
+        .values_list("dish_id", "n")
+    )
+
+    def keep_key(dish_id):
+        dish = dishes[dish_id]
+        filled = sum(getattr(dish, name) not in (None, "") for name in MERGE_FILL_FIELDS)
+        return -usage.get(dish_id, 0), -filled, dish_id
+
+    groups = []
+    for ids in members.values():
+        # в группе только блюда, похожие на основное напрямую, а не через цепочку
+        # (A ~ B ~ C не значит A ~ C); остальные образуют свои группы
+        remaining = sorted(ids, key=keep_key)
+        while len(remaining) > 1:
+            keep_id, *others = remaining
+            group = DuplicateGroup(dishes[keep_id], usage.get(keep_id, 0))
+            remaining = []
+            for dish_id in others:
+                score = name_similarity(words[dish_id], words[keep_id])
+                if score >= threshold:
+                    group.duplicates.append(DuplicateMatch(
+                        dishes[dish_id], score, usage.get(dish_id, 0),
+                        exact=sorted(words[dish_id]) == sorted(words[keep_id]),
+                    ))
+                else:
+                    remaining.append(dish_id)
+            if group.duplicates:
+                group.duplicates.sort(key=lambda m: (-m.score, m.dish.id))
+                groups.append(group)
+
+    groups.sort(key=lambda g: (-max(m.score for m in g.duplicates), g.keep.id))
+    return groups
+
+
+def review_rows(groups: list[DuplicateGroup]):
+    """
+    Строки файла для проверки (для exports.csv_stream): заголовок и по
+    строке на блюдо. Отмечены к слиянию только точные совпадения по словам
+    (DuplicateMatch.exact); сокращения и опечатки ("рассып." — "рассыпчатая")
+    дают сходство 1.0, но проверяются вручную.
+    """
+    yield REVIEW_HEADER
+    for number, group in enumerate(groups, start=1):
+        yield [number, ACTION_KEEP, "", group.keep.id, group.keep.id, "", group.keep_menu_items, group.keep.name]
+        for match in group.duplicates:
+            approved = "1" if match.exact else ""
+            yield [
+                number, ACTION_MERGE, approved, match.dish.id, group.keep.id,
+                f"{match.score:.2f}", match.menu_items, match.dish.name,
+            ]
+
+
+def read_merge_plan(path: str) -> dict[int, int]:
+    """{id дубля: id основного блюда} из одобренных строк файла для проверки."""
+    plan = {}
+    with open(path, encoding="utf-8-sig", newline="") as fh:
+        reader = csv.reader(fh, delimiter=";")
+        header = next(reader, None)
+        if header != REVIEW_HEADER:
+            raise DishMergeError(f"{path}: это не файл дублей блюд (другой заголовок).")
+        for line_no, row in enumerate(reader, start=2):
+            if len(row) < 5 or row[1].strip() != ACTION_MERGE:
+                continue
+            if row[2].strip().casefold() not in APPROVED_MARKS:
+                continue
+            try:
+                plan[int(row[3])] = int(row[4])
+            except ValueError:
+                raise DishMergeError(f"{path}, строка {line_no}: неверный id блюда.")
+    return plan
+
+
+def _resolve_plan(plan: dict[int, int]) -> dict[int, int]:
+    """Сводит цепочки (a -> b, b -> c) к конечному блюду: {a: c, b: c}."""
+    resolved = {}
+    for dup_id, keep_id in plan.items():
+        seen = {dup_id}
+        while keep_id in plan:
+            if keep_id in seen:
+                raise DishMergeError(f"Цикл в плане слияния: блюдо id={dup_id}.")
+            seen.add(keep_id)
+            keep_id = plan[keep_id]
+        resolved[dup_id] = keep_id
+    return resolved
+
+
+def _repoint(model, field_name: str, mapping: dict[int, int]) -> int:
+    """UPDATE model SET field = mapping[field] для строк с field из mapping — пачками."""
+    pairs = sorted(mapping.items())
+    updated = 0
+    for start in range(0, len(pairs), MERGE_BATCH_SIZE):
+        batch = dict(pairs[start:start + MERGE_BATCH_SIZE])
+        updated += model.objects.filter(**{f"{field_name}__in": batch}).update(**{
+            field_name: Case(
+                *(When(**{field_name: old}, then=Value(new)) for old, new in batch.items()),
+                output_field=IntegerField(),
+            ),
+        })
+    return updated
+
+
+@transaction.atomic
+def merge_dishes(plan: dict[int, int]) -> MergeSummary:
+    """
+    Вливает блюда-дубли в основные: plan = {id дубля: id основного}.
+    Число запросов не зависит от числа блюд (кроме пачек по MERGE_BATCH_SIZE).
+    """
+    summary = MergeSummary()
+    plan = {dup_id: keep_id for dup_id, keep_id in plan.items() if dup_id != keep_id}
+    if not plan:
+        return summary
+    resolved = _resolve_plan(plan)
+
+    dishes = Dish.objects.in_bulk({*resolved, *resolved.values()})
+    missing = sorted({*resolved, *resolved.values()} - dishes.keys())
+    if missing:
+        raise DishMergeError(f"Нет блюд с id: {', '.join(map(str, missing))}")
+
+    # 1) пустые КБЖУ, выход и название для кухни — из дубля
+    filled = {}
+    for dup_id, keep_id in sorted(resolved.items()):
+        keep, dup = dishes[keep_id], dishes[dup_id]
+        for name in MERGE_FILL_FIELDS:
+            if getattr(keep, name) in (None, "") and getattr(dup, name) not in (None, ""):
+                setattr(keep, name, getattr(dup, name))
+                filled[keep_id] = keep
+    for keep in filled.values():
+        keep.search_text = dish_search_text(keep.name, keep.short_name)
+    Dish.objects.bulk_update(filled.values(), [*MERGE_FILL_FIELDS, "search_text"])
+    summary.dishes_filled = len(filled)
+
+    # 2) позиции меню — на основное блюдо
+    moved_ids = set(MenuItem.objects.filter(dish_id__in=resolved).values_list("id", flat=True))
+    summary.menu_items_repointed = _repoint(MenuItem, "dish_id", resolved)
+
+    # 3) если в одном разделе меню блюдо оказалось дважды — оставляем одну позицию,
+    #    заказы с лишней переводим на неё
+    survivors = {}
+    extra = {}
+    for item_id, *key in sorted(
+        MenuItem.objects
+        .filter(dish_id__in=set(resolved.values()))
+        .values_list("id", "daily_menu_id", "meal_time", "category", "dish_id", "order_index", "is_active"),
+        # остаётся позиция, которая в меню (не снятая), затем не переведённая
+        key=lambda row: (not row[6], row[0] in moved_ids, row[5], row[0]),
+    ):
+        key = tuple(key[:4])
+        if key not in survivors:
+            survivors[key] = item_id
+        elif item_id in moved_ids:
+            extra[item_id] = survivors[key]
+    summary.order_items_repointed = _repoint(OrderItem, "menu_item_id", extra)
+    MenuItem.objects.filter(id__in=extra).delete()
+    summary.menu_items_collapsed = len(extra)
+
+    # 4) дубли больше ни на что не ссылаются
+    Dish.objects.filter(id__in=resolved).delete()
+    summary.dishes_merged = len(resolved)
+
+    # массовые update/delete сигналов не посылают
+    bump_menu_version()
+    invalidate_service_sheets(date_from=timezone.localdate())
+    return summary
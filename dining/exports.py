@@ -0,0 +1,213 @@
+"""
+Выгрузка отчётов для кухни и официантов в CSV и XLSX потоком.
+
+Строки отчёта — генератор списков значений; файл отдаётся кусками по мере
+формирования (StreamingHttpResponse или запись в файл командой
+export_reports), поэтому даже отчёт на две недели не собирается в памяти
+целиком: данные считаются по одному дню.
+
+XLSX пишется "вручную" минимальным набором частей (workbook, один лист,
+строки inlineStr) через zipfile в несохраняемый (unseekable) поток —
+без сторонних библиотек.
+"""
+import csv
+import io
+import zipfile
+from datetime import date, timedelta
+from xml.sax.saxutils import escape
+
+from .models import DIET_TYPE_CHOICES, MEAL_CHOICES
+from .reports import production_rows_for_range
+from .service_sheets import waiter_meal_blocks
+
+
+FORMAT_CSV = "csv"
+FORMAT_XLSX = "xlsx"
+FORMATS = (FORMAT_CSV, FORMAT_XLSX)
+
+CONTENT_TYPES = {
+    FORMAT_CSV: "text/csv; charset=utf-8",
+    FORMAT_XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# сколько байт копить перед отдачей очередного куска XLSX
+XLSX_CHUNK_SIZE = 64 * 1024
+
+
+def _days(date_from: date, date_to: date):
+    day = date_from
+    while day <= date_to:
+        yield day
+        day += timedelta(days=1)
+
+
+# ---------- строки отчётов ----------
+
+
+def kitchen_export_rows(date_from: date, date_to: date):
+    """Кухня: дата, приём пищи, диета, блюдо, выход, порции, масса."""
+    meal_order = {code: i for i, (code, _) in enumerate(MEAL_CHOICES)}
+    diet_order = {code: i for i, (code, _) in enumerate(DIET_TYPE_CHOICES)}
+    meal_labels = dict(MEAL_CHOICES)
+    diet_labels = dict(DIET_TYPE_CHOICES)
+
+    yield ["Дата", "Приём пищи", "Диета", "Блюдо", "Выход, г", "Порций", "Масса, г"]
+    for day in _days(date_from, date_to):
+        rows = sorted(
+            production_rows_for_range(day, day),
+            key=lambda r: (meal_order.get(r.meal_time, 99), diet_order.get(r.diet_kind, 99), r.dish_name),
+        )
+        for r in rows:
+            yield [
+                day.strftime("%d.%m.%Y"),
+                meal_labels.get(r.meal_time, r.meal_time),
+                diet_labels.get(r.diet_kind, r.diet_kind),
+                r.dish_name,
+                r.output,
+                r.portions,
+                r.portions * r.output if r.output else None,
+            ]
+
+
+def waiter_export_rows(date_from: date, date_to: date, table_from: int, table_to: int, waiter_num=None):
+    """Официанты: дата, приём пищи, раздел, блюдо, порций, столы(места)."""
+    yield ["Дата", "Приём пищи", "Раздел", "Блюдо", "Порций", "Столы (места)"]
+    for day in _days(date_from, date_to):
+        for meal in waiter_meal_blocks(day, table_from, table_to, waiter_num):
+            for cat in meal["categories"]:
+                for row in cat["rows"]:
+                    yield [
+                        day.strftime("%d.%m.%Y"),
+                        meal["meal_label"],
+                        cat["name"],
+                        row["dish_name"],
+                        row["total"],
+                        row["tables_str"],
+                    ]
+
+
+# ---------- CSV ----------
+
+
+class _Echo:
+    """Псевдо-файл для csv.writer: write() просто возвращает строку."""
+
+    def write(self, value):
+        return value
+
+
+def csv_stream(rows):
+    """CSV для Excel: UTF-8 с BOM, разделитель ";"."""
+    writer = csv.writer(_Echo(), delimiter=";")
+    yield "\ufeff"
+    for row in rows:
+        yield writer.writerow(["" if v is None else v for v in row])
+
+
+# ---------- XLSX ----------
+
+
+_XLSX_STATIC_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+_XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_XLSX_SHEET_TAIL = "</sheetData></worksheet>"
+
+
+class _ChunkBuffer(io.RawIOBase):
+    """Несохраняемый поток-приёмник: zipfile пишет сюда, мы забираем куски."""
+
+    def __init__(self):
+        self._chunks = []
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def pop(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self.size = 0
+        return data
+
+
+def _xlsx_cell(value) -> str:
+    if value is None or value == "":
+        return "<c/>"
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, (int, float)):
+        return f'<c t="n"><v>{value}</v></c>'
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{escape(str(value))}</t></is></c>'
+
+
+def xlsx_stream(rows, sheet_name: str = "Отчёт"):
+    """XLSX с одним листом; отдаётся кусками примерно по XLSX_CHUNK_SIZE байт."""
+    # имя листа: не длиннее 31 символа и без []:*?/\
+    sheet_name = "".join(ch for ch in sheet_name if ch not in "[]:*?/\\")[:31] or "Отчёт"
+
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, content in _XLSX_STATIC_PARTS.items():
+            zf.writestr(name, content)
+        zf.writestr("xl/workbook.xml", _XLSX_WORKBOOK.format(name=escape(sheet_name, {'"': "&quot;"})))
+        yield buffer.pop()
+
+        with zf.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(_XLSX_SHEET_HEAD.encode("utf-8"))
+            for row in rows:
+                sheet.write(("<row>" + "".join(_xlsx_cell(v) for v in row) + "</row>").encode("utf-8"))
+                if buffer.size >= XLSX_CHUNK_SIZE:
+                    yield buffer.pop()
+            sheet.write(_XLSX_SHEET_TAIL.encode("utf-8"))
+    yield buffer.pop()
+
+
+def stream_rows(rows, fmt: str, sheet_name: str = "Отчёт"):
+    """Куски файла (str для CSV, bytes для XLSX) в выбранном формате."""
+    if fmt == FORMAT_XLSX:
+        return xlsx_stream(rows, sheet_name)
+    return csv_stream(rows)
@@ -0,0 +1,211 @@
+"""
+Массовое назначение меню тем, кто не выбрал его на дату.
+
+Кого считаем "не выбравшим": гость активен на дату, приём пищи ему разрешён
+(в день выезда — только departure_*), в меню его диеты на этот приём есть
+выборные блюда (is_common=False), а заказа с позициями ещё нет.
+
+Всё это считается в базе: право на приём пищи — аннотацией (Case/When по
+дню выезда), "нет заказа" — анти-соединением (NOT EXISTS по позициям
+заказа). Пары (гость, приём пищи) вычисляются одним запросом, запись идёт
+через orders.save_orders — число запросов не зависит от количества гостей.
+"""
+from dataclasses import dataclass, field
+from datetime import date
+
+from django.db.models import BooleanField, Case, Count, Exists, F, OuterRef, Q, QuerySet, Value, When
+
+from .menu_cache import get_day_menus
+from .models import DIET_TYPE_CHOICES, MEAL_CHOICES, Guest, OrderItem
+from .orders import OrdersWriteSummary, save_orders
+
+
+@dataclass
+class MissingSet:
+    target_date: date
+    # диета -> приёмы пищи, где есть выборные блюда
+    required_meals_by_diet: dict[str, set[str]]
+    # диета -> первое выборное блюдо (menu_item_id) по приёмам пищи
+    default_items_by_diet: dict[str, dict[str, int]]
+    # гости без выбора (в порядке запроса) и их незаполненные приёмы пищи
+    guests: list[Guest] = field(default_factory=list)
+    missing_meals: dict[int, list[str]] = field(default_factory=dict)
+
+    def by_diet(self) -> dict[str, list[Guest]]:
+        result = {code: [] for code, _ in DIET_TYPE_CHOICES}
+        for guest in self.guests:
+            result.setdefault(guest.diet_kind, []).append(guest)
+        return result
+
+
+@dataclass
+class FillSummary:
+    target_date: date
+    guests_filled: int = 0                      # гостей, которым что-то назначено
+    meals_filled: int = 0                       # назначенных пар (гость, приём пищи)
+    by_diet: dict[str, int] = field(default_factory=dict)   # диета -> гостей
+    orders: OrdersWriteSummary = field(default_factory=OrdersWriteSummary)
+
+
+def _menu_requirements(target_date: date, diets) -> tuple[dict, dict]:
+    """(required_meals_by_diet, default_items_by_diet) на дату из меню всех диет."""
+    day = get_day_menus(target_date)
+    required, defaults = {}, {}
+    for diet in diets:
+        # диета без своего меню на этот день — выбирать нечего
+        snapshot = day.menus.get(diet)
+        required[diet] = set(snapshot.required_meals) if snapshot else set()
+        defaults[diet] = {meal: item.id for meal, item in snapshot.default_items.items()} if snapshot else {}
+    return required, defaults
+
+
+# приём пищи -> (поле "разрешено" в обычный день, поле в день выезда)
+MEAL_ALLOWED_FIELDS = {
+    "breakfast": ("breakfast_allowed", "breakfast_allowed"),
+    "lunch": ("lunch_allowed", "departure_lunch"),
+    "dinner": ("dinner_allowed", "departure_dinner"),
+}
+
+
+def meal_eligibility(meal_code: str, target_date: date) -> Case:
+    """
+    Аннотация "приём пищи разрешён гостю на target_date" — то же правило,
+    что views.allowed_meals_for_guest_on_date: в день выезда смотрим только
+    departure_*.
+    """
+    regular, departure = MEAL_ALLOWED_FIELDS[meal_code]
+    return Case(
+        When(end_date=target_date, then=F(departure)),
+        default=F(regular),
+        output_field=BooleanField(),
+    )
+
+
+def missing_guests_queryset(target_date: date, required_meals_by_diet: dict[str, set[str]]) -> QuerySet:
+    """
+    Активные на дату гости, не выбравшие меню хотя бы на один приём пищи,
+    с аннотациями missing_<meal> (bool) по каждому приёму пищи.
+    Приём пищи "не выбран", если он разрешён гостю, в меню его диеты на
+    этот приём есть выборные блюда, а позиций заказа на него нет.
+    """
+    annotations = {}
+    any_missing = Q(pk__in=[])
+    for meal_code, _label in MEAL_CHOICES:
+        diets = [diet for diet, meals in required_meals_by_diet.items() if meal_code in meals]
+        has_items = Exists(OrderItem.objects.filter(
+            order__guest_id=OuterRef("pk"),
+            order__date=target_date,
+            order__meal_time=meal_code,
+        ))
+        condition = Q(diet_kind__in=diets) & Q(**{f"{meal_code}_eligible": True}) & ~has_items
+        annotations[f"{meal_code}_eligible"] = meal_eligibility(meal_code, target_date)
+        annotations[f"missing_{meal_code}"] = Case(
+            When(condition, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+        any_missing |= Q(**{f"missing_{meal_code}": True})
+
+    return (
+        Guest.objects
+        .filter(
+            diet_kind__in=[diet for diet, meals in required_meals_by_diet.items() if meals],
+            start_date__lte=target_date,
+            end_date__gte=target_date,
+        )
+        .annotate(**annotations)
+        .filter(any_missing)
+        .order_by("id")
+    )
+
+
+def find_missing(target_date: date, diets=None) -> MissingSet:
+    """Кто и на какие приёмы пищи не выбрал меню на target_date (один запрос по гостям)."""
+    diets = list(diets or [code for code, _ in DIET_TYPE_CHOICES])
+    required, defaults = _menu_requirements(target_date, diets)
+
+    missing = MissingSet(
+        target_date=target_date,
+        required_meals_by_diet=required,
+        default_items_by_diet=defaults,
+    )
+    if not any(required.values()):
+        return missing  # на эту дату нет выборных блюд — нечего выбирать
+
+    for guest in missing_guests_queryset(target_date, required):
+        missing.guests.append(guest)
+        missing.missing_meals[guest.id] = [
+            meal_code for meal_code in sorted(required[guest.diet_kind])
+            if getattr(guest, f"missing_{meal_code}")
+        ]
+    return missing
+
+
+def missing_counts(target_date: date) -> dict[str, int]:
+    """Число не выбравших меню по диетам — один сгруппированный запрос."""
+    diets = [code for code, _ in DIET_TYPE_CHOICES]
+    required, _defaults = _menu_requirements(target_date, diets)
+    counts = {diet: 0 for diet in diets}
+    if not any(required.values()):
+        return counts
+
+    rows = (
+        missing_guests_queryset(target_date, required)
+        .order_by()
+        .values("diet_kind")
+        .annotate(count=Count("id"))
+        .values_list("diet_kind", "count")
+    )
+    counts.update(rows)
+    return counts
+
+
+def fill_missing_orders(
+    target_date: date,
+    diets=None,
+    items_by_diet: dict[str, dict[str, list[int]]] | None = None,
+    missing: MissingSet | None = None,
+) -> FillSummary:
+    """
+    Назначает меню всем, кто не выбрал его на target_date.
+
+    items_by_diet: диета -> {приём пищи: [menu_item_id, ...]} — выбор
+    диетсестры; для диет, которых там нет, назначается "стандартное" меню
+    (первое выборное блюдо на каждый приём пищи). Приёмы пищи, для которых
+    блюд нет, пропускаются. Уже выбранное гостем не трогаем.
+
+    missing: уже посчитанный find_missing (чтобы не считать дважды).
+    """
+    items_by_diet = items_by_diet or {}
+    if missing is None:
+        missing = find_missing(target_date, diets)
+    diets = set(diets or missing.required_meals_by_diet)
+
+    summary = FillSummary(target_date=target_date)
+    selections: dict[tuple[int, str], list[int]] = {}
+
+    for guest in missing.guests:
+        if guest.diet_kind not in diets:
+            continue
+        if guest.diet_kind in items_by_diet:
+            chosen = items_by_diet[guest.diet_kind]
+        else:
+            chosen = {
+                meal: [item_id]
+                for meal, item_id in missing.default_items_by_diet.get(guest.diet_kind, {}).items()
+            }
+
+        filled = False
+        for meal_code in missing.missing_meals[guest.id]:
+            ids = chosen.get(meal_code) or []
+            if ids:
+                selections[(guest.id, meal_code)] = list(ids)
+                summary.meals_filled += 1
+                filled = True
+        if filled:
+            summary.guests_filled += 1
+            summary.by_diet[guest.diet_kind] = summary.by_diet.get(guest.diet_kind, 0) + 1
+
+    # keep_existing: если гость успел выбрать сам, пока считали, — его выбор важнее
+    summary.orders = save_orders(target_date, selections, keep_existing=True)
+    return summary
@@ -0,0 +1,149 @@
+"""
+Фоновое обслуживание базы: очистка выехавших гостей и закрытие окна
+выбора меню.
+
+Раньше очистка выполнялась в начале почти каждого view и на каждом запросе
+(включая массовый вход гостей в 17:00) делала запись в SQLite.
+Теперь она запускается раз в сутки командой:
+
+    python manage.py purge_departed_guests
+
+(например, из cron в 03:00). Удаление идёт пачками, каждая пачка —
+в отдельной короткой транзакции, чтобы не держать блокировку записи долго.
+
+Окно выбора меню на день C закрывается в C-1 11:00. Команда
+
+    python manage.py close_ordering_window
+
+(из cron каждые несколько минут или с --loop как отдельный процесс)
+назначает стандартное меню всем, кто не выбрал, и сразу строит отчёты
+для кухни и официантов. Закрытая дата запоминается в SystemState,
+повторный запуск ничего не делает.
+"""
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .access_codes import batched_code_release
+from .fill import FillSummary, fill_missing_orders
+from .models import Guest, ServiceSheet, SystemState
+from .service_sheets import build_service_sheets, is_after_cutoff, order_cutoff
+
+
+DEFAULT_PURGE_BATCH_SIZE = 200
+
+
+def purge_departed_guests(today: date | None = None, batch_size: int = DEFAULT_PURGE_BATCH_SIZE) -> int:
+    """
+    Удаляет гостей, у которых дата выезда уже прошла (end_date < today),
+    пачками по batch_size. Каскадно удаляются посадки и заказы,
+    коды доступа возвращаются в пул свободных кодов.
+
+    Возвращает количество удалённых гостей.
+    """
+    if today is None:
+        today = timezone.localdate()
+
+    deleted = 0
+    while True:
+        ids = list(
+            Guest.objects
+            .filter(end_date__lt=today)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+
+        # коды доступа возвращаются в пул сигналом (signals.guest_deleted) —
+        # одним INSERT на пачку
+        with transaction.atomic(), batched_code_release():
+            Guest.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+
+    SystemState.objects.update_or_create(id=1, defaults={"last_guest_purge": today})
+    return deleted
+
+
+def purge_departed_guests_if_due(today: date | None = None, batch_size: int = DEFAULT_PURGE_BATCH_SIZE) -> int | None:
+    """
+    Запускает очистку не чаще одного раза в день.
+    Возвращает число удалённых гостей или None, если сегодня очистка уже была.
+    """
+    if today is None:
+        today = timezone.localdate()
+
+    last = (
+        SystemState.objects
+        .filter(id=1)
+        .values_list("last_guest_purge", flat=True)
+        .first()
+    )
+    if last is not None and last >= today:
+        return None
+
+    return purge_departed_guests(today, batch_size=batch_size)
+
+
+@dataclass
+class WindowCloseSummary:
+    target_date: date
+    fill: FillSummary
+    sheets: list[ServiceSheet] = field(default_factory=list)
+
+
+def last_closed_target(now: datetime | None = None) -> date:
+    """Последняя дата, окно выбора меню на которую уже закрылось."""
+    now = now or timezone.localtime()
+    tomorrow = now.date() + timedelta(days=1)
+    return tomorrow if is_after_cutoff(tomorrow, now) else now.date()
+
+
+def next_window_close(now: datetime | None = None) -> tuple[date, datetime]:
+    """(дата, момент) ближайшего закрытия окна выбора меню."""
+    # импорт здесь, чтобы не было циклического импорта views <-> maintenance
+    from .views import get_active_menu_target
+
+    now = now or timezone.localtime()
+    target_date, _window_start, window_end = get_active_menu_target(now)
+    if target_date is not None:
+        return target_date, window_end
+    # между 11:00 и 17:00 открытого окна нет — следующее закроется завтра в 11:00
+    target_date = now.date() + timedelta(days=2)
+    return target_date, order_cutoff(target_date)
+
+
+def close_ordering_window(target_date: date) -> WindowCloseSummary:
+    """
+    Назначает стандартное меню всем, кто не выбрал его на target_date,
+    и строит отчёты для кухни и официантов. Отметку в SystemState не трогает.
+    """
+    with transaction.atomic():
+        fill = fill_missing_orders(target_date)
+        sheets = build_service_sheets(target_date)
+    return WindowCloseSummary(target_date, fill, sheets)
+
+
+def close_ordering_window_if_due(now: datetime | None = None) -> WindowCloseSummary | None:
+    """
+    Закрывает окно на последнюю дату, для которой оно уже закрылось по времени.
+    Возвращает None, если эта дата уже обработана (в т.ч. другим процессом).
+    """
+    target_date = last_closed_target(now)
+    SystemState.objects.get_or_create(id=1)
+
+    with transaction.atomic():
+        # "захватываем" дату условным UPDATE: второй запуск получит 0 строк;
+        # при ошибке транзакция откатится вместе с отметкой
+        claimed = (
+            SystemState.objects
+            .filter(id=1)
+            .filter(Q(last_window_closed__isnull=True) | Q(last_window_closed__lt=target_date))
+            .update(last_window_closed=target_date)
+        )
+        if not claimed:
+            return None
+        return close_ordering_window(target_date)
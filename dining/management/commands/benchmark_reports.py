@@ -0,0 +1,113 @@
+"""
+Бенчмарк отчётов для раздачи: время ответа и число SQL-запросов
+на синтетических данных разного объёма.
+
+Для каждого объёма создаётся отдельная временная база: меню, N гостей
+с посадками и заказами на завтра. Затем страница отчёта запрашивается
+несколько раз, в отчёт идёт медиана времени. Каждый отчёт меряется
+дважды: до закрытия окна выбора (расчёт по заказам, "live") и после
+(готовый ServiceSheet, "sheet").
+
+Пример:
+    python manage.py benchmark_reports --guests 400 2000 --repeat 5
+"""
+import json
+import random
+import statistics
+import time
+from datetime import datetime, time as dt_time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+from django.utils import timezone
+
+from dining.perf import QueryCounter, frozen_localtime, temporary_database
+from dining.population import seed_guests, seed_menus, seed_orders
+
+
+REPORT_URLS = {
+    "kitchen": "/kitchen/?date={date}",
+    "waiter_print": "/waiter/print-compact/?date={date}",
+    "waiter_print_w1": "/waiter/print-compact/?date={date}&waiter=1",
+}
+
+# момент "сегодня" для замера: до и после закрытия окна выбора на завтра (11:00)
+MODES = {
+    "live": dt_time(9, 0),
+    "sheet": dt_time(12, 0),
+}
+
+
+class Command(BaseCommand):
+    help = "Бенчмарк отчётов для кухни и официантов: время и число SQL-запросов."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--guests", type=int, nargs="+", default=[400, 2000],
+            help="Объёмы (число гостей), по одному прогону на каждый.",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Сколько раз запрашивать каждую страницу.")
+        parser.add_argument("--seed", type=int, default=1, help="Seed генератора данных.")
+        parser.add_argument("--json", dest="json_path", default="", help="Куда сохранить результаты (JSON).")
+
+    def handle(self, *args, **options):
+        repeat = max(1, options["repeat"])
+        results = []
+        for guests_count in options["guests"]:
+            results.extend(self._run_tier(max(1, guests_count), repeat, options["seed"]))
+
+        header = f"{'guests':>6} {'report':<16} {'mode':<6} {'items':>7} {'median ms':>10} {'max ms':>8} {'SQL':>5}"
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+        for r in results:
+            self.stdout.write(
+                f"{r['guests']:>6} {r['report']:<16} {r['mode']:<6} {r['order_items']:>7} "
+                f"{r['median_ms']:>10.1f} {r['max_ms']:>8.1f} {r['queries']:>5}"
+            )
+
+        if options["json_path"]:
+            with open(options["json_path"], "w", encoding="utf-8") as fh:
+                json.dump(results, fh, ensure_ascii=False, indent=2)
+            self.stdout.write(f"Результаты сохранены в {options['json_path']}")
+
+    def _run_tier(self, guests_count, repeat, seed):
+        rng = random.Random(seed)
+        today = timezone.localdate()
+        target_date = today + timedelta(days=1)
+
+        with temporary_database(), override_settings(ALLOWED_HOSTS=["testserver"]):
+            seed_menus(rng)
+            guests = seed_guests(guests_count, today, today + timedelta(days=7), rng)
+            items_count = seed_orders(guests, target_date, rng)
+
+            user = get_user_model().objects.create_user("benchmark", is_staff=True)
+            client = Client()
+            client.force_login(user)
+            counter = QueryCounter()
+
+            tier = []
+            for mode, now_time in MODES.items():
+                with frozen_localtime(datetime.combine(today, now_time)):
+                    for name, url in REPORT_URLS.items():
+                        tier.append(self._measure(
+                            client, counter, url.format(date=target_date.isoformat()), repeat,
+                            guests=guests_count, report=name, mode=mode, order_items=items_count,
+                        ))
+        return tier
+
+    def _measure(self, client, counter, url, repeat, **labels):
+        timings = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            with counter.capture():
+                response = client.get(url)
+            timings.append(time.perf_counter() - t0)
+            if response.status_code != 200:
+                self.stderr.write(f"{url}: HTTP {response.status_code}")
+        return {
+            **labels,
+            "median_ms": statistics.median(timings) * 1000,
+            "max_ms": max(timings) * 1000,
+            "queries": counter.count,
+        }
@@ -0,0 +1,179 @@
+"""
+Бенчмарк основных страниц: время ответа, число SQL-запросов и пик памяти
+на синтетических данных разного объёма.
+
+Для каждого объёма создаётся отдельная временная база: меню и N гостей,
+проживающих в дату меню (seed_population), с заказами на эту дату.
+Время "замораживается" на открытом окне выбора (C-2 17:05). Каждая
+страница запрашивается один раз для прогрева и затем --repeat раз: в отчёт
+идут медиана и максимум времени и число запросов последнего прогона.
+Пик памяти (tracemalloc) меряется отдельным прогоном — трассировка
+замедляет запрос и исказила бы время. POST-запросы выполняются в
+транзакции, которая откатывается, — каждый прогон работает с теми же данными.
+
+Результаты пишутся в JSON (с коммитом, на котором сделан замер), чтобы
+сравнивать прогоны между коммитами.
+
+Примеры:
+    python manage.py benchmark_views
+    python manage.py benchmark_views --guests 400 --repeat 3 --json before.json
+"""
+import json
+import random
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, time as dt_time, timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client, override_settings
+from django.utils import timezone
+
+from dining.models import Guest
+from dining.perf import QueryCounter, frozen_localtime, temporary_database
+from dining.population import first_choice_post_data, seed_menus, seed_population
+
+
+class Command(BaseCommand):
+    help = "Бенчмарк страниц: время, число SQL-запросов и пик памяти по объёмам данных."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--guests", type=int, nargs="+", default=[100, 400, 2000],
+            help="Объёмы (число гостей в дату меню), по одному прогону на каждый.",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Сколько раз запрашивать каждую страницу.")
+        parser.add_argument("--seed", type=int, default=1, help="Seed генератора данных.")
+        parser.add_argument(
+            "--json", dest="json_path", default="benchmark_views.json",
+            help="Куда сохранить результаты (JSON).",
+        )
+
+    def handle(self, *args, **options):
+        repeat = max(1, options["repeat"])
+        results = []
+        for guests_count in options["guests"]:
+            results.extend(self._run_tier(max(1, guests_count), repeat, options["seed"]))
+
+        header = f"{'guests':>6} {'view':<22} {'median ms':>10} {'max ms':>8} {'SQL':>5} {'peak KiB':>9}"
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+        for r in results:
+            self.stdout.write(
+                f"{r['guests']:>6} {r['view']:<22} {r['median_ms']:>10.1f} {r['max_ms']:>8.1f} "
+                f"{r['queries']:>5} {r['peak_kib']:>9.0f}"
+            )
+
+        report = {
+            "commit": _git_commit(),
+            "created": timezone.now().isoformat(timespec="seconds"),
+            "repeat": repeat,
+            "seed": options["seed"],
+            "results": results,
+        }
+        with open(options["json_path"], "w", encoding="utf-8") as fh:
+            json.dump(report, fh, ensure_ascii=False, indent=2)
+        self.stdout.write(f"Результаты сохранены в {options['json_path']}")
+
+    def _run_tier(self, guests_count, repeat, seed):
+        rng = random.Random(seed)
+        today = timezone.localdate()
+        target_date = today + timedelta(days=2)
+        # открытое окно выбора на target_date: C-2 17:05
+        window_now = datetime.combine(today, dt_time(17, 5))
+
+        with (
+            temporary_database(),
+            frozen_localtime(window_now),
+            override_settings(ALLOWED_HOSTS=["testserver"]),
+        ):
+            seed_menus(rng)
+            with transaction.atomic():
+                seed_population(guests_count, target_date, 1, rng)
+
+            # гость для входа и выбора меню — не в день выезда (выбор на все приёмы)
+            guest = (
+                Guest.objects
+                .filter(start_date__lte=target_date, end_date__gt=target_date)
+                .order_by("id")
+                .first()
+            )
+            menu_post_data = first_choice_post_data(target_date, guest.diet_kind)
+            fill_post_data = first_choice_post_data(target_date, "B")
+
+            staff = Client()
+            staff.force_login(get_user_model().objects.create_user("benchmark", is_staff=True))
+            guest_client = Client()
+            guest_client.post("/", {"access_code": guest.access_code})
+
+            day = f"date={target_date.isoformat()}"
+            requests = [
+                ("landing", lambda: guest_client.get("/"), False),
+                ("guest_menu", lambda: guest_client.get("/guest/menu/"), False),
+                ("guest_menu_post", lambda: guest_client.post("/guest/menu/", menu_post_data), True),
+                ("waiter_print_compact", lambda: staff.get(f"/waiter/print-compact/?{day}"), False),
+                ("kitchen_summary", lambda: staff.get(f"/kitchen/?{day}"), False),
+                ("missing_menu", lambda: staff.get(f"/diet/missing/?{day}"), False),
+                ("missing_menu_fill", lambda: staff.get(f"/diet/missing/fill/B/?{day}"), False),
+                ("missing_menu_fill_post",
+                 lambda: staff.post(f"/diet/missing/fill/B/?{day}", fill_post_data), True),
+                ("seating_overview", lambda: staff.get("/diet/seating/"), False),
+                ("guest_list", lambda: staff.get(f"/diet/guests/?{day}"), False),
+            ]
+
+            counter = QueryCounter()
+            return [
+                self._measure(counter, request, repeat, rollback, guests=guests_count, view=name)
+                for name, request, rollback in requests
+            ]
+
+    def _measure(self, counter, request, repeat, rollback, **labels):
+        def call():
+            if not rollback:
+                return request()
+            with transaction.atomic():
+                response = request()
+                transaction.set_rollback(True)
+            return response
+
+        response = call()  # прогрев: шаблоны, кэш меню
+        if response.status_code not in (200, 302):
+            self.stderr.write(f"{labels['view']}: HTTP {response.status_code}")
+
+        timings = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            with counter.capture():
+                call()
+            timings.append(time.perf_counter() - t0)
+
+        tracemalloc.start()
+        try:
+            call()
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            **labels,
+            "status": response.status_code,
+            "median_ms": round(statistics.median(timings) * 1000, 2),
+            "max_ms": round(max(timings) * 1000, 2),
+            "queries": counter.count,
+            "peak_kib": round(peak / 1024, 1),
+        }
+
+
+def _git_commit() -> str:
+    """Текущий коммит (пустая строка, если git недоступен)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
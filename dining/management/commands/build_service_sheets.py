@@ -0,0 +1,43 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from dining.service_sheets import build_service_sheets, is_after_cutoff, order_cutoff
+
+
+class Command(BaseCommand):
+    help = (
+        "Строит готовые отчёты для кухни и официантов на дату "
+        "(по умолчанию — завтра). Запускать из cron после 11:00, "
+        "когда закрывается окно выбора меню."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", default="", help="Дата отчётов (YYYY-MM-DD), по умолчанию — завтра.")
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Построить, даже если окно выбора меню на эту дату ещё открыто.",
+        )
+
+    def handle(self, *args, **options):
+        if options["date"]:
+            try:
+                target_date = date.fromisoformat(options["date"])
+            except ValueError:
+                raise CommandError(f"Неверная дата: {options['date']}")
+        else:
+            target_date = timezone.localdate() + timedelta(days=1)
+
+        if not options["force"] and not is_after_cutoff(target_date):
+            cutoff = timezone.localtime(order_cutoff(target_date))
+            self.stdout.write(
+                f"Окно выбора меню на {target_date:%d.%m.%Y} закрывается "
+                f"{cutoff:%d.%m.%Y %H:%M}, отчёты пока не строю."
+            )
+            return
+
+        sheets = build_service_sheets(target_date)
+        kinds = ", ".join(sheet.get_kind_display() for sheet in sheets)
+        self.stdout.write(self.style.SUCCESS(f"Отчёты на {target_date:%d.%m.%Y} построены: {kinds}"))
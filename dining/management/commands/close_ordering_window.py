@@ -0,0 +1,89 @@
+"""
+Закрытие окна выбора меню: стандартное меню всем, кто не выбрал,
+и готовые отчёты для кухни и официантов.
+
+Примеры:
+    # из cron каждые 5 минут (лишние запуски ничего не делают)
+    python manage.py close_ordering_window
+
+    # отдельным процессом: ждёт ближайшего закрытия окна (C-1 11:00)
+    python manage.py close_ordering_window --loop
+
+    # вручную на конкретную дату
+    python manage.py close_ordering_window --date 2025-12-17 --force
+"""
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.utils import timezone
+
+from dining.maintenance import (
+    close_ordering_window,
+    close_ordering_window_if_due,
+    next_window_close,
+)
+from dining.service_sheets import is_after_cutoff
+
+
+class Command(BaseCommand):
+    help = (
+        "Закрывает окно выбора меню: назначает стандартное меню всем, кто не выбрал, "
+        "и строит отчёты для кухни и официантов. Повторный запуск для той же даты ничего не делает."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", default="", help="Дата (YYYY-MM-DD) — закрыть окно на неё (нужен --force).")
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Выполнить для --date, даже если окно ещё открыто или дата уже обработана.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Не завершаться: ждать каждого следующего закрытия окна.",
+        )
+
+    def handle(self, *args, **options):
+        if options["date"]:
+            try:
+                target_date = date.fromisoformat(options["date"])
+            except ValueError:
+                raise CommandError(f"Неверная дата: {options['date']}")
+            if not options["force"]:
+                raise CommandError("Для закрытия окна на конкретную дату укажите --force.")
+            if not is_after_cutoff(target_date):
+                self.stderr.write(f"Внимание: окно выбора на {target_date:%d.%m.%Y} ещё открыто.")
+            self._report(close_ordering_window(target_date))
+            return
+
+        self._run_once()
+        while options["loop"]:
+            target_date, moment = next_window_close()
+            self.stdout.write(f"Следующее закрытие окна: {timezone.localtime(moment):%d.%m.%Y %H:%M} "
+                              f"(меню на {target_date:%d.%m.%Y})")
+            # спим до закрытия окна (с небольшим запасом), затем закрываем
+            delay = (moment - timezone.now()).total_seconds()
+            if delay > 0:
+                time.sleep(delay + 1)
+            close_old_connections()
+            self._run_once()
+
+    def _run_once(self):
+        summary = close_ordering_window_if_due()
+        if summary is None:
+            self.stdout.write("Окно выбора уже закрыто и обработано, пропускаю.")
+            return
+        self._report(summary)
+
+    def _report(self, summary):
+        fill = summary.fill
+        by_diet = ", ".join(f"{diet}: {count}" for diet, count in sorted(fill.by_diet.items())) or "—"
+        kinds = ", ".join(sheet.get_kind_display() for sheet in summary.sheets)
+        self.stdout.write(self.style.SUCCESS(
+            f"Меню на {summary.target_date:%d.%m.%Y}: стандартное меню назначено "
+            f"{fill.guests_filled} гостям ({by_diet}), приёмов пищи: {fill.meals_filled}, "
+            f"позиций: {fill.orders.items_written}. Отчёты построены: {kinds}."
+        ))
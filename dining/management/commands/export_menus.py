@@ -0,0 +1,79 @@
+"""
+Выгрузка меню в файлы данных — тот же формат, что читает import_menus.
+Меню, загруженное из menus/, выгружается в те же файлы без изменений;
+КБЖУ, выход и is_diet берутся из справочника блюд (см. dining/menu_data.py).
+
+Примеры:
+    # все меню в menus/ (файл на цикл и диету: menu1_P.csv, ...)
+    python manage.py export_menus --output-dir menus
+
+    # один файл или stdout
+    python manage.py export_menus -o all_menus.csv
+    python manage.py export_menus --cycle "Меню №2" > menu2.csv
+"""
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dining.menu_data import export_menu_rows, menu_csv_writer, menu_row_values
+from dining.models import MenuCycle
+
+
+class Command(BaseCommand):
+    help = "Выгружает циклы, дни меню, позиции и блюда (с КБЖУ и выходом) в CSV-формате import_menus."
+
+    def add_arguments(self, parser):
+        parser.add_argument("-o", "--output", default="", help="Один файл для всех меню (по умолчанию — stdout).")
+        parser.add_argument(
+            "--output-dir", default="",
+            help="Каталог: файл на каждый цикл и диету (menu<номер цикла>_<диета>.csv).",
+        )
+        parser.add_argument("--cycle", action="append", default=[], help="Только этот цикл (можно несколько раз).")
+
+    def handle(self, *args, **options):
+        cycles = None
+        if options["cycle"]:
+            cycles = list(MenuCycle.objects.filter(name__in=options["cycle"]))
+            unknown = set(options["cycle"]) - {cycle.name for cycle in cycles}
+            if unknown:
+                raise CommandError(f"Нет циклов меню: {', '.join(sorted(unknown))}")
+
+        t0 = time.perf_counter()
+        rows = export_menu_rows(cycles)
+        if options["output_dir"]:
+            count, files = self._write_split(rows, Path(options["output_dir"]))
+            target = f"{files} файл(ов) в {options['output_dir']}"
+        elif options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as fh:
+                count = self._write(rows, menu_csv_writer(fh))
+            target = options["output"]
+        else:
+            count = self._write(rows, menu_csv_writer(self.stdout))
+            target = "stdout"
+        self.stderr.write(f"Выгружено позиций меню: {count} в {target} ({time.perf_counter() - t0:.3f} с).")
+
+    def _write(self, rows, writer):
+        count = 0
+        for _cycle, row in rows:
+            writer.writerow(menu_row_values(row))
+            count += 1
+        return count
+
+    def _write_split(self, rows, directory):
+        directory.mkdir(parents=True, exist_ok=True)
+        # номер цикла в имени файла — по порядку создания циклов
+        numbers = {cycle_id: i for i, cycle_id in enumerate(MenuCycle.objects.order_by("id").values_list("id", flat=True), 1)}
+        count, handles = 0, {}
+        try:
+            for cycle, row in rows:
+                key = (numbers[cycle.id], row.diet)
+                if key not in handles:
+                    fh = open(directory / f"menu{key[0]}_{key[1]}.csv", "w", encoding="utf-8", newline="")
+                    handles[key] = (fh, menu_csv_writer(fh))
+                handles[key][1].writerow(menu_row_values(row))
+                count += 1
+        finally:
+            for fh, _writer in handles.values():
+                fh.close()
+        return count, len(handles)
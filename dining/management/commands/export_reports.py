@@ -0,0 +1,71 @@
+"""
+Выгрузка отчётов для кухни и официантов в CSV / XLSX.
+
+Пример:
+    python manage.py export_reports kitchen --date-from 2025-12-17 --days 7 --format xlsx -o kitchen.xlsx
+    python manage.py export_reports waiter --waiter 2 > waiter.csv
+"""
+import sys
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from dining.exports import FORMAT_CSV, FORMATS, kitchen_export_rows, stream_rows, waiter_export_rows
+from dining.views import MAX_TABLE_NUMBER, WAITER_RANGES
+
+
+class Command(BaseCommand):
+    help = "Выгружает отчёт для кухни (kitchen) или официантов (waiter) в CSV или XLSX."
+
+    def add_arguments(self, parser):
+        parser.add_argument("report", choices=["kitchen", "waiter"], help="Какой отчёт выгрузить.")
+        parser.add_argument("--date-from", default="", help="Первая дата (YYYY-MM-DD), по умолчанию — завтра.")
+        parser.add_argument("--days", type=int, default=1, help="Сколько дней выгрузить.")
+        parser.add_argument("--format", choices=FORMATS, default=FORMAT_CSV, help="Формат файла.")
+        parser.add_argument("--waiter", type=int, default=None, help="Номер официанта (только для waiter).")
+        parser.add_argument("--table-from", type=int, default=None, help="Первый стол (только для waiter).")
+        parser.add_argument("--table-to", type=int, default=None, help="Последний стол (только для waiter).")
+        parser.add_argument("-o", "--output", default="", help="Файл результата (по умолчанию — stdout).")
+
+    def handle(self, *args, **options):
+        if options["date_from"]:
+            try:
+                date_from = date.fromisoformat(options["date_from"])
+            except ValueError:
+                raise CommandError(f"Неверная дата: {options['date_from']}")
+        else:
+            date_from = timezone.localdate() + timedelta(days=1)
+        date_to = date_from + timedelta(days=max(1, options["days"]) - 1)
+
+        if options["report"] == "kitchen":
+            rows = kitchen_export_rows(date_from, date_to)
+            sheet_name = "Кухня"
+        else:
+            waiter_num = options["waiter"]
+            if waiter_num is not None and waiter_num not in WAITER_RANGES:
+                raise CommandError(f"Нет официанта №{waiter_num}, есть: {sorted(WAITER_RANGES)}")
+            if waiter_num is not None:
+                table_from, table_to = WAITER_RANGES[waiter_num]
+            else:
+                table_from = max(1, options["table_from"] or 1)
+                table_to = min(MAX_TABLE_NUMBER, options["table_to"] or MAX_TABLE_NUMBER)
+            rows = waiter_export_rows(date_from, date_to, table_from, table_to, waiter_num)
+            sheet_name = "Официанты"
+
+        chunks = stream_rows(rows, options["format"], sheet_name)
+        binary = options["format"] != FORMAT_CSV
+
+        if options["output"]:
+            mode, encoding = ("wb", None) if binary else ("w", "utf-8")
+            with open(options["output"], mode, encoding=encoding, newline=None if binary else "") as fh:
+                for chunk in chunks:
+                    fh.write(chunk)
+            self.stderr.write(f"Сохранено в {options['output']}")
+        elif binary:
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
@@ -0,0 +1,88 @@
+"""
+Поиск похожих блюд (дублей) в справочнике и их слияние.
+
+Примеры:
+    # найти дубли и сохранить файл для проверки
+    python manage.py find_dish_duplicates -o dish_duplicates.csv
+
+    # в файле в колонке "Слить" отметить (1) строки, которые надо слить, и применить
+    python manage.py find_dish_duplicates --apply dish_duplicates.csv
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dining.dedup import (
+    DUPLICATE_THRESHOLD,
+    DishMergeError,
+    find_duplicate_groups,
+    merge_dishes,
+    read_merge_plan,
+    review_rows,
+)
+from dining.exports import csv_stream
+
+
+class Command(BaseCommand):
+    help = (
+        "Находит похожие блюда (сокращения, опечатки, другой порядок слов) и сохраняет их "
+        "в CSV для проверки; с --apply сливает отмеченные дубли одной транзакцией."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-o", "--output", default="dish_duplicates.csv", help="Файл для проверки (CSV).",
+        )
+        parser.add_argument(
+            "--threshold", type=float, default=DUPLICATE_THRESHOLD,
+            help="Минимальное сходство названий, от 0 до 1.",
+        )
+        parser.add_argument("--apply", metavar="FILE", default="", help="Слить дубли, отмеченные в файле.")
+
+    def handle(self, *args, **options):
+        if options["apply"]:
+            self._apply(options["apply"])
+            return
+
+        if not 0 < options["threshold"] <= 1:
+            raise CommandError("--threshold должен быть от 0 до 1.")
+
+        t0 = time.perf_counter()
+        groups = find_duplicate_groups(options["threshold"])
+        elapsed = time.perf_counter() - t0
+
+        with open(options["output"], "w", encoding="utf-8", newline="") as fh:
+            for chunk in csv_stream(review_rows(groups)):
+                fh.write(chunk)
+
+        duplicates = sum(len(group.duplicates) for group in groups)
+        self.stdout.write(self.style.SUCCESS(
+            f"Групп похожих блюд: {len(groups)}, дублей: {duplicates} ({elapsed:.2f} с). "
+            f"Сохранено в {options['output']}."
+        ))
+        if groups:
+            self.stdout.write(
+                "Проверьте файл: в колонке \"Слить\" 1 — слить блюдо с основным, пусто — оставить. "
+                f"Затем: python manage.py find_dish_duplicates --apply {options['output']}"
+            )
+
+    def _apply(self, path):
+        try:
+            plan = read_merge_plan(path)
+            if not plan:
+                self.stdout.write("В файле нет отмеченных к слиянию строк.")
+                return
+            t0 = time.perf_counter()
+            summary = merge_dishes(plan)
+        except OSError as exc:
+            raise CommandError(f"Не удалось прочитать {path}: {exc}")
+        except DishMergeError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Слито блюд: {summary.dishes_merged} ({time.perf_counter() - t0:.2f} с). "
+            f"Позиций меню переназначено: {summary.menu_items_repointed}, "
+            f"объединено совпавших: {summary.menu_items_collapsed}, "
+            f"позиций заказов переназначено: {summary.order_items_repointed}, "
+            f"основных блюд дополнено КБЖУ: {summary.dishes_filled}."
+        ))
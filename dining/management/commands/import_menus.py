@@ -0,0 +1,61 @@
+"""
+Загрузка меню из файлов данных (см. dining/menu_data.py).
+
+Примеры:
+    # все меню из menus/*.csv
+    python manage.py import_menus
+
+    # только один файл (дни из него приводятся к файлу, остальные не трогаются;
+    # позиции, на которые есть заказы, сохраняются)
+    python manage.py import_menus menus/menu1_P.csv
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dining.menu_data import MenuDataError, import_menus, menu_files, read_menu_rows
+
+
+class Command(BaseCommand):
+    help = "Загружает меню (циклы, дни, блюда) из CSV-файлов одной транзакцией."
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="*", help="Файлы или каталоги с меню, по умолчанию — menus/.")
+
+    def handle(self, *args, **options):
+        files = menu_files(options["paths"])
+        missing = [str(path) for path in files if not path.is_file()]
+        if missing or not files:
+            raise CommandError(f"Нет файлов меню: {', '.join(missing) or options['paths']}")
+
+        t0 = time.perf_counter()
+        try:
+            rows = read_menu_rows(files)
+        except MenuDataError as exc:
+            raise CommandError(str(exc))
+        t1 = time.perf_counter()
+        summary = import_menus(rows)
+        t2 = time.perf_counter()
+
+        items = summary.items
+        self.stdout.write(self.style.SUCCESS(
+            f"Загружено дней меню: {summary.daily_menus} (новых {summary.daily_menus_created}). "
+            f"Позиции: без изменений {items.unchanged}, добавлено {items.created}, "
+            f"изменено {items.updated}, удалено {items.deleted}. "
+            f"Блюд создано: {summary.dishes_created}, дополнено: {summary.dishes_updated}, "
+            f"циклов создано: {summary.cycles_created}."
+        ))
+        if summary.dishes_differing:
+            names = ", ".join(f"«{name}»" for name in summary.dishes_differing[:10])
+            more = f" и ещё {len(summary.dishes_differing) - 10}" if len(summary.dishes_differing) > 10 else ""
+            self.stderr.write(
+                f"Значения в базе отличаются от файлов и оставлены как есть, блюд: "
+                f"{len(summary.dishes_differing)} ({names}{more})."
+            )
+        if items.retired:
+            self.stderr.write(
+                f"Снято с меню позиций, которых нет в файлах, но на которые есть заказы: {items.retired}."
+            )
+        self.stdout.write(
+            f"Время: чтение файлов {t1 - t0:.3f} с, запись в базу {t2 - t1:.3f} с, всего {t2 - t0:.3f} с."
+        )
@@ -0,0 +1,198 @@
+"""
+Нагрузочный тест окна выбора меню ("шторм" входов в 17:00).
+
+На временной базе создаёт N гостей с посадками и меню, "замораживает" время
+на начале окна выбора (C-2 17:05) и параллельно прогоняет для каждого гостя:
+вход по коду (landing) -> страница меню (guest_menu GET) -> сохранение (POST).
+Время и число SQL-запросов считаются только по успешным ответам, ошибки —
+отдельно по каждому шагу; если ошибки есть, команда завершается с ошибкой.
+
+Пример:
+    python manage.py loadtest_ordering --guests 400 --concurrency 16 --json loadtest.json
+"""
+import json
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections
+from django.test import Client, override_settings
+from django.utils import timezone
+
+from dining.perf import QueryCounter, frozen_localtime, percentile, temporary_database
+from dining.population import first_choice_post_data, seed_guests, seed_menus
+
+
+ENDPOINTS = ("login", "menu_get", "menu_post")
+
+
+class Command(BaseCommand):
+    help = "Нагрузочный тест: одновременный вход гостей, просмотр и сохранение меню."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--guests", type=int, default=400, help="Сколько гостей создать.")
+        parser.add_argument("--concurrency", type=int, default=16, help="Число параллельных потоков.")
+        parser.add_argument("--seed", type=int, default=1, help="Seed генератора данных.")
+        parser.add_argument("--json", dest="json_path", default="", help="Куда сохранить результаты (JSON).")
+
+    def handle(self, *args, **options):
+        guests_count = max(1, options["guests"])
+        concurrency = max(1, options["concurrency"])
+        rng = random.Random(options["seed"])
+
+        today = timezone.localdate()
+        target_date = today + timedelta(days=2)
+        # начало окна выбора на target_date: C-2 17:00
+        window_now = timezone.make_aware(datetime.combine(today, dt_time(17, 5)))
+
+        with (
+            temporary_database(),
+            frozen_localtime(window_now),
+            override_settings(ALLOWED_HOSTS=["testserver"]),
+        ):
+            seed_menus(rng)
+            guests = seed_guests(guests_count, today, today + timedelta(days=7), rng)
+            post_data_by_diet = {
+                diet: first_choice_post_data(target_date, diet)
+                for diet in {g.diet_kind for g in guests}
+            }
+            self.stdout.write(
+                f"Создано гостей: {len(guests)}, дата меню: {target_date:%d.%m.%Y}, потоков: {concurrency}"
+            )
+
+            # ошибки запросов учитываем в отчёте, трассировки в консоль не выводим
+            request_logger = logging.getLogger("django.request")
+            old_level = request_logger.level
+            request_logger.setLevel(logging.CRITICAL)
+            try:
+                results = _run(guests, post_data_by_diet, concurrency)
+            finally:
+                request_logger.setLevel(old_level)
+
+        report = _build_report(results, guests_count, concurrency)
+        self._print_report(report)
+
+        if options["json_path"]:
+            with open(options["json_path"], "w", encoding="utf-8") as fh:
+                json.dump(report, fh, ensure_ascii=False, indent=2)
+            self.stdout.write(f"Результаты сохранены в {options['json_path']}")
+
+        if report["errors"]:
+            failed = ", ".join(
+                f"{name}: {r['errors']}/{r['requests']}"
+                for name, r in report["endpoints"].items()
+                if r["errors"]
+            )
+            raise CommandError(f"Есть неуспешные запросы ({failed}) — замеры недостоверны.")
+
+    def _print_report(self, report):
+        self.stdout.write(
+            f"\nВсего: {report['total_seconds']:.2f} с, "
+            f"{report['throughput_rps']:.1f} запросов/с"
+        )
+        header = f"{'endpoint':<10} {'n':>5} {'ok':>5} {'err':>4} {'locked':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'SQL':>6} {'rps':>7}"
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+        for name in ENDPOINTS:
+            r = report["endpoints"][name]
+            self.stdout.write(
+                f"{name:<10} {r['requests']:>5} {r['ok']:>5} {r['errors']:>4} {r['locked']:>6} "
+                f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} "
+                f"{r['avg_queries']:>6.1f} {r['throughput_rps']:>7.1f}"
+            )
+
+
+class _Results:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = defaultdict(list)   # endpoint -> [(seconds, queries, ok, locked)]
+        self.started = 0.0
+        self.finished = 0.0
+
+    def add(self, endpoint, seconds, queries, ok, locked):
+        with self.lock:
+            self.samples[endpoint].append((seconds, queries, ok, locked))
+
+
+def _timed_request(results, counter, endpoint, func, expected_status):
+    t0 = time.perf_counter()
+    ok = locked = False
+    try:
+        with counter.capture():
+            response = func()
+        ok = response.status_code == expected_status
+    except OperationalError as exc:
+        locked = "locked" in str(exc)
+    except Exception:  # noqa: BLE001 — любая ошибка view считается неуспешным запросом
+        pass
+    results.add(endpoint, time.perf_counter() - t0, counter.count, ok, locked)
+    return ok
+
+
+def _guest_session(guest, post_data, results):
+    client = Client()
+    counter = QueryCounter()
+    try:
+        if not _timed_request(
+            results, counter, "login",
+            lambda: client.post("/", {"access_code": guest.access_code}), 302,
+        ):
+            return
+        _timed_request(results, counter, "menu_get", lambda: client.get("/guest/menu/"), 200)
+        _timed_request(results, counter, "menu_post", lambda: client.post("/guest/menu/", post_data), 302)
+    finally:
+        connections.close_all()
+
+
+def _run(guests, post_data_by_diet, concurrency):
+    results = _Results()
+    results.started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for guest in guests:
+            pool.submit(_guest_session, guest, post_data_by_diet[guest.diet_kind], results)
+    results.finished = time.perf_counter()
+    return results
+
+
+def _build_report(results, guests_count, concurrency):
+    """
+    Время и число запросов — только по успешным ответам (ожидаемый статус):
+    страница ошибки 500 с DEBUG делает десятки своих запросов и искажала
+    бы средние. Ошибки считаются отдельно по каждому endpoint.
+    """
+    total_seconds = max(results.finished - results.started, 1e-9)
+    endpoints = {}
+    total_requests = total_errors = 0
+    for name in ENDPOINTS:
+        samples = results.samples.get(name, [])
+        ok_samples = [s for s in samples if s[2]]
+        latencies_ms = [s[0] * 1000 for s in ok_samples]
+        errors = len(samples) - len(ok_samples)
+        total_requests += len(samples)
+        total_errors += errors
+        endpoints[name] = {
+            "requests": len(samples),
+            "ok": len(ok_samples),
+            "errors": errors,
+            "error_rate": errors / len(samples) if samples else 0.0,
+            "locked": sum(1 for s in samples if s[3]),
+            "p50_ms": percentile(latencies_ms, 50),
+            "p95_ms": percentile(latencies_ms, 95),
+            "p99_ms": percentile(latencies_ms, 99),
+            "avg_queries": (sum(s[1] for s in ok_samples) / len(ok_samples)) if ok_samples else 0.0,
+            "max_queries": max((s[1] for s in ok_samples), default=0),
+            "throughput_rps": len(ok_samples) / total_seconds,
+        }
+    return {
+        "guests": guests_count,
+        "concurrency": concurrency,
+        "total_seconds": total_seconds,
+        "throughput_rps": (total_requests - total_errors) / total_seconds,
+        "errors": total_errors,
+        "endpoints": endpoints,
+    }
@@ -0,0 +1,88 @@
+"""
+Календарь меню (MenuCalendarEntry): построение и разовые замены.
+
+Примеры:
+    # построить на 8 недель вперёд (из cron раз в сутки, чтобы календарь "ехал" вперёд)
+    python manage.py menu_calendar
+
+    # праздничное меню: 31.12 для диеты Б подаётся дневное меню id=57
+    python manage.py menu_calendar --override 2025-12-31 B 57
+
+    # поменять местами меню двух дат (для всех диет или одной --diet)
+    python manage.py menu_calendar --swap 2025-12-30 2026-01-02
+
+    # отменить разовые замены на дату
+    python manage.py menu_calendar --clear 2025-12-31
+"""
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dining.menu_calendar import (
+    CALENDAR_WEEKS,
+    clear_menu_override,
+    rebuild_menu_calendar,
+    set_menu_override,
+    swap_menu_days,
+)
+from dining.models import DIET_TYPE_CHOICES, DailyMenu
+
+
+def _parse_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f"Неверная дата: {value}")
+
+
+class Command(BaseCommand):
+    help = "Строит календарь меню на несколько недель вперёд и управляет разовыми заменами."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date-from", default="", help="Начало календаря (YYYY-MM-DD), по умолчанию — сегодня.")
+        parser.add_argument("--weeks", type=int, default=CALENDAR_WEEKS, help="На сколько недель строить.")
+        parser.add_argument(
+            "--override", nargs=3, metavar=("DATE", "DIET", "MENU_ID"),
+            help="Разовая замена: в DATE для диеты DIET подаётся дневное меню MENU_ID.",
+        )
+        parser.add_argument("--swap", nargs=2, metavar=("DATE_A", "DATE_B"), help="Поменять местами меню двух дат.")
+        parser.add_argument("--clear", metavar="DATE", help="Отменить разовые замены на дату.")
+        parser.add_argument(
+            "--diet", choices=[code for code, _ in DIET_TYPE_CHOICES], default=None,
+            help="Только для этой диеты (для --swap и --clear).",
+        )
+
+    def handle(self, *args, **options):
+        if options["override"]:
+            date_str, diet_kind, menu_id = options["override"]
+            target_date = _parse_date(date_str)
+            if diet_kind not in dict(DIET_TYPE_CHOICES):
+                raise CommandError(f"Неизвестная диета: {diet_kind}")
+            daily_menu = DailyMenu.objects.filter(id=menu_id).first() if menu_id.isdigit() else None
+            if daily_menu is None:
+                raise CommandError(f"Нет дневного меню с id={menu_id}")
+            set_menu_override(target_date, diet_kind, daily_menu)
+            self.stdout.write(self.style.SUCCESS(f"{target_date:%d.%m.%Y} ({diet_kind}): {daily_menu}"))
+            return
+
+        if options["swap"]:
+            date_a, date_b = (_parse_date(value) for value in options["swap"])
+            diets = [options["diet"]] if options["diet"] else None
+            swapped = swap_menu_days(date_a, date_b, diets)
+            self.stdout.write(self.style.SUCCESS(
+                f"Меню {date_a:%d.%m.%Y} и {date_b:%d.%m.%Y} переставлены для диет: {swapped}"
+            ))
+            return
+
+        if options["clear"]:
+            target_date = _parse_date(options["clear"])
+            cleared = clear_menu_override(target_date, options["diet"])
+            self.stdout.write(self.style.SUCCESS(f"Отменено разовых замен на {target_date:%d.%m.%Y}: {cleared}"))
+            return
+
+        date_from = _parse_date(options["date_from"]) if options["date_from"] else None
+        summary = rebuild_menu_calendar(date_from, max(1, options["weeks"]))
+        self.stdout.write(self.style.SUCCESS(
+            f"Календарь меню {summary.date_from:%d.%m.%Y}–{summary.date_to:%d.%m.%Y}: "
+            f"записей по чередованию {summary.written}, разовых замен {summary.overrides}."
+        ))
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from dining.maintenance import (
+    DEFAULT_PURGE_BATCH_SIZE,
+    purge_departed_guests,
+    purge_departed_guests_if_due,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Удаляет выехавших гостей (end_date < сегодня) пачками. "
+        "Запускать раз в сутки из cron; повторный запуск в тот же день ничего не делает."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_PURGE_BATCH_SIZE,
+            help="Сколько гостей удалять за одну транзакцию.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Запустить очистку, даже если сегодня она уже выполнялась.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+
+        if options["force"]:
+            deleted = purge_departed_guests(batch_size=batch_size)
+        else:
+            deleted = purge_departed_guests_if_due(batch_size=batch_size)
+
+        if deleted is None:
+            self.stdout.write("Сегодня очистка уже выполнялась, пропускаю.")
+            return
+
+        self.stdout.write(self.style.SUCCESS(f"Удалено выехавших гостей: {deleted}"))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from dining.access_codes import rebuild_access_code_pool
+
+
+class Command(BaseCommand):
+    help = "Перестраивает пул свободных кодов доступа (все 4-значные коды, не занятые гостями)."
+
+    def handle(self, *args, **options):
+        size = rebuild_access_code_pool()
+        self.stdout.write(self.style.SUCCESS(f"Свободных кодов в пуле: {size}"))
@@ -0,0 +1,203 @@
+"""
+Кэш "снимков" меню для страницы выбора гостя и страниц диетсестры.
+
+На одну дату существует всего три разных меню (П/Б/БД), поэтому структура
+"приём пищи -> раздел -> блюда" строится сразу для всех диет один раз на
+(дата, версия меню) и используется всеми гостями. Версия меню хранится в SystemState.menu_version
+и меняется (новый случайный UUID) при любом изменении блюд, меню на день,
+позиций меню, циклов и настроек чередования (см. signals.py), поэтому кэш
+сбрасывается автоматически во всех процессах. Случайный UUID вместо счётчика —
+чтобы откат транзакции не привёл к повторному использованию старого номера.
+
+Объекты в снимке общие для всех запросов — их нельзя изменять.
+"""
+import threading
+import uuid
+from dataclasses import dataclass, field, replace
+from datetime import date
+
+from .models import MEAL_CHOICES, MEAL_TIMES, DailyMenu, MenuItem, SystemState
+
+
+@dataclass(frozen=True)
+class CategorySnapshot:
+    key: str                # имя поля формы: "<meal>_cat_<idx>"
+    category: str
+    items: tuple            # MenuItem (с загруженным dish)
+    has_choices: bool       # есть ли выборные (не is_common) блюда
+
+
+@dataclass(frozen=True)
+class MealSnapshot:
+    code: str
+    label: str
+    time: str | None
+    categories: tuple       # CategorySnapshot
+    has_choices: bool
+
+
+@dataclass(frozen=True)
+class MenuSnapshot:
+    target_date: date
+    diet_kind: str
+    version: uuid.UUID
+    daily_menu: DailyMenu | None
+    meals: tuple            # MealSnapshot, в порядке MEAL_CHOICES
+    # поля формы и приёмы пищи, где есть выбор (обязательны для выбора)
+    required_keys: frozenset = frozenset()
+    required_meals: frozenset = frozenset()
+    # "стандартное" блюдо: первое выборное по (order_index, id) на приём пищи
+    default_items: dict = field(default_factory=dict)
+
+    @property
+    def meal_blocks(self) -> tuple:
+        """Приёмы пищи, в которых есть блюда (для форм диетсестры)."""
+        return tuple(meal for meal in self.meals if meal.categories)
+
+
+@dataclass(frozen=True)
+class DayMenus:
+    """Меню всех диет на одну дату."""
+    target_date: date
+    version: uuid.UUID
+    menus: dict             # диета -> MenuSnapshot (только диеты, для которых есть меню)
+    fallback: MenuSnapshot | None   # меню дня для диеты без своего меню
+
+    def for_diet(self, diet_kind: str) -> MenuSnapshot:
+        snapshot = self.menus.get(diet_kind)
+        if snapshot is not None:
+            return snapshot
+        if self.fallback is None:
+            return MenuSnapshot(self.target_date, diet_kind, self.version, None, ())
+        # как и раньше: если для диеты меню нет — берём любое меню этого дня
+        return replace(self.fallback, diet_kind=diet_kind)
+
+
+# на практике нужно 1-2 даты; ограничение — на случай перебора дат
+MAX_DAYS = 32
+
+_lock = threading.Lock()
+_days: dict[tuple[date, uuid.UUID], DayMenus] = {}
+
+
+def current_menu_version() -> uuid.UUID:
+    version = (
+        SystemState.objects
+        .filter(id=1)
+        .values_list("menu_version", flat=True)
+        .first()
+    )
+    if version is None:
+        # первый запуск: записи ещё нет
+        state, _ = SystemState.objects.get_or_create(id=1)
+        version = state.menu_version
+    return version
+
+
+def bump_menu_version() -> None:
+    """Помечает все снимки меню устаревшими (во всех процессах)."""
+    if not SystemState.objects.filter(id=1).update(menu_version=uuid.uuid4()):
+        SystemState.objects.get_or_create(id=1)
+
+
+def _build_snapshot(
+    target_date: date, version: uuid.UUID, diet_kind: str, daily_menu: DailyMenu, items,
+) -> MenuSnapshot:
+    from .views import category_sort_key
+
+    items_by_meal = {code: {} for code, _ in MEAL_CHOICES}
+    for item in sorted(items, key=lambda it: (it.order_index, -it.id)):  # как MenuItem.Meta.ordering
+        if item.meal_time not in items_by_meal:
+            continue  # старые snack и т.п.
+        items_by_meal[item.meal_time].setdefault(item.category or "", []).append(item)
+
+    meals = []
+    for code, label in MEAL_CHOICES:
+        categories = tuple(
+            CategorySnapshot(
+                key=f"{code}_cat_{idx}",
+                category=category,
+                items=tuple(items),
+                has_choices=any(not it.is_common for it in items),
+            )
+            for idx, (category, items) in enumerate(
+                sorted(items_by_meal[code].items(), key=lambda kv: category_sort_key(kv[0]))
+            )
+        )
+        meals.append(MealSnapshot(
+            code=code,
+            label=label,
+            time=MEAL_TIMES.get(code),
+            categories=categories,
+            has_choices=any(cat.has_choices for cat in categories),
+        ))
+
+    default_items = {}
+    for item in sorted(items, key=lambda it: (it.order_index, it.id)):
+        if not item.is_common and item.meal_time in items_by_meal:
+            default_items.setdefault(item.meal_time, item)
+
+    return MenuSnapshot(
+        target_date, diet_kind, version, daily_menu, tuple(meals),
+        required_keys=frozenset(cat.key for meal in meals for cat in meal.categories if cat.has_choices),
+        required_meals=frozenset(meal.code for meal in meals if meal.has_choices),
+        default_items=default_items,
+    )
+
+
+def _build_day(target_date: date, version: uuid.UUID) -> DayMenus:
+    # импорт здесь, чтобы не было циклического импорта menu_calendar <-> menu_cache
+    from .menu_calendar import calendar_menu_ids
+
+    menu_ids = calendar_menu_ids(target_date, version)
+    if not menu_ids:
+        return DayMenus(target_date, version, {}, None)
+
+    # все диеты дня: меню одним запросом, позиции с блюдами — вторым
+    daily_menus = list(DailyMenu.objects.filter(id__in=menu_ids.values()).order_by("id"))
+    items_by_menu = {dm.id: [] for dm in daily_menus}
+    for item in MenuItem.objects.filter(daily_menu__in=daily_menus, is_active=True).select_related("dish"):
+        items_by_menu[item.daily_menu_id].append(item)
+
+    # одно меню может подаваться нескольким диетам (разовая замена в календаре)
+    menus_by_id = {dm.id: dm for dm in daily_menus}
+    snapshots = {
+        diet: _build_snapshot(target_date, version, diet, menus_by_id[dm_id], items_by_menu[dm_id])
+        for diet, dm_id in sorted(menu_ids.items(), key=lambda kv: kv[1])
+        if dm_id in menus_by_id
+    }
+    return DayMenus(
+        target_date,
+        version,
+        snapshots,
+        next(iter(snapshots.values()), None),
+    )
+
+
+def get_day_menus(target_date: date) -> DayMenus:
+    """
+    Меню всех диет на дату. Стоимость при попадании в кэш — один запрос
+    (чтение версии меню), при промахе — ещё три: календарь меню
+    (menu_calendar.py), дневные меню и их позиции.
+    """
+    version = current_menu_version()
+    key = (target_date, version)
+
+    day = _days.get(key)
+    if day is not None:
+        return day
+
+    day = _build_day(target_date, version)
+    with _lock:
+        # меню старых версий больше не понадобятся
+        for old_key in [k for k in _days if k[1] != version]:
+            del _days[old_key]
+        if len(_days) >= MAX_DAYS:
+            _days.clear()
+        _days[key] = day
+    return day
+
+
+def get_menu_snapshot(target_date: date, diet_kind: str) -> MenuSnapshot:
+    """Снимок меню на дату для диеты (см. get_day_menus)."""
+    return get_day_menus(target_date).for_diet(diet_kind)
@@ -0,0 +1,172 @@
+"""
+Календарь меню: дата + вид диеты -> дневное меню (MenuCalendarEntry).
+
+Календарь строится заранее на CALENDAR_WEEKS недель вперёд из чередования
+циклов (rotation.py) и перестраивается при изменении циклов, настроек
+чередования и появлении новых дневных меню (см. signals.py). Страницы
+берут меню на дату одним индексированным запросом; для дат за пределами
+календаря меню вычисляется по чередованию, как раньше.
+
+Разовые замены (праздничное меню, перестановка дней) хранятся в том же
+календаре с is_override=True — перестроение их не трогает.
+
+Функции, меняющие календарь, сами сбрасывают кэш меню (bump_menu_version):
+массовые bulk_create/delete сигналов не посылают.
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .menu_cache import bump_menu_version
+from .models import DIET_TYPE_CHOICES, DailyMenu, MenuCalendarEntry
+from .rotation import cycle_and_day_for_date, cycles_for_range
+
+
+CALENDAR_WEEKS = 8
+
+
+@dataclass
+class CalendarRebuildSummary:
+    date_from: date
+    date_to: date
+    written: int = 0        # записей по чередованию
+    overrides: int = 0      # разовых замен, оставленных как есть
+
+
+def _rotation_menu_ids(date_from: date, date_to: date) -> dict[tuple[date, str], int]:
+    """(дата, диета) -> id дневного меню по чередованию циклов."""
+    cycle_days = cycles_for_range(date_from, date_to)
+    cycle_ids = {cycle.id for cycle, _day in cycle_days.values() if cycle}
+    menu_ids = {
+        (cycle_id, day_index, diet): dm_id
+        for dm_id, cycle_id, day_index, diet in DailyMenu.objects
+        .filter(cycle_id__in=cycle_ids)
+        .values_list("id", "cycle_id", "day_index", "diet_kind")
+    }
+
+    result = {}
+    for day, (cycle, day_index) in cycle_days.items():
+        if not cycle:
+            continue
+        for diet, _label in DIET_TYPE_CHOICES:
+            dm_id = menu_ids.get((cycle.id, day_index, diet))
+            if dm_id:
+                result[(day, diet)] = dm_id
+    return result
+
+
+def rebuild_menu_calendar(date_from: date | None = None, weeks: int = CALENDAR_WEEKS) -> CalendarRebuildSummary:
+    """
+    Перестраивает календарь на weeks недель начиная с date_from (по умолчанию —
+    сегодня). Разовые замены сохраняются. Запросов — константа.
+    """
+    date_from = date_from or timezone.localdate()
+    date_to = date_from + timedelta(days=weeks * 7 - 1)
+    summary = CalendarRebuildSummary(date_from, date_to)
+
+    expected = _rotation_menu_ids(date_from, date_to)
+    with transaction.atomic():
+        in_range = MenuCalendarEntry.objects.filter(date__gte=date_from, date__lte=date_to)
+        overridden = set(in_range.filter(is_override=True).values_list("date", "diet_kind"))
+        in_range.filter(is_override=False).delete()
+        MenuCalendarEntry.objects.bulk_create([
+            MenuCalendarEntry(date=day, diet_kind=diet, daily_menu_id=dm_id)
+            for (day, diet), dm_id in sorted(expected.items())
+            if (day, diet) not in overridden
+        ])
+    bump_menu_version()
+
+    summary.overrides = len(overridden)
+    summary.written = len(expected) - len(overridden & expected.keys())
+    return summary
+
+
+def set_menu_override(target_date: date, diet_kind: str, daily_menu: DailyMenu) -> MenuCalendarEntry:
+    """Разовая замена: в target_date для диеты подаётся daily_menu."""
+    entry, _ = MenuCalendarEntry.objects.update_or_create(
+        date=target_date,
+        diet_kind=diet_kind,
+        defaults={"daily_menu": daily_menu, "is_override": True},
+    )
+    bump_menu_version()
+    return entry
+
+
+def swap_menu_days(date_a: date, date_b: date, diets=None) -> int:
+    """
+    Меняет местами меню двух дат (для указанных диет, по умолчанию всех).
+    Обе даты становятся разовыми заменами. Возвращает число переставленных диет.
+    """
+    diets = list(diets or [code for code, _ in DIET_TYPE_CHOICES])
+    menus_a = calendar_menu_ids(date_a)
+    menus_b = calendar_menu_ids(date_b)
+
+    swapped = 0
+    with transaction.atomic():
+        for diet in diets:
+            dm_a, dm_b = menus_a.get(diet), menus_b.get(diet)
+            if not dm_a or not dm_b:
+                continue  # на одну из дат меню для диеты нет — переставлять нечего
+            for day, dm_id in ((date_a, dm_b), (date_b, dm_a)):
+                MenuCalendarEntry.objects.update_or_create(
+                    date=day, diet_kind=diet, defaults={"daily_menu_id": dm_id, "is_override": True},
+                )
+            swapped += 1
+    bump_menu_version()
+    return swapped
+
+
+def clear_menu_override(target_date: date, diet_kind: str | None = None) -> int:
+    """Отменяет разовые замены на дату: меню снова берётся по чередованию."""
+    overrides = MenuCalendarEntry.objects.filter(date=target_date, is_override=True)
+    if diet_kind:
+        overrides = overrides.filter(diet_kind=diet_kind)
+    cleared = overrides.count()
+    if cleared:
+        with transaction.atomic():
+            overrides.delete()
+            # день уже построен — возвращаем записи по чередованию; иначе
+            # меню на дату и так вычисляется по чередованию (calendar_menu_ids)
+            if MenuCalendarEntry.objects.filter(date=target_date, is_override=False).exists():
+                expected = _rotation_menu_ids(target_date, target_date)
+                MenuCalendarEntry.objects.bulk_create(
+                    [
+                        MenuCalendarEntry(date=day, diet_kind=diet, daily_menu_id=dm_id)
+                        for (day, diet), dm_id in expected.items()
+                        if diet_kind in (None, diet)
+                    ],
+                    ignore_conflicts=True,
+                )
+        bump_menu_version()
+    return cleared
+
+
+def calendar_menu_ids(target_date: date, version=None) -> dict[str, int]:
+    """
+    {диета: id дневного меню} на дату — один запрос по календарю. Если дата
+    ещё не построена (за пределами CALENDAR_WEEKS) — по чередованию циклов,
+    с учётом разовых замен. version — версия меню для кэша чередования.
+    """
+    ids = {}
+    built = False
+    for diet, dm_id, is_override in (
+        MenuCalendarEntry.objects
+        .filter(date=target_date)
+        .values_list("diet_kind", "daily_menu_id", "is_override")
+    ):
+        ids[diet] = dm_id
+        built = built or not is_override
+    if built:
+        return ids
+
+    cycle, day_index = cycle_and_day_for_date(target_date, version)
+    if not cycle:
+        return ids
+    rotation_ids = dict(
+        DailyMenu.objects
+        .filter(cycle=cycle, day_index=day_index)
+        .values_list("diet_kind", "id")
+    )
+    return {**rotation_ids, **ids}
@@ -0,0 +1,359 @@
+"""
+Меню в виде файлов данных (menus/*.csv): загрузка в базу и выгрузка обратно.
+
+Формат — CSV через ";" (в названиях блюд много запятых), одна строка на
+позицию меню:
+
+    cycle;day;diet;meal;category;common;dish;is_diet;proteins;fats;carbs;kcal;output
+    Меню №1;1;P;breakfast;НАПИТКИ;;Нектар фруктовый;1;0.4;0.0;20.6;84.0;200
+
+- day — день цикла (1 — понедельник ... 7 — воскресенье), diet — P/B/BD,
+  meal — breakfast/lunch/dinner;
+- common — 1, если блюдо выдаётся всем (хлеб, чай и т.п.);
+- порядок позиций в разделе — порядок строк в файле;
+- КБЖУ, выход и is_diet — свойства блюда: они повторяются в каждой строке
+  с этим блюдом и во всех файлах должны совпадать (иначе загрузка
+  останавливается со списком расхождений). У блюда, которое уже есть в
+  базе, заполняются только пустые поля, is_diet только повышается (как в
+  прежних скриптах загрузки); блюда, чьи значения в базе расходятся с
+  файлом, перечисляются в отчёте. Пустое значение — "нет данных".
+
+Файлы удобно делить по циклу и диете (menus/menu1_P.csv и т.д.), но
+загрузчику это не важно: строки одного дня могут лежать где угодно.
+Выгрузка (export_menu_rows) пишет тот же формат, так что меню из рабочей
+базы можно сохранить в git и загрузить в другую базу без изменений:
+загрузка и выгрузка тех же файлов дают те же файлы. Свойства блюда
+выгружаются из справочника в каждую строку с ним — правка блюда в базе
+(или расхождение, о котором сообщила загрузка) меняет все эти строки
+во всех файлах.
+"""
+import csv
+import re
+from collections import defaultdict
+from itertools import groupby
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+
+from .menu_cache import bump_menu_version
+from .menu_calendar import rebuild_menu_calendar
+from .menu_sync import DesiredItem, MenuSyncSummary, sync_menu_items
+from .models import DIET_TYPE_CHOICES, MEAL_CHOICES, DailyMenu, Dish, MenuCycle, MenuItem
+from .search import dish_search_text
+from .service_sheets import invalidate_service_sheets
+
+
+MENU_DATA_DIR = Path(settings.BASE_DIR) / "menus"
+MENU_FIELDS = [
+    "cycle", "day", "diet", "meal", "category", "common",
+    "dish", "is_diet", "proteins", "fats", "carbs", "kcal", "output",
+]
+NUTRITION_FIELDS = ("proteins", "fats", "carbs", "kcal")
+DISH_FIELDS = ("is_diet", *NUTRITION_FIELDS, "output")
+CYCLE_DAYS = 7
+
+_DIETS = {code for code, _ in DIET_TYPE_CHOICES}
+_MEALS = {code for code, _ in MEAL_CHOICES}
+_MEAL_ORDER = {code: i for i, (code, _) in enumerate(MEAL_CHOICES)}
+_NOT_NUMBER = re.compile(r"[^0-9.\-]")
+# сколько расхождений показывать в сообщениях
+_CONFLICTS_SHOWN = 20
+
+
+class MenuDataError(Exception):
+    """Ошибка в файле меню (с именем файла и номером строки)."""
+
+
+@dataclass(frozen=True)
+class MenuRow:
+    cycle: str
+    day: int
+    diet: str
+    meal: str
+    category: str
+    is_common: bool
+    dish: str
+    is_diet: bool
+    proteins: Decimal | None
+    fats: Decimal | None
+    carbs: Decimal | None
+    kcal: Decimal | None
+    output: int | None
+
+
+@dataclass
+class MenuImportSummary:
+    cycles_created: int = 0
+    daily_menus: int = 0
+    daily_menus_created: int = 0
+    dishes_created: int = 0
+    dishes_updated: int = 0
+    # блюда, чьи значения в базе отличаются от файла (в базе оставлены как есть)
+    dishes_differing: list[str] = field(default_factory=list)
+    items: MenuSyncSummary = field(default_factory=MenuSyncSummary)
+
+
+def _decimal(value: str) -> Decimal | None:
+    value = _NOT_NUMBER.sub("", value.replace(",", ".")).rstrip(".")
+    return Decimal(value) if value else None
+
+
+def parse_menu_row(record: dict) -> MenuRow:
+    """Строка CSV (dict по MENU_FIELDS) -> MenuRow; ValueError при неверных значениях."""
+    get = lambda name: (record.get(name) or "").strip()  # noqa: E731
+    day, diet, meal = get("day"), get("diet"), get("meal")
+    if not get("cycle") or not get("dish"):
+        raise ValueError("не указан цикл или блюдо")
+    if not day.isdigit() or not 1 <= int(day) <= CYCLE_DAYS:
+        raise ValueError(f"неверный день цикла: {day!r}")
+    if diet not in _DIETS:
+        raise ValueError(f"неизвестная диета: {diet!r}")
+    if meal not in _MEALS:
+        raise ValueError(f"неизвестный приём пищи: {meal!r}")
+    try:
+        nutrition = {name: _decimal(get(name)) for name in NUTRITION_FIELDS}
+    except InvalidOperation:
+        raise ValueError("неверное значение КБЖУ")
+    output = get("output")
+    if output and not output.isdigit():
+        raise ValueError(f"неверный выход: {output!r}")
+    return MenuRow(
+        cycle=get("cycle"),
+        day=int(day),
+        diet=diet,
+        meal=meal,
+        category=get("category"),
+        is_common=get("common") == "1",
+        dish=get("dish"),
+        is_diet=get("is_diet") == "1",
+        output=int(output) if output else None,
+        **nutrition,
+    )
+
+
+def menu_files(paths=None) -> list[Path]:
+    """Файлы меню: указанные (файлы или каталоги) или все menus/*.csv."""
+    result = []
+    for path in map(Path, paths or [MENU_DATA_DIR]):
+        result.extend(sorted(path.glob("*.csv")) if path.is_dir() else [path])
+    return result
+
+
+def _dish_values(row: MenuRow) -> tuple:
+    return tuple(getattr(row, name) for name in DISH_FIELDS)
+
+
+def read_menu_rows(paths=None) -> list[MenuRow]:
+    """
+    Строки всех файлов меню. MenuDataError — при ошибке в строке или если
+    свойства одного блюда (DISH_FIELDS) в разных строках не совпадают.
+    """
+    rows = []
+    first_seen = {}  # блюдо -> (значения, где встретилось впервые)
+    conflicts = []
+    for path in menu_files(paths):
+        with open(path, encoding="utf-8-sig", newline="") as fh:
+            reader = csv.DictReader(fh, delimiter=";")
+            if reader.fieldnames != MENU_FIELDS:
+                raise MenuDataError(f"{path}: ожидались колонки {';'.join(MENU_FIELDS)}")
+            for line_no, record in enumerate(reader, start=2):
+                try:
+                    row = parse_menu_row(record)
+                except ValueError as exc:
+                    raise MenuDataError(f"{path}, строка {line_no}: {exc}")
+                rows.append(row)
+                values = _dish_values(row)
+                seen_values, seen_at = first_seen.setdefault(row.dish, (values, f"{path}, строка {line_no}"))
+                if values != seen_values:
+                    fields = ", ".join(name for name, a, b in zip(DISH_FIELDS, values, seen_values) if a != b)
+                    conflicts.append(f"{path}, строка {line_no}: «{row.dish}» — {fields} не как в {seen_at}")
+
+    if conflicts:
+        shown = "\n".join(conflicts[:_CONFLICTS_SHOWN])
+        more = f"\n... и ещё {len(conflicts) - _CONFLICTS_SHOWN}" if len(conflicts) > _CONFLICTS_SHOWN else ""
+        raise MenuDataError(
+            f"Свойства блюд различаются в разных строках ({len(conflicts)}), "
+            f"у блюда должен быть один набор значений:\n{shown}{more}"
+        )
+    return rows
+
+
+def _resolve_dishes(rows: list[MenuRow], summary: MenuImportSummary) -> dict[str, int]:
+    """
+    Название -> id блюда за один проход: все блюда читаются одним запросом,
+    новые создаются bulk_create, у существующих дополняются пустые поля.
+    Блюда, чьи непустые значения в базе отличаются от файла, попадают
+    в summary.dishes_differing.
+    """
+    dishes = {dish.name: dish for dish in Dish.objects.all()}
+    created, changed, differing = {}, {}, set()
+    for row in rows:
+        dish = dishes.get(row.dish) or created.get(row.dish)
+        if dish is None:
+            dish = created[row.dish] = Dish(name=row.dish)
+        for name in (*NUTRITION_FIELDS, "output"):
+            value, current = getattr(row, name), getattr(dish, name)
+            if current is None and value is not None:
+                setattr(dish, name, value)
+                if dish.pk:
+                    changed[dish.pk] = dish
+            elif value is not None and current != value:
+                differing.add(dish.name)
+        if row.is_diet and not dish.is_diet:
+            dish.is_diet = True
+            if dish.pk:
+                changed[dish.pk] = dish
+        elif dish.is_diet and not row.is_diet:
+            differing.add(dish.name)
+
+    # bulk_create не вызывает Dish.save — строку поиска заполняем сами
+    for dish in created.values():
+        dish.search_text = dish_search_text(dish.name, dish.short_name)
+    Dish.objects.bulk_create(created.values())
+    Dish.objects.bulk_update(changed.values(), [*NUTRITION_FIELDS, "output", "is_diet"])
+    summary.dishes_created = len(created)
+    summary.dishes_updated = len(changed)
+    summary.dishes_differing = sorted(differing)
+
+    ids = {name: dish.pk for name, dish in dishes.items()}
+    ids.update((name, dish.pk) for name, dish in created.items())
+    return ids
+
+
+def _resolve_daily_menus(days, summary: MenuImportSummary) -> dict[tuple[str, int, str], int]:
+    """(цикл, день, диета) -> id дневного меню; недостающие циклы и дни создаются."""
+    cycle_names = {cycle for cycle, _day, _diet in days}
+    cycles = {cycle.name: cycle for cycle in MenuCycle.objects.filter(name__in=cycle_names)}
+    missing = [MenuCycle(name=name, days_count=CYCLE_DAYS) for name in sorted(cycle_names - cycles.keys())]
+    MenuCycle.objects.bulk_create(missing)
+    cycles.update((cycle.name, cycle) for cycle in missing)
+    summary.cycles_created = len(missing)
+
+    cycle_names_by_id = {cycle.id: name for name, cycle in cycles.items()}
+    menus = {
+        (cycle_names_by_id[cycle_id], day, diet): dm_id
+        for dm_id, cycle_id, day, diet in DailyMenu.objects
+        .filter(cycle__in=cycles.values())
+        .values_list("id", "cycle_id", "day_index", "diet_kind")
+    }
+    new_menus = {
+        key: DailyMenu(cycle=cycles[key[0]], day_index=key[1], diet_kind=key[2])
+        for key in sorted(days)
+        if key not in menus
+    }
+    DailyMenu.objects.bulk_create(new_menus.values())
+    menus.update((key, dm.id) for key, dm in new_menus.items())
+    summary.daily_menus = len(days)
+    summary.daily_menus_created = len(new_menus)
+    return menus
+
+
+@transaction.atomic
+def import_menus(rows: list[MenuRow]) -> MenuImportSummary:
+    """
+    Загружает меню одной транзакцией: позиции дней из rows приводятся
+    к файлу по разнице (menu_sync.py), остальные дни не трогаются.
+    Число запросов не зависит от объёма меню.
+    """
+    summary = MenuImportSummary()
+    days = defaultdict(list)
+    for row in rows:
+        days[(row.cycle, row.day, row.diet)].append(row)
+
+    dish_ids = _resolve_dishes(rows, summary)
+    menu_ids = _resolve_daily_menus(days, summary)
+
+    desired = defaultdict(list)
+    for key, day_rows in days.items():
+        order_index = defaultdict(int)
+        for row in day_rows:
+            order_index[(row.meal, row.category)] += 1
+            desired[menu_ids[key]].append(DesiredItem(
+                meal_time=row.meal,
+                category=row.category,
+                dish_id=dish_ids[row.dish],
+                order_index=order_index[(row.meal, row.category)],
+                is_common=row.is_common,
+            ))
+    summary.items = sync_menu_items(desired)
+
+    # bulk-операции сигналов не посылают; повторная загрузка того же меню кэши не сбрасывает
+    if summary.daily_menus_created:
+        rebuild_menu_calendar()
+    if summary.items.changed or summary.dishes_created or summary.dishes_updated:
+        bump_menu_version()
+        invalidate_service_sheets()
+    return summary
+
+
+# ---------- Выгрузка ----------
+
+
+def _day_order(items: list[MenuItem]) -> list[MenuItem]:
+    """Позиции дня в порядке файла: приём пищи, раздел (в порядке появления), порядок в разделе."""
+    first_id = {}
+    for item in items:
+        key = (item.meal_time, item.category)
+        first_id[key] = min(first_id.get(key, item.id), item.id)
+    return sorted(items, key=lambda it: (
+        _MEAL_ORDER.get(it.meal_time, len(_MEAL_ORDER)),
+        first_id[(it.meal_time, it.category)],
+        it.order_index,
+        it.id,
+    ))
+
+
+def export_menu_rows(cycles=None):
+    """
+    (цикл, MenuRow) для всех позиций меню — день за днём (цикл, диета, день).
+    Позиции читаются одним запросом потоком (iterator), в памяти только
+    текущий день. cycles — ограничить этими циклами.
+    """
+    items = (
+        MenuItem.objects
+        .filter(is_active=True)
+        .select_related("dish", "daily_menu__cycle")
+        .order_by("daily_menu__cycle_id", "daily_menu__diet_kind", "daily_menu__day_index", "daily_menu_id")
+    )
+    if cycles is not None:
+        items = items.filter(daily_menu__cycle__in=cycles)
+
+    for _dm_id, day_items in groupby(items.iterator(chunk_size=500), key=lambda it: it.daily_menu_id):
+        for item in _day_order(list(day_items)):
+            daily_menu, dish = item.daily_menu, item.dish
+            yield daily_menu.cycle, MenuRow(
+                cycle=daily_menu.cycle.name,
+                day=daily_menu.day_index,
+                diet=daily_menu.diet_kind,
+                meal=item.meal_time,
+                category=item.category,
+                is_common=item.is_common,
+                dish=dish.name,
+                is_diet=dish.is_diet,
+                proteins=dish.proteins,
+                fats=dish.fats,
+                carbs=dish.carbs,
+                kcal=dish.kcal,
+                output=dish.output,
+            )
+
+
+def menu_row_values(row: MenuRow) -> list[str]:
+    """Строка файла меню для csv.writer (по MENU_FIELDS)."""
+    flag = lambda value: "1" if value else ""  # noqa: E731
+    text = lambda value: "" if value is None else str(value)  # noqa: E731
+    return [
+        row.cycle, str(row.day), row.diet, row.meal, row.category, flag(row.is_common),
+        row.dish, flag(row.is_diet), text(row.proteins), text(row.fats), text(row.carbs),
+        text(row.kcal), text(row.output),
+    ]
+
+
+def menu_csv_writer(fh):
+    """csv.writer в формате файлов меню (";" и "\n", как в menus/*.csv) с уже записанным заголовком."""
+    writer = csv.writer(fh, delimiter=";", lineterminator="\n")
+    writer.writerow(MENU_FIELDS)
+    return writer
@@ -0,0 +1,108 @@
+"""
+Синхронизация позиций меню с желаемым состоянием — по разнице.
+
+Заказы ссылаются на позиции меню (OrderItem.menu_item, on_delete=PROTECT),
+поэтому перезаписать день меню "удалить всё и создать заново" нельзя, пока
+на него есть заказы, а при каждой перезаписи у позиций меняются id.
+Здесь желаемые позиции сопоставляются с сохранёнными по (приём пищи,
+раздел, блюдо):
+
+- совпавшие остаются с прежним id (обновляются порядок и признак "общее",
+  если изменились; снятая ранее позиция возвращается в меню);
+- недостающие создаются;
+- лишние удаляются, кроме тех, на которые есть заказы: они снимаются с
+  меню (is_active=False, порядок 0 — не занимает место в разделе) и
+  попадают в отчёт (retired). Гости их больше не видят, а прошлые
+  заказы и отчёты по ним сохраняются.
+
+Повторная загрузка того же меню ничего не пишет в базу. Запросов —
+несколько массовых на любое число дней.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+
+from .models import MenuItem, OrderItem
+
+
+@dataclass(frozen=True)
+class DesiredItem:
+    meal_time: str
+    category: str
+    dish_id: int
+    order_index: int
+    is_common: bool
+
+
+@dataclass
+class MenuSyncSummary:
+    unchanged: int = 0
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+    retired: int = 0            # лишние позиции с заказами, снятые с меню
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.created or self.updated or self.deleted or self.retired)
+
+
+def sync_menu_items(desired: dict[int, list[DesiredItem]]) -> MenuSyncSummary:
+    """
+    Приводит позиции дневных меню {id дневного меню: желаемые позиции}
+    к желаемому состоянию. Дни, которых нет в desired, не трогаются.
+    Вызывать в транзакции.
+    """
+    summary = MenuSyncSummary()
+    stored = list(MenuItem.objects.filter(daily_menu_id__in=desired).order_by("id"))
+    referenced = set(
+        OrderItem.objects
+        .filter(menu_item_id__in=[item.id for item in stored])
+        .values_list("menu_item_id", flat=True)
+        .distinct()
+    )
+
+    # при повторах одного блюда в разделе первыми сопоставляются позиции с заказами
+    existing = defaultdict(list)
+    for item in sorted(stored, key=lambda it: (it.id not in referenced, it.id)):
+        existing[(item.daily_menu_id, item.meal_time, item.category, item.dish_id)].append(item)
+
+    to_create, to_update = [], []
+    for dm_id, items in desired.items():
+        for want in items:
+            matches = existing.get((dm_id, want.meal_time, want.category, want.dish_id))
+            if not matches:
+                to_create.append(MenuItem(
+                    daily_menu_id=dm_id,
+                    meal_time=want.meal_time,
+                    category=want.category,
+                    dish_id=want.dish_id,
+                    order_index=want.order_index,
+                    is_common=want.is_common,
+                ))
+                continue
+            item = matches.pop(0)
+            if (item.order_index, item.is_common, item.is_active) == (want.order_index, want.is_common, True):
+                summary.unchanged += 1
+                continue
+            item.order_index = want.order_index
+            item.is_common = want.is_common
+            item.is_active = True
+            to_update.append(item)
+
+    stale = [item for items in existing.values() for item in items]
+    to_delete = [item.id for item in stale if item.id not in referenced]
+    to_retire = [item for item in stale if item.id in referenced and item.is_active]
+    for item in to_retire:
+        item.is_active = False
+        item.order_index = 0
+
+    MenuItem.objects.bulk_update(to_update + to_retire, ["order_index", "is_common", "is_active"])
+    MenuItem.objects.bulk_create(to_create)
+    if to_delete:
+        MenuItem.objects.filter(id__in=to_delete).delete()
+
+    summary.created = len(to_create)
+    summary.updated = len(to_update)
+    summary.deleted = len(to_delete)
+    summary.retired = len(to_retire)
+    return summary
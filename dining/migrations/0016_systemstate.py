@@ -0,0 +1,24 @@
+# Generated by Django 6.0 on 2026-10-18 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining', '0015_dish_short_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SystemState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_guest_purge', models.DateField(blank=True, null=True, verbose_name='Дата последней очистки выехавших гостей')),
+            ],
+            options={
+                'verbose_name': 'Служебное состояние',
+                'verbose_name_plural': 'Служебное состояние',
+            },
+        ),
+    ]
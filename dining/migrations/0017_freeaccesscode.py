@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining', '0016_systemstate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FreeAccessCode',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=10, unique=True, verbose_name='Код доступа')),
+                ('position', models.PositiveIntegerField(db_index=True, verbose_name='Позиция в пуле')),
+            ],
+            options={
+                'verbose_name': 'Свободный код доступа',
+                'verbose_name_plural': 'Свободные коды доступа',
+            },
+        ),
+    ]
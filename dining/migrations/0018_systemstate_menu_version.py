@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-18 11:05
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining', '0017_freeaccesscode'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='systemstate',
+            name='menu_version',
+            field=models.UUIDField(default=uuid.uuid4, help_text='Меняется при любом изменении меню — для сброса кэша.', verbose_name='Версия меню'),
+        ),
+    ]
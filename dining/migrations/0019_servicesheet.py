@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining', '0018_systemstate_menu_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ServiceSheet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Дата')),
+                ('kind', models.CharField(choices=[('kitchen', 'Кухня'), ('waiter', 'Официанты')], max_length=10, verbose_name='Вид отчёта')),
+                ('payload', models.JSONField(default=dict, verbose_name='Данные отчёта')),
+                ('version', models.PositiveIntegerField(default=0, verbose_name='Версия данных')),
+                ('built_version', models.PositiveIntegerField(blank=True, null=True, verbose_name='Версия, по которой построен отчёт')),
+                ('built_at', models.DateTimeField(blank=True, null=True, verbose_name='Построен')),
+            ],
+            options={
+                'verbose_name': 'Отчёт для раздачи',
+                'verbose_name_plural': 'Отчёты для раздачи',
+                'unique_together': {('date', 'kind')},
+            },
+        ),
+    ]
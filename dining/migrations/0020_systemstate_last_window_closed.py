@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining', '0019_servicesheet'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='systemstate',
+            name='last_window_closed',
+            field=models.DateField(blank=True, help_text='Для этой даты уже назначено стандартное меню и построены отчёты.', null=True, verbose_name='Последняя дата с закрытым окном выбора меню'),
+        ),
+    ]
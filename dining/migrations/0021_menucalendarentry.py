@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-18 15:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining', '0020_systemstate_last_window_closed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MenuCalendarEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Дата')),
+                ('diet_kind', models.CharField(choices=[('P', 'П (пищевод)'), ('B', 'Б (обычное)'), ('BD', 'БД (диабетическое)')], max_length=10, verbose_name='Вид диеты')),
+                ('is_override', models.BooleanField(default=False, verbose_name='Разовая замена')),
+                ('daily_menu', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='calendar_entries', to='dining.dailymenu', verbose_name='Меню на день')),
+            ],
+            options={
+                'verbose_name': 'День календаря меню',
+                'verbose_name_plural': 'Календарь меню',
+                'unique_together': {('date', 'diet_kind')},
+            },
+        ),
+    ]
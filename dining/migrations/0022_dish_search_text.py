@@ -0,0 +1,47 @@
+# Generated by Django 6.0 on 2026-10-18 16:10
+
+import re
+
+from django.db import migrations, models
+
+
+# копия search.normalize_search / dish_search_text на момент миграции:
+# последующие изменения нормализации не должны менять эту миграцию
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def _normalize(value):
+    value = (value or "").casefold().replace("ё", "е")
+    return " ".join(_NON_WORD.sub(" ", value).split())
+
+
+def dish_search_text(name, short_name=""):
+    parts = [_normalize(name)]
+    short = _normalize(short_name)
+    if short and short != parts[0]:
+        parts.append(short)
+    return " | ".join(parts)
+
+
+def fill_search_text(apps, schema_editor):
+    Dish = apps.get_model("dining", "Dish")
+    dishes = list(Dish.objects.only("id", "name", "short_name"))
+    for dish in dishes:
+        dish.search_text = dish_search_text(dish.name, dish.short_name)
+    Dish.objects.bulk_update(dishes, ["search_text"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining', '0021_menucalendarentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dish',
+            name='search_text',
+            field=models.CharField(blank=True, editable=False, max_length=310),
+        ),
+        migrations.RunPython(fill_search_text, migrations.RunPython.noop),
+    ]
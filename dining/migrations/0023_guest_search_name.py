@@ -0,0 +1,39 @@
+# Generated by Django 6.0 on 2026-10-18 16:45
+
+import re
+
+from django.db import migrations, models
+
+
+# копия search.normalize_search на момент миграции:
+# последующие изменения нормализации не должны менять эту миграцию
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize_search(value):
+    value = (value or "").casefold().replace("ё", "е")
+    return " ".join(_NON_WORD.sub(" ", value).split())
+
+
+def fill_search_name(apps, schema_editor):
+    Guest = apps.get_model("dining", "Guest")
+    guests = list(Guest.objects.only("id", "full_name"))
+    for guest in guests:
+        guest.search_name = normalize_search(guest.full_name)
+    Guest.objects.bulk_update(guests, ["search_name"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining', '0022_dish_search_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='guest',
+            name='search_name',
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.RunPython(fill_search_name, migrations.RunPython.noop),
+    ]
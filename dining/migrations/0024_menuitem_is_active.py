@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-18 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining', '0023_guest_search_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='menuitem',
+            name='is_active',
+            field=models.BooleanField(default=True, verbose_name='В меню'),
+        ),
+    ]
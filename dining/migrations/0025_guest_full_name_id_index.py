@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-18 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining', '0024_menuitem_is_active'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='guest',
+            index=models.Index(fields=['full_name', 'id'], name='guest_full_name_id'),
+        ),
+    ]
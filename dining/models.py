@@ -1,5 +1,6 @@
 from django.db import models
 
+import uuid
 from datetime import date
 
 
@@ -86,13 +87,28 @@ class Guest(models.Model):
         help_text="Разрешить ужин в последний день пребывания"
     )
 
+    # нормализованное ФИО — для поиска (см. search.py); ищется подстрокой
+    # (LIKE '%…%'), B-tree индекс для этого не используется
+    search_name = models.CharField(max_length=200, blank=True, editable=False)
+
     class Meta:
         verbose_name = "Отдыхающий"
         verbose_name_plural = "Отдыхающие"
+        # список гостей листается по (ФИО, id) — см. guest_list_view
+        indexes = [models.Index(fields=["full_name", "id"], name="guest_full_name_id")]
 
     def __str__(self):        
         return self.full_name
 
+    def save(self, *args, **kwargs):
+        from .search import normalize_search
+
+        self.search_name = normalize_search(self.full_name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "full_name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "search_name"}
+        super().save(*args, **kwargs)
+
 
 class SeatAssignment(models.Model):
     guest = models.ForeignKey(
@@ -151,6 +167,10 @@ class Dish(models.Model):
         null=True, blank=True, verbose_name="Выход, г"
     )
 
+    # нормализованные название и название для кухни — для поиска (см. search.py);
+    # ищется подстрокой (LIKE '%…%'), B-tree индекс для этого не используется
+    search_text = models.CharField(max_length=310, blank=True, editable=False)
+
     class Meta:
         verbose_name = "Блюдо"
         verbose_name_plural = "Блюда"
@@ -158,6 +178,15 @@ class Dish(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        from .search import dish_search_text
+
+        self.search_text = dish_search_text(self.name, self.short_name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"name", "short_name"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "search_text"}
+        super().save(*args, **kwargs)
+
 class MenuCycle(models.Model):
     """
     Цикл меню — например, Меню №1 (7 дней), Меню №2 (7 дней)
@@ -226,6 +255,9 @@ class MenuItem(models.Model):
         default=False,
         verbose_name="Общее блюдо (выдаётся всем)",
     )
+    # снятая с меню позиция, на которую есть прошлые заказы (см. menu_sync.py):
+    # удалить её нельзя, поэтому она скрыта из меню гостей, отчётов по меню и выгрузки
+    is_active = models.BooleanField(default=True, verbose_name="В меню")
 
     class Meta:
         ordering = ["meal_time", "order_index", "-id"]
@@ -236,6 +268,30 @@ class MenuItem(models.Model):
         return f"{self.get_meal_time_display()}: {self.dish.name}"
 
 
+class MenuCalendarEntry(models.Model):
+    """
+    Календарь меню: какое дневное меню подаётся в дату для вида диеты.
+    Строится заранее из чередования циклов (см. menu_calendar.py);
+    is_override — разовая замена (праздничное меню, перестановка дней),
+    которую перестроение календаря не трогает.
+    """
+
+    date = models.DateField(verbose_name="Дата")
+    diet_kind = models.CharField(max_length=10, choices=DIET_TYPE_CHOICES, verbose_name="Вид диеты")
+    daily_menu = models.ForeignKey(
+        DailyMenu, on_delete=models.CASCADE, related_name="calendar_entries", verbose_name="Меню на день"
+    )
+    is_override = models.BooleanField(default=False, verbose_name="Разовая замена")
+
+    class Meta:
+        unique_together = ("date", "diet_kind")
+        verbose_name = "День календаря меню"
+        verbose_name_plural = "Календарь меню"
+
+    def __str__(self):
+        return f"{self.date} ({self.get_diet_kind_display()}): {self.daily_menu}"
+
+
 # ---------- Заказы гостей ----------
 
 
@@ -337,4 +393,88 @@ class MenuRotationConfig(models.Model):
         verbose_name_plural = "Настройки чередования меню"
 
     def __str__(self):
-        return "Настройки чередования меню"
\ No newline at end of file
+        return "Настройки чередования меню"
+
+class SystemState(models.Model):
+    """
+    Служебное состояние системы (фоновые задачи и т.п.).
+    Ожидаем одну запись (singleton).
+    """
+    last_guest_purge = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name="Дата последней очистки выехавших гостей",
+    )
+    menu_version = models.UUIDField(
+        default=uuid.uuid4,
+        verbose_name="Версия меню",
+        help_text="Меняется при любом изменении меню — для сброса кэша.",
+    )
+    last_window_closed = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name="Последняя дата с закрытым окном выбора меню",
+        help_text="Для этой даты уже назначено стандартное меню и построены отчёты.",
+    )
+
+    class Meta:
+        verbose_name = "Служебное состояние"
+        verbose_name_plural = "Служебное состояние"
+
+    def __str__(self):
+        return "Служебное состояние"
+
+
+class FreeAccessCode(models.Model):
+    """
+    Пул свободных кодов доступа гостей.
+    Коды хранятся в перемешанном порядке (position), выдаётся код
+    с наименьшим position, при выезде гостя код возвращается в пул.
+    """
+    code = models.CharField(max_length=10, unique=True, verbose_name="Код доступа")
+    position = models.PositiveIntegerField(db_index=True, verbose_name="Позиция в пуле")
+
+    class Meta:
+        verbose_name = "Свободный код доступа"
+        verbose_name_plural = "Свободные коды доступа"
+
+    def __str__(self):
+        return self.code
+
+
+class ServiceSheet(models.Model):
+    """
+    Готовый ("замороженный") отчёт для раздачи на дату: сводка для кухни
+    или раскладка для официантов. Строится после закрытия окна выбора меню
+    и отдаётся одним чтением. Любое изменение заказов, посадок или блюд
+    увеличивает version; отчёт актуален, пока built_version == version.
+    """
+    KIND_KITCHEN = "kitchen"
+    KIND_WAITER = "waiter"
+    KIND_CHOICES = [
+        (KIND_KITCHEN, "Кухня"),
+        (KIND_WAITER, "Официанты"),
+    ]
+
+    date = models.DateField(verbose_name="Дата")
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, verbose_name="Вид отчёта")
+    payload = models.JSONField(default=dict, verbose_name="Данные отчёта")
+    version = models.PositiveIntegerField(default=0, verbose_name="Версия данных")
+    built_version = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name="Версия, по которой построен отчёт",
+    )
+    built_at = models.DateTimeField(null=True, blank=True, verbose_name="Построен")
+
+    class Meta:
+        unique_together = ("date", "kind")
+        verbose_name = "Отчёт для раздачи"
+        verbose_name_plural = "Отчёты для раздачи"
+
+    def __str__(self):
+        return f"{self.get_kind_display()} — {self.date}"
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.built_version == self.version
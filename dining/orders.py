@@ -0,0 +1,132 @@
+"""
+Запись заказов гостей.
+
+Все изменения заказов на дату (выбор гостя на весь день, массовое
+назначение меню диетсестрой) проходят через save_orders: одна транзакция
+и фиксированное число запросов независимо от количества гостей и приёмов
+пищи. Приёмы пищи, выбор в которых не изменился, не трогаем.
+"""
+from dataclasses import dataclass
+from datetime import date
+
+from django.db import transaction
+
+from .models import Order, OrderItem
+from .service_sheets import invalidate_service_sheets
+
+
+@dataclass
+class OrdersWriteSummary:
+    created_orders: int = 0     # новых заказов (guest, meal_time)
+    updated_orders: int = 0     # заказов, у которых заменили позиции
+    deleted_orders: int = 0     # удалённых заказов (выбор очищен)
+    items_written: int = 0      # записано позиций заказов (OrderItem)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.created_orders or self.updated_orders or self.deleted_orders)
+
+
+def save_orders(
+    target_date: date,
+    selections: dict[tuple[int, str], list[int]],
+    keep_existing: bool = False,
+) -> OrdersWriteSummary:
+    """
+    Приводит заказы на target_date к указанному выбору.
+
+    selections: (guest_id, meal_time) -> список menu_item_id.
+    Пустой список означает "заказа на этот приём пищи нет" — заказ удаляется.
+    Пары (guest_id, meal_time), которых нет в selections, не трогаем.
+    keep_existing=True: заказы, в которых уже есть позиции, тоже не трогаем
+    (массовое назначение не перетирает выбор, сделанный гостем).
+
+    Запросы: 1 чтение текущих заказов + не более 6 записей
+    (удаление позиций, удаление заказов, создание заказов и позиций,
+    отметка устаревших отчётов ServiceSheet).
+    """
+    summary = OrdersWriteSummary()
+    if not selections:
+        return summary
+
+    guest_ids = {guest_id for guest_id, _meal in selections}
+    meal_times = {meal for _guest_id, meal in selections}
+
+    with transaction.atomic():
+        # текущие заказы и их позиции одним запросом (LEFT JOIN)
+        existing_order_id: dict[tuple[int, str], int] = {}
+        existing_items: dict[tuple[int, str], list[int]] = {}
+        rows = (
+            Order.objects
+            .filter(date=target_date, guest_id__in=guest_ids, meal_time__in=meal_times)
+            .values_list("id", "guest_id", "meal_time", "items__menu_item_id")
+        )
+        for order_id, guest_id, meal_time, menu_item_id in rows:
+            key = (guest_id, meal_time)
+            existing_order_id[key] = order_id
+            items = existing_items.setdefault(key, [])
+            if menu_item_id is not None:
+                items.append(menu_item_id)
+
+        orders_to_delete: list[int] = []
+        orders_to_refill: list[int] = []
+        new_items: list[OrderItem] = []
+        new_orders: list[tuple[Order, list[int]]] = []
+
+        for key, menu_item_ids in selections.items():
+            order_id = existing_order_id.get(key)
+            ids = list(menu_item_ids)
+
+            if keep_existing and existing_items.get(key):
+                continue
+
+            if not ids:
+                if order_id is not None:
+                    orders_to_delete.append(order_id)
+                continue
+
+            if order_id is None:
+                guest_id, meal_time = key
+                new_orders.append(
+                    (Order(guest_id=guest_id, date=target_date, meal_time=meal_time), ids)
+                )
+                continue
+
+            if sorted(existing_items.get(key, [])) == sorted(ids):
+                continue  # выбор не изменился
+
+            orders_to_refill.append(order_id)
+            new_items.extend(OrderItem(order_id=order_id, menu_item_id=mid) for mid in ids)
+
+        if orders_to_refill or orders_to_delete:
+            OrderItem.objects.filter(order_id__in=orders_to_refill + orders_to_delete).delete()
+        if orders_to_delete:
+            Order.objects.filter(id__in=orders_to_delete).delete()
+
+        if new_orders:
+            created = Order.objects.bulk_create([order for order, _ids in new_orders])
+            if any(order.pk is None for order in created):
+                # старый SQLite не возвращает id из bulk_create — дочитываем
+                ids_by_key = {
+                    (guest_id, meal_time): order_id
+                    for order_id, guest_id, meal_time in Order.objects
+                    .filter(date=target_date, guest_id__in=guest_ids, meal_time__in=meal_times)
+                    .values_list("id", "guest_id", "meal_time")
+                }
+                for order in created:
+                    order.pk = ids_by_key[(order.guest_id, order.meal_time)]
+            for order, ids in new_orders:
+                new_items.extend(OrderItem(order_id=order.pk, menu_item_id=mid) for mid in ids)
+
+        if new_items:
+            OrderItem.objects.bulk_create(new_items)
+
+        if orders_to_refill or orders_to_delete or new_orders:
+            # готовые отчёты на эту дату (если уже построены) устарели
+            invalidate_service_sheets([target_date])
+
+    summary.created_orders = len(new_orders)
+    summary.updated_orders = len(orders_to_refill)
+    summary.deleted_orders = len(orders_to_delete)
+    summary.items_written = len(new_items)
+    return summary
@@ -0,0 +1,86 @@
+"""
+Вспомогательные средства для нагрузочных тестов и бенчмарков:
+временная база, "замороженное" время и подсчёт SQL-запросов.
+
+Все замеры идут на отдельной временной SQLite-базе (рабочая db.sqlite3
+не затрагивается) — так же, как это делает тестовый раннер Django.
+"""
+import math
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from unittest import mock
+
+from django.db import connection
+from django.utils import timezone
+
+
+@contextmanager
+def temporary_database(verbosity: int = 0):
+    """
+    Создаёт временную SQLite-базу в файле (с миграциями) и переключает
+    на неё соединение default. Файл нужен, чтобы несколько потоков
+    работали с одной базой и получали настоящие блокировки SQLite.
+    """
+    tmpdir = tempfile.mkdtemp(prefix="sanatorium-perf-")
+    connection.settings_dict.setdefault("TEST", {})
+    old_test_name = connection.settings_dict["TEST"].get("NAME")
+    connection.settings_dict["TEST"]["NAME"] = os.path.join(tmpdir, "perf.sqlite3")
+
+    old_name = connection.creation.create_test_db(
+        verbosity=verbosity,
+        autoclobber=True,
+        serialize=False,
+    )
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=verbosity)
+        connection.settings_dict["TEST"]["NAME"] = old_test_name
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+@contextmanager
+def frozen_localtime(now: datetime):
+    """
+    Подменяет timezone.localtime() без аргументов на фиксированный момент,
+    чтобы окно выбора меню (get_active_menu_target) было открыто
+    независимо от того, когда запускается тест.
+    """
+    if timezone.is_naive(now):
+        now = timezone.make_aware(now)
+    real_localtime = timezone.localtime
+
+    def _localtime(value=None, timezone_=None):
+        return real_localtime(now if value is None else value, timezone_)
+
+    with mock.patch.object(timezone, "localtime", _localtime):
+        yield
+
+
+class QueryCounter:
+    """Считает SQL-запросы текущего потока (connection.execute_wrapper)."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+    @contextmanager
+    def capture(self):
+        self.count = 0
+        with connection.execute_wrapper(self):
+            yield self
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Перцентиль (nearest-rank) для списка значений."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
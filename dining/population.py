@@ -0,0 +1,451 @@
+"""
+Синтетические данные для нагрузочных тестов и бенчмарков:
+меню на все дни циклов, гости с посадками за столы и их заказы.
+
+seed_guests/seed_orders — простой вариант (все гости живут одни и те же
+даты, заказы на одну дату), seed_population — "живой" санаторий: гости
+с разными сроками заезда и выезда, места за столами освобождаются и
+занимаются снова, заказы на каждый день диапазона.
+
+Всё создаётся через bulk_create и детерминировано через seed
+(кроме кодов доступа — они выдаются из пула, см. access_codes).
+"""
+import heapq
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from django.db.models import Max
+
+from .access_codes import reserved_access_codes
+from .menu_cache import get_menu_snapshot
+from .menu_calendar import rebuild_menu_calendar
+from .models import (
+    DIET_TYPE_CHOICES,
+    DailyMenu,
+    DiningTable,
+    Dish,
+    Guest,
+    MEAL_CHOICES,
+    MenuCycle,
+    MenuItem,
+    Order,
+    OrderItem,
+    SeatAssignment,
+)
+from .orders import save_orders
+from .rotation import invalidate_rotation_cache
+from .search import dish_search_text, normalize_search
+from .service_sheets import invalidate_service_sheets
+
+
+PLACES_PER_TABLE = 4
+
+# Раздел -> (сколько блюд, общее ли блюдо) для каждого приёма пищи
+SYNTHETIC_MENU_LAYOUT = {
+    "breakfast": [("НАПИТКИ", 3, False), ("ЗАКУСКИ", 4, False), ("2-е БЛЮДА", 5, False), ("ДОПОЛНИТЕЛЬНО", 4, True)],
+    "lunch": [("ЗАКУСКИ", 3, False), ("1-е БЛЮДА", 2, False), ("2-е БЛЮДА", 4, False), ("ДОПОЛНИТЕЛЬНО", 3, True)],
+    "dinner": [("ЗАКУСКИ", 3, False), ("2-е БЛЮДА", 4, False), ("ДОПОЛНИТЕЛЬНО", 3, True), ("НАПИТКИ", 2, False)],
+}
+
+# Распределение диет: Б чаще остальных
+DIET_WEIGHTS = {"B": 2, "P": 1, "BD": 1}
+
+# Имена для seed_population (женская фамилия — с окончанием "а")
+MALE_NAMES = [
+    "Александр", "Сергей", "Владимир", "Андрей", "Алексей", "Николай", "Дмитрий", "Иван",
+    "Михаил", "Евгений", "Юрий", "Валерий", "Виктор", "Игорь", "Анатолий", "Олег", "Павел",
+]
+FEMALE_NAMES = [
+    "Елена", "Татьяна", "Наталья", "Ольга", "Светлана", "Ирина", "Людмила", "Галина",
+    "Екатерина", "Анна", "Валентина", "Мария", "Нина", "Любовь", "Надежда", "Марина",
+]
+SURNAMES = [
+    "Иванов", "Смирнов", "Кузнецов", "Попов", "Васильев", "Петров", "Соколов", "Михайлов",
+    "Новиков", "Федоров", "Морозов", "Волков", "Алексеев", "Лебедев", "Семенов", "Егоров",
+    "Павлов", "Козлов", "Степанов", "Николаев", "Орлов", "Андреев", "Макаров", "Никитин",
+    "Захаров", "Зайцев", "Соловьев", "Борисов", "Яковлев", "Григорьев", "Романов", "Воробьев",
+]
+
+# Срок путёвки (дней, включая день выезда) -> вес: чаще всего 10-14 дней
+STAY_LENGTH_WEIGHTS = {7: 2, 10: 3, 12: 2, 14: 4, 18: 1, 21: 2}
+
+# Доли гостей с полдником и с платными обедом/ужином в день выезда
+SNACK_SHARE = 0.15
+DEPARTURE_LUNCH_SHARE = 0.3
+DEPARTURE_DINNER_SHARE = 0.1
+
+
+@dataclass
+class SeededGuest:
+    id: int
+    access_code: str
+    diet_kind: str
+    table_number: int
+    place_number: int
+
+
+def seed_menus(rng: random.Random | None = None) -> int:
+    """
+    Создаёт два 7-дневных цикла (если их нет) и синтетическое меню
+    на каждый день для каждой диеты. Уже существующие DailyMenu не трогаем.
+    Возвращает число созданных позиций меню.
+    """
+    rng = rng or random.Random(0)
+
+    cycles = list(MenuCycle.objects.order_by("id"))
+    if not cycles:
+        MenuCycle.objects.bulk_create([
+            MenuCycle(name="Меню №1", days_count=7),
+            MenuCycle(name="Меню №2", days_count=7),
+        ])
+        cycles = list(MenuCycle.objects.order_by("id"))
+        # bulk_create не посылает сигналов — чередование сбрасываем сами
+        invalidate_rotation_cache()
+
+    existing = set(DailyMenu.objects.values_list("cycle_id", "day_index", "diet_kind"))
+    to_create = [
+        DailyMenu(cycle=cycle, day_index=day_index, diet_kind=diet_code)
+        for cycle in cycles
+        for day_index in range(1, cycle.days_count + 1)
+        for diet_code, _label in DIET_TYPE_CHOICES
+        if (cycle.id, day_index, diet_code) not in existing
+    ]
+    if not to_create:
+        return 0
+    DailyMenu.objects.bulk_create(to_create)
+    # новые меню на день закрывают клетки календаря (и сбрасывают кэш меню)
+    rebuild_menu_calendar()
+
+    keys = {(dm.cycle_id, dm.day_index, dm.diet_kind) for dm in to_create}
+    daily_menus = [
+        dm for dm in DailyMenu.objects.all()
+        if (dm.cycle_id, dm.day_index, dm.diet_kind) in keys
+    ]
+
+    # справочник блюд: на каждый раздел — небольшой пул, из которого берём блюда
+    pool_size = 12
+    dish_names = [
+        f"Синт. {meal} {category.lower()} №{n}"
+        for meal, layout in SYNTHETIC_MENU_LAYOUT.items()
+        for category, _count, _common in layout
+        for n in range(1, pool_size + 1)
+    ]
+    known = set(Dish.objects.filter(name__in=dish_names).values_list("name", flat=True))
+    Dish.objects.bulk_create([
+        # bulk_create не вызывает Dish.save — строку поиска задаём сами
+        Dish(name=name, output=rng.choice([100, 150, 200, 250, 300]), search_text=dish_search_text(name))
+        for name in dish_names
+        if name not in known
+    ])
+    dish_id_by_name = dict(Dish.objects.filter(name__in=dish_names).values_list("name", "id"))
+
+    items = []
+    for dm in daily_menus:
+        for meal, layout in SYNTHETIC_MENU_LAYOUT.items():
+            for category, count, is_common in layout:
+                numbers = rng.sample(range(1, pool_size + 1), count)
+                for order_index, n in enumerate(numbers, start=1):
+                    items.append(MenuItem(
+                        daily_menu=dm,
+                        meal_time=meal,
+                        category=category,
+                        dish_id=dish_id_by_name[f"Синт. {meal} {category.lower()} №{n}"],
+                        order_index=order_index,
+                        is_common=is_common,
+                    ))
+    MenuItem.objects.bulk_create(items, batch_size=1000)
+    return len(items)
+
+
+def seed_guests(
+    count: int,
+    start_date: date,
+    end_date: date,
+    rng: random.Random | None = None,
+    name_prefix: str = "Нагрузка",
+) -> list[SeededGuest]:
+    """
+    Создаёт count гостей, проживающих с start_date по end_date,
+    и рассаживает их по порядку: стол 1 места 1-4, стол 2 ...
+    """
+    rng = rng or random.Random(0)
+    if count <= 0:
+        return []
+
+    tables_needed = (count + PLACES_PER_TABLE - 1) // PLACES_PER_TABLE
+    existing_tables = set(DiningTable.objects.values_list("number", flat=True))
+    DiningTable.objects.bulk_create([
+        DiningTable(number=n, places_count=PLACES_PER_TABLE)
+        for n in range(1, tables_needed + 1)
+        if n not in existing_tables
+    ])
+    table_id_by_number = dict(DiningTable.objects.values_list("number", "id"))
+
+    diets = [code for code, weight in DIET_WEIGHTS.items() for _ in range(weight)]
+    with reserved_access_codes(count) as codes:
+        guests = [
+            Guest(
+                full_name=f"{name_prefix} {i + 1:05d}",
+                search_name=normalize_search(f"{name_prefix} {i + 1:05d}"),
+                start_date=start_date,
+                end_date=end_date,
+                access_code=codes[i],
+                diet_kind=rng.choice(diets),
+            )
+            for i in range(count)
+        ]
+        Guest.objects.bulk_create(guests, batch_size=1000)
+    guest_ids = dict(
+        Guest.objects.filter(access_code__in=codes).values_list("access_code", "id")
+    )
+
+    seeded = []
+    seats = []
+    for i, guest in enumerate(guests):
+        table_number = i // PLACES_PER_TABLE + 1
+        place_number = i % PLACES_PER_TABLE + 1
+        guest_id = guest_ids[guest.access_code]
+        seats.append(SeatAssignment(
+            guest_id=guest_id,
+            table_id=table_id_by_number[table_number],
+            place_number=place_number,
+            start_date=start_date,
+            end_date=end_date,
+        ))
+        seeded.append(SeededGuest(
+            id=guest_id,
+            access_code=guest.access_code,
+            diet_kind=guest.diet_kind,
+            table_number=table_number,
+            place_number=place_number,
+        ))
+    SeatAssignment.objects.bulk_create(seats, batch_size=1000)
+    return seeded
+
+
+def seed_orders(
+    guests: list[SeededGuest],
+    target_date: date,
+    rng: random.Random | None = None,
+) -> int:
+    """
+    Заказы гостей на target_date: в каждом разделе с выбором — случайное
+    блюдо, общие блюда — все. Возвращает число записанных позиций.
+    """
+    rng = rng or random.Random(0)
+    snapshots = {
+        diet: get_menu_snapshot(target_date, diet)
+        for diet in {g.diet_kind for g in guests}
+    }
+
+    selections = {}
+    for guest in guests:
+        meals = {meal.code: meal for meal in snapshots[guest.diet_kind].meals}
+        for meal_code, _label in MEAL_CHOICES:
+            meal = meals.get(meal_code)
+            ids = []
+            for cat in (meal.categories if meal else ()):
+                choices = [item.id for item in cat.items if not item.is_common]
+                ids.extend(item.id for item in cat.items if item.is_common)
+                if choices:
+                    ids.append(rng.choice(choices))
+            selections[(guest.id, meal_code)] = ids
+    return save_orders(target_date, selections).items_written
+
+
+def first_choice_post_data(target_date: date, diet_kind: str) -> dict[str, str]:
+    """Данные формы меню: первое выборное блюдо в каждом разделе с выбором."""
+    snapshot = get_menu_snapshot(target_date, diet_kind)
+    data = {}
+    for meal in snapshot.meals:
+        for cat in meal.categories:
+            for item in cat.items:
+                if not item.is_common:
+                    data[cat.key] = str(item.id)
+                    break
+    return data
+
+
+@dataclass
+class PopulationSummary:
+    date_from: date
+    date_to: date
+    guests: int = 0
+    tables: int = 0             # новых столов
+    seats: int = 0
+    orders: int = 0
+    order_items: int = 0
+    guests_by_diet: dict[str, int] = field(default_factory=dict)
+
+
+def random_full_name(rng: random.Random) -> str:
+    """Случайное ФИО вида "Иванова Елена"."""
+    surname = rng.choice(SURNAMES)
+    if rng.random() < 0.5:
+        return f"{surname} {rng.choice(MALE_NAMES)}"
+    return f"{surname}а {rng.choice(FEMALE_NAMES)}"
+
+
+def _seat_stays(stays: list[tuple[date, date]], first_table: int) -> list[tuple[int, int]]:
+    """
+    (номер стола, место) для каждого пребывания (заезд, выезд): место
+    освобождается на следующий день после выезда и отдаётся следующему
+    заехавшему; новые столы открываются, только когда свободных мест нет.
+    """
+    seats: list[tuple[int, int] | None] = [None] * len(stays)
+    free = []       # куча (с какой даты место свободно, стол, место)
+    opened = 0
+    for idx in sorted(range(len(stays)), key=lambda i: (stays[i][0], i)):
+        start, end = stays[idx]
+        if free and free[0][0] <= start:
+            _free_from, table_number, place_number = heapq.heappop(free)
+        else:
+            table_number = first_table + opened // PLACES_PER_TABLE
+            place_number = opened % PLACES_PER_TABLE + 1
+            opened += 1
+        seats[idx] = (table_number, place_number)
+        heapq.heappush(free, (end + timedelta(days=1), table_number, place_number))
+    return seats
+
+
+def seed_population(
+    count: int,
+    date_from: date,
+    days: int,
+    rng: random.Random | None = None,
+    missing_share: float = 0.1,
+    with_orders: bool = True,
+) -> PopulationSummary:
+    """
+    Создаёт count гостей, чьё пребывание пересекается с датами
+    date_from .. date_from + days - 1: срок путёвки — по
+    STAY_LENGTH_WEIGHTS, заезд — в случайный день, диета — по DIET_WEIGHTS.
+    Гости рассаживаются за новые столы (номера после существующих),
+    освободившиеся места занимают следующие заехавшие.
+
+    with_orders: заказы на каждый день диапазона, где есть меню, на все
+    разрешённые гостю приёмы пищи (views.allowed_meals_for_guest_on_date),
+    по случайному блюду в каждом разделе с выбором; доля missing_share
+    приёмов пищи остаётся невыбранной.
+    Вызывать в транзакции.
+    """
+    from .views import allowed_meals_for_guest_on_date
+
+    rng = rng or random.Random(0)
+    days = max(1, days)
+    summary = PopulationSummary(date_from=date_from, date_to=date_from + timedelta(days=days - 1))
+    if count <= 0:
+        return summary
+
+    diets = [code for code, weight in DIET_WEIGHTS.items() for _ in range(weight)]
+    lengths = list(STAY_LENGTH_WEIGHTS)
+    length_weights = list(STAY_LENGTH_WEIGHTS.values())
+
+    stays = []
+    for _ in range(count):
+        length = rng.choices(lengths, length_weights)[0]
+        start = date_from + timedelta(days=rng.randrange(1 - length, days))
+        stays.append((start, start + timedelta(days=length - 1)))
+
+    first_table = (DiningTable.objects.aggregate(last=Max("number"))["last"] or 0) + 1
+    seats = _seat_stays(stays, first_table)
+    table_numbers = sorted({table_number for table_number, _place in seats})
+    DiningTable.objects.bulk_create([
+        DiningTable(number=n, places_count=PLACES_PER_TABLE) for n in table_numbers
+    ])
+    table_id_by_number = dict(
+        DiningTable.objects.filter(number__in=table_numbers).values_list("number", "id")
+    )
+
+    guests = []
+    with reserved_access_codes(count) as codes:
+        for i, (start, end) in enumerate(stays):
+            full_name = random_full_name(rng)
+            guests.append(Guest(
+                full_name=full_name,
+                search_name=normalize_search(full_name),
+                start_date=start,
+                end_date=end,
+                access_code=codes[i],
+                diet_kind=rng.choice(diets),
+                snack_allowed=rng.random() < SNACK_SHARE,
+                departure_lunch=rng.random() < DEPARTURE_LUNCH_SHARE,
+                departure_dinner=rng.random() < DEPARTURE_DINNER_SHARE,
+            ))
+        Guest.objects.bulk_create(guests, batch_size=1000)
+    guest_ids = dict(Guest.objects.filter(access_code__in=codes).values_list("access_code", "id"))
+    for guest in guests:
+        guest.pk = guest_ids[guest.access_code]
+
+    SeatAssignment.objects.bulk_create([
+        SeatAssignment(
+            guest_id=guest.pk,
+            table_id=table_id_by_number[table_number],
+            place_number=place_number,
+            start_date=guest.start_date,
+            end_date=guest.end_date,
+        )
+        for guest, (table_number, place_number) in zip(guests, seats)
+    ], batch_size=1000)
+
+    summary.guests = count
+    summary.tables = len(table_numbers)
+    summary.seats = count
+    for guest in guests:
+        summary.guests_by_diet[guest.diet_kind] = summary.guests_by_diet.get(guest.diet_kind, 0) + 1
+    if not with_orders:
+        return summary
+
+    # заказы как из формы гостя: по одному блюду в каждом разделе с выбором
+    # (общие блюда в заказ не попадают); гости новые — старых заказов нет,
+    # поэтому пишем сразу bulk_create за весь диапазон
+    orders: list[tuple[Order, list[int]]] = []
+    for offset in range(days):
+        target_date = date_from + timedelta(days=offset)
+        present = [g for g in guests if g.start_date <= target_date <= g.end_date]
+        choices_by_diet = {}
+        for diet in {g.diet_kind for g in present}:
+            snapshot = get_menu_snapshot(target_date, diet)
+            choices_by_diet[diet] = {
+                meal.code: [
+                    [item.id for item in cat.items if not item.is_common]
+                    for cat in meal.categories
+                    if cat.has_choices
+                ]
+                for meal in snapshot.meals
+            }
+        for guest in present:
+            meals = choices_by_diet[guest.diet_kind]
+            allowed = allowed_meals_for_guest_on_date(guest, target_date)
+            for meal_code, _label in MEAL_CHOICES:
+                categories = meals.get(meal_code)
+                if not categories or not allowed.get(meal_code) or rng.random() < missing_share:
+                    continue
+                orders.append((
+                    Order(guest_id=guest.pk, date=target_date, meal_time=meal_code),
+                    [rng.choice(ids) for ids in categories],
+                ))
+
+    created = Order.objects.bulk_create([order for order, _ids in orders], batch_size=1000)
+    if any(order.pk is None for order in created):
+        # старый SQLite не возвращает id из bulk_create — дочитываем
+        ids_by_key = {
+            (guest_id, order_date, meal_time): order_id
+            for order_id, guest_id, order_date, meal_time in Order.objects
+            .filter(guest_id__in=guest_ids.values())
+            .values_list("id", "guest_id", "date", "meal_time")
+        }
+        for order in created:
+            order.pk = ids_by_key[(order.guest_id, order.date, order.meal_time)]
+    items = [
+        OrderItem(order_id=order.pk, menu_item_id=menu_item_id)
+        for order, ids in orders
+        for menu_item_id in ids
+    ]
+    OrderItem.objects.bulk_create(items, batch_size=1000)
+    invalidate_service_sheets(date_from=summary.date_from, date_to=summary.date_to)
+
+    summary.orders = len(orders)
+    summary.order_items = len(items)
+    return summary
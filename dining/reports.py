@@ -0,0 +1,414 @@
+"""
+Агрегация заказов для отчётов (официанты, кухня) на стороне SQL.
+
+Вместо загрузки всех заказов с prefetch и обхода в Python — один
+сгруппированный запрос, который возвращает компактные строки.
+Функции build_* собирают из строк данные для шаблонов: только словари,
+списки, строки и числа, чтобы их можно было сохранить в ServiceSheet.
+"""
+from datetime import date, timedelta
+from typing import NamedTuple
+
+from django.db.models import Count, F, Min, OuterRef, Subquery
+
+from .models import DIET_TYPE_CHOICES, MEAL_CHOICES, Guest, Order, OrderItem, SeatAssignment
+
+
+class WaiterRow(NamedTuple):
+    meal_time: str
+    category: str
+    dish_id: int
+    dish_name: str
+    order_index: int
+    table_number: int
+    place_number: int
+
+
+def _seat_on_date(target_date: date) -> Subquery:
+    """
+    id посадки гостя заказа на target_date. Если посадок на дату несколько
+    (пересечение интервалов), берётся первая созданная — как в
+    seating.seat_maps_for_range; без этого join размножал бы строки.
+    """
+    return Subquery(
+        SeatAssignment.objects
+        .filter(guest_id=OuterRef("order__guest_id"), start_date__lte=target_date, end_date__gte=target_date)
+        .order_by("id")
+        .values("id")[:1]
+    )
+
+
+def waiter_rows_for_date(target_date: date, table_from: int, table_to: int) -> list[WaiterRow]:
+    """
+    Строки (приём пищи, раздел, блюдо, стол, место) для раздачи на дату.
+
+    Посадка берётся та, что действует на target_date (одна на гостя, см.
+    _seat_on_date); заказы гостей без посадки на эту дату и за пределами
+    диапазона столов не попадают.
+    Один SQL-запрос: OrderItem -> Order -> SeatAssignment -> DiningTable, MenuItem -> Dish
+    с группировкой по (meal, category, dish, table, place).
+
+    Строки идут в порядке первого появления позиции (заказ, позиция заказа) —
+    так же, как их обходил отчёт раньше; от этого зависит порядок разделов
+    и блюд с одинаковым order_index.
+    """
+    rows = (
+        OrderItem.objects
+        .filter(
+            order__date=target_date,
+            order__guest__seat_assignments__id=_seat_on_date(target_date),
+            order__guest__seat_assignments__table__number__gte=table_from,
+            order__guest__seat_assignments__table__number__lte=table_to,
+        )
+        .values_list(
+            "order__meal_time",
+            "menu_item__category",
+            "menu_item__dish_id",
+            "menu_item__dish__name",
+            "order__guest__seat_assignments__table__number",
+            "order__guest__seat_assignments__place_number",
+        )
+        .annotate(
+            order_index=Min("menu_item__order_index"),
+            first_order_id=Min("order_id"),
+            first_item_id=Min("id"),
+        )
+        .order_by("first_order_id", "first_item_id")
+    )
+    return [
+        WaiterRow(meal, category or "", dish_id, dish_name, order_index, table_no, place_no)
+        for meal, category, dish_id, dish_name, table_no, place_no, order_index, _order_id, _item_id in rows
+    ]
+
+
+class KitchenRow(NamedTuple):
+    dish_id: int
+    dish_name: str
+    meal_time: str
+    table_number: int
+    portions: int
+
+
+def kitchen_rows_for_date(target_date: date) -> list[KitchenRow]:
+    """
+    Порции (блюдо, приём пищи, стол) на дату — один сгруппированный запрос.
+    Учитываются только гости с посадкой на target_date (одна посадка на
+    гостя, см. _seat_on_date — иначе порции удваивались бы). Порядок строк —
+    порядок первого появления, как в waiter_rows_for_date.
+    """
+    rows = (
+        OrderItem.objects
+        .filter(
+            order__date=target_date,
+            order__guest__seat_assignments__id=_seat_on_date(target_date),
+        )
+        .exclude(order__meal_time="snack")
+        .values_list(
+            "menu_item__dish_id",
+            "menu_item__dish__name",
+            "order__meal_time",
+            "order__guest__seat_assignments__table__number",
+        )
+        .annotate(
+            portions=Count("id"),
+            first_order_id=Min("order_id"),
+            first_item_id=Min("id"),
+        )
+        .order_by("first_order_id", "first_item_id")
+    )
+    return [
+        KitchenRow(dish_id, dish_name, meal, table_no, portions)
+        for dish_id, dish_name, meal, table_no, portions, _order_id, _item_id in rows
+    ]
+
+
+def build_kitchen_summary(target_date: date) -> dict:
+    """
+    Сводка для кухни: сколько порций каждого блюда, по приёмам пищи и столам.
+    {"dishes_summary": [{"dish": {"id", "name"}, "total", "by_meal", "tables"}], "all_tables": [...]}
+    """
+    dish_map: dict[int, dict] = {}
+    all_tables_set = set()
+
+    for row in kitchen_rows_for_date(target_date):
+        all_tables_set.add(row.table_number)
+        entry = dish_map.setdefault(
+            row.dish_id,
+            {
+                "dish": {"id": row.dish_id, "name": row.dish_name},
+                "total": 0,
+                "by_meal": {code: 0 for code, _ in MEAL_CHOICES},
+                "tables": set(),
+            },
+        )
+        entry["total"] += row.portions
+        entry["by_meal"][row.meal_time] = entry["by_meal"].get(row.meal_time, 0) + row.portions
+        entry["tables"].add(row.table_number)
+
+    dishes_summary = [
+        {**entry, "tables": sorted(entry["tables"])}
+        for entry in dish_map.values()
+    ]
+    # сортировка блюд по названию
+    dishes_summary.sort(key=lambda x: x["dish"]["name"])
+
+    return {
+        "dishes_summary": dishes_summary,
+        "all_tables": sorted(all_tables_set),
+    }
+
+
+def build_waiter_meal_blocks(target_date: date, table_from: int, table_to: int) -> list[dict]:
+    """
+    Раскладка для официантов на столы table_from..table_to:
+    ПРИЁМ ПИЩИ -> РАЗДЕЛ -> БЛЮДО -> ИТОГО -> СТОЛЫ(места).
+    """
+    # импорт здесь, чтобы не было циклического импорта views <-> reports
+    from .views import common_word_prefix
+
+    # aggregated[meal_code][category_name][dish_id] = {
+    #    'dish_name': str,
+    #    'order_index': int (для сортировки внутри категории),
+    #    'total': int,
+    #    'tables': { table_num: {place_num, ...} }
+    # }
+    aggregated = {code: {} for code, _ in MEAL_CHOICES}
+
+    for row in waiter_rows_for_date(target_date, table_from, table_to):
+        meal_dict = aggregated.setdefault(row.meal_time, {})
+
+        # Категория из MenuItem. Если нет - "Разное"
+        cat_name = row.category.strip() if row.category else "—"
+        cat_dict = meal_dict.setdefault(cat_name, {})
+
+        dish_entry = cat_dict.setdefault(row.dish_id, {
+            "dish_name": row.dish_name,
+            "order_index": row.order_index,  # сохраняем порядок из меню
+            "total": 0,
+            "tables": {},
+        })
+
+        table_places = dish_entry["tables"].setdefault(row.table_number, set())
+
+        # строки уже уникальны по (блюдо, стол, место), но одно блюдо могло
+        # попасть в разные разделы после strip() — считаем место один раз
+        if row.place_number not in table_places:
+            table_places.add(row.place_number)
+            dish_entry["total"] += 1
+
+    meal_blocks = []
+
+    for code, label in MEAL_CHOICES:
+        cats_data = aggregated.get(code, {})
+        if not cats_data:
+            continue
+
+        # Чтобы "ЗАКУСКИ" были раньше "2-е БЛЮДА", сортируем разделы
+        # по минимальному order_index блюд в них
+        sorted_cats = sorted(
+            cats_data.items(),
+            key=lambda item: min(d["order_index"] for d in item[1].values()),
+        )
+
+        categories_list = []
+        for cat_name, dishes_map in sorted_cats:
+            # Сортируем блюда внутри категории (по order_index, затем по имени)
+            sorted_dishes = sorted(
+                dishes_map.values(),
+                key=lambda x: (x["order_index"], x["dish_name"])
+            )
+
+            # Список полных названий (со скобками) для поиска общего префикса
+            full_names = [entry["dish_name"] for entry in sorted_dishes]
+            prefix = common_word_prefix(full_names)
+
+            rows = []
+            for entry in sorted_dishes:
+                base_name = entry["dish_name"]  # показываем полное название, включая скобки
+
+                if prefix and base_name.startswith(prefix):
+                    # Отрезаем общий префикс
+                    display_name = base_name[len(prefix):].lstrip()
+                    # убираем ведущую запятую, если она сразу после префикса
+                    if display_name.startswith(","):
+                        display_name = display_name[1:].lstrip()
+                else:
+                    display_name = base_name
+
+                # Формируем строку столов: "1(1,2); 5(3)"
+                tables_data = []
+                for t_no in sorted(entry["tables"].keys()):
+                    places = sorted(entry["tables"][t_no])
+                    places_str = ",".join(str(p) for p in places)
+                    tables_data.append({
+                        "number": t_no,
+                        "formatted": f"{t_no}({places_str})",
+                    })
+
+                rows.append({
+                    "dish_name": display_name,
+                    "total": entry["total"],
+                    "tables_data": tables_data,
+                    "tables_str": "; ".join([t["formatted"] for t in tables_data]),
+                })
+
+            categories_list.append({
+                "name": cat_name,
+                "rows": rows,
+            })
+
+        meal_blocks.append({
+            "meal_code": code,
+            "meal_label": label,
+            "categories": categories_list,
+        })
+
+    return meal_blocks
+
+
+class ProductionRow(NamedTuple):
+    date: date
+    meal_time: str
+    diet_kind: str
+    dish_id: int
+    dish_name: str
+    output: int | None      # выход порции, г
+    portions: int
+
+
+def production_rows_for_range(date_from: date, date_to: date) -> list[ProductionRow]:
+    """
+    Порции (дата, приём пищи, диета, блюдо) за диапазон дат — один
+    сгруппированный запрос. Диета берётся из дневного меню позиции
+    (какое меню готовить), посадка — как в kitchen_rows_for_date.
+    """
+    rows = (
+        OrderItem.objects
+        .filter(
+            order__date__gte=date_from,
+            order__date__lte=date_to,
+            order__guest__seat_assignments__start_date__lte=F("order__date"),
+            order__guest__seat_assignments__end_date__gte=F("order__date"),
+        )
+        .exclude(order__meal_time="snack")
+        .values_list(
+            "order__date",
+            "order__meal_time",
+            "menu_item__daily_menu__diet_kind",
+            "menu_item__dish_id",
+            "menu_item__dish__name",
+            "menu_item__dish__output",
+        )
+        .annotate(portions=Count("id"))
+        .order_by()
+    )
+    return [ProductionRow(*row) for row in rows]
+
+
+def _guests_coverage(date_from: date, date_to: date) -> tuple[dict, dict]:
+    """(активных гостей по датам, гостей с заказами по датам) — два запроса."""
+    days = [date_from + timedelta(days=i) for i in range((date_to - date_from).days + 1)]
+    active = {day: 0 for day in days}
+    stays = Guest.objects.filter(start_date__lte=date_to, end_date__gte=date_from).values_list(
+        "start_date", "end_date",
+    )
+    for start, end in stays:
+        for day in days:
+            if start <= day <= end:
+                active[day] += 1
+
+    ordered = dict(
+        Order.objects
+        .filter(date__gte=date_from, date__lte=date_to)
+        .values("date")
+        .annotate(guests=Count("guest_id", distinct=True))
+        .values_list("date", "guests")
+    )
+    return active, ordered
+
+
+def _mass(portions: int, output: int | None) -> int | None:
+    return portions * output if output else None
+
+
+def build_production_report(date_from: date, date_to: date) -> dict:
+    """
+    Производственный отчёт для кухни за [date_from; date_to]: порции
+    и масса выхода (Dish.output x порции) по дням, приёмам пищи и диетам,
+    плюс итог по блюдам за весь период.
+
+    День, на который окно выбора меню ещё не закрыто, помечается
+    is_partial: заказы на него ещё меняются, для оценки показываем,
+    сколько гостей уже выбрали меню.
+    """
+    # импорт здесь, чтобы не было циклического импорта reports <-> service_sheets
+    from .service_sheets import is_after_cutoff
+
+    meal_labels = dict(MEAL_CHOICES)
+    diet_codes = [code for code, _ in DIET_TYPE_CHOICES]
+    active, ordered = _guests_coverage(date_from, date_to)
+
+    # by_day[date][meal][dish_id] = {...}
+    by_day: dict[date, dict[str, dict[int, dict]]] = {day: {} for day in active}
+    totals: dict[int, dict] = {}
+
+    for row in production_rows_for_range(date_from, date_to):
+        dish = by_day[row.date].setdefault(row.meal_time, {}).setdefault(row.dish_id, {
+            "dish_id": row.dish_id,
+            "name": row.dish_name,
+            "output": row.output,
+            "portions": 0,
+            "by_diet": {code: 0 for code in diet_codes},
+        })
+        dish["portions"] += row.portions
+        dish["by_diet"][row.diet_kind] = dish["by_diet"].get(row.diet_kind, 0) + row.portions
+
+        total = totals.setdefault(row.dish_id, {
+            "dish_id": row.dish_id,
+            "name": row.dish_name,
+            "output": row.output,
+            "portions": 0,
+            "by_day": {day: 0 for day in active},
+        })
+        total["portions"] += row.portions
+        total["by_day"][row.date] += row.portions
+
+    days = []
+    for day, meals_map in by_day.items():
+        meals = []
+        for code, _label in MEAL_CHOICES:
+            dishes = sorted(meals_map.get(code, {}).values(), key=lambda d: d["name"])
+            if not dishes:
+                continue
+            for dish in dishes:
+                dish["mass_g"] = _mass(dish["portions"], dish["output"])
+            meals.append({
+                "code": code,
+                "label": meal_labels[code],
+                "dishes": dishes,
+                "portions": sum(d["portions"] for d in dishes),
+                "mass_g": sum(d["mass_g"] or 0 for d in dishes),
+            })
+        days.append({
+            "date": day,
+            "is_partial": not is_after_cutoff(day),
+            "guests_active": active[day],
+            "guests_ordered": ordered.get(day, 0),
+            "meals": meals,
+            "portions": sum(m["portions"] for m in meals),
+            "mass_g": sum(m["mass_g"] for m in meals),
+        })
+
+    totals_list = sorted(totals.values(), key=lambda d: d["name"])
+    for dish in totals_list:
+        dish["mass_g"] = _mass(dish["portions"], dish["output"])
+        dish["by_day"] = [dish["by_day"][day] for day in active]
+
+    return {
+        "date_from": date_from,
+        "date_to": date_to,
+        "days": days,
+        "totals": totals_list,
+        "has_partial": any(day["is_partial"] for day in days),
+        "missing_output": [d["name"] for d in totals_list if not d["output"]],
+    }
@@ -0,0 +1,115 @@
+"""
+Чередование циклов меню: какая дата -> (MenuCycle, день цикла).
+
+Циклы и настройки чередования (MenuRotationConfig) меняются раз в
+несколько месяцев, а дата -> цикл нужна на каждой странице с меню, иногда
+по нескольку раз. Поэтому они читаются один раз и хранятся в памяти
+процесса, а ответ считается без запросов к базе.
+
+Сброс:
+- в этом процессе — сигналами post_save/post_delete MenuCycle и
+  MenuRotationConfig (см. signals.py);
+- в других процессах — по версии меню (SystemState.menu_version, её меняют
+  те же сигналы), если вызывающий её знает (menu_cache), иначе не позже
+  чем через ROTATION_CACHE_TTL секунд.
+
+Объекты MenuCycle общие для всех запросов — их нельзя изменять.
+"""
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from .models import MenuCycle, MenuRotationConfig
+
+
+ROTATION_CACHE_TTL = 60
+
+
+@dataclass(frozen=True)
+class Rotation:
+    cycles: tuple               # MenuCycle по id
+    base_date: date
+    forced_cycle: MenuCycle | None
+    version: uuid.UUID | None   # версия меню, при которой прочитано
+    loaded_at: float
+
+    def cycle_and_day(self, target_date: date) -> tuple[MenuCycle | None, int | None]:
+        """
+        (cycle, day_index) для даты:
+        - день цикла = день недели (1 - понедельник, 7 - воскресенье);
+        - если диетсестра принудительно выбрала цикл — всегда он;
+        - иначе циклы чередуются по неделям от base_date.
+        """
+        if not self.cycles:
+            return None, None
+
+        # день недели 1..7
+        day_index = target_date.weekday() + 1
+
+        if self.forced_cycle is not None:
+            cycle = self.forced_cycle
+        else:
+            week_index = (target_date - self.base_date).days // 7
+            cycle = self.cycles[week_index % len(self.cycles)]
+
+        if cycle.days_count and day_index > cycle.days_count:
+            day_index = cycle.days_count
+        return cycle, day_index
+
+
+_lock = threading.Lock()
+_rotation: Rotation | None = None
+
+
+def invalidate_rotation_cache() -> None:
+    """Сбрасывает циклы и настройки чередования, запомненные в этом процессе."""
+    global _rotation
+    with _lock:
+        _rotation = None
+
+
+def _load(version: uuid.UUID | None) -> Rotation:
+    cycles = tuple(MenuCycle.objects.order_by("id"))
+    # без get_or_create: чтение не должно писать в базу; нет настроек — значения по умолчанию
+    cfg = MenuRotationConfig.objects.filter(id=1).first() or MenuRotationConfig()
+    forced = None
+    if cfg.forced_cycle_id:
+        forced = next((c for c in cycles if c.id == cfg.forced_cycle_id), None)
+    return Rotation(cycles, cfg.base_date, forced, version, time.monotonic())
+
+
+def get_rotation(version: uuid.UUID | None = None) -> Rotation:
+    """
+    Текущие циклы и настройки чередования. version — версия меню, если
+    вызывающий её уже прочитал: при расхождении данные перечитываются.
+    """
+    global _rotation
+    rotation = _rotation
+    if rotation is not None:
+        stale = (
+            (version is not None and rotation.version != version)
+            or time.monotonic() - rotation.loaded_at > ROTATION_CACHE_TTL
+        )
+        if not stale:
+            return rotation
+
+    rotation = _load(version)
+    with _lock:
+        _rotation = rotation
+    return rotation
+
+
+def cycle_and_day_for_date(target_date: date, version: uuid.UUID | None = None):
+    """(cycle, day_index) для даты; (None, None), если циклов нет."""
+    return get_rotation(version).cycle_and_day(target_date)
+
+
+def cycles_for_range(date_from: date, date_to: date, version: uuid.UUID | None = None) -> dict:
+    """{дата: (cycle, day_index)} для каждой даты из [date_from; date_to] — для отчётов и календарей."""
+    rotation = get_rotation(version)
+    return {
+        date_from + timedelta(days=i): rotation.cycle_and_day(date_from + timedelta(days=i))
+        for i in range((date_to - date_from).days + 1)
+    }
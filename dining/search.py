@@ -0,0 +1,158 @@
+"""
+Поиск по справочнику блюд и по отдыхающим без учёта регистра
+(в т.ч. для кириллицы).
+
+SQLite сравнивает без учёта регистра только латиницу, поэтому у блюда
+хранится нормализованная строка поиска Dish.search_text: название и
+название для кухни в нижнем регистре (casefold), ё -> е, лишние пробелы
+и знаки препинания убраны. Она пересчитывается при каждом сохранении
+блюда (Dish.save). Запрос нормализуется так же, в базе отбираются блюда,
+содержащие все слова запроса, а порядок задаёт ранжирование:
+
+    1. полное совпадение названия;
+    2. название начинается с запроса;
+    3. каждое слово запроса — начало слова в названии;
+    4. просто вхождение подстрокой (в т.ч. в названии для кухни).
+
+Внутри группы — по алфавиту. Справочник — тысячи строк, поэтому
+отбор по узкой колонке search_text и ранжирование в Python занимают
+миллисекунды.
+
+У гостя так же хранится Guest.search_name (нормализованное ФИО). Запрос
+"иван а" находит "Иванов Алексей" (каждое слово — начало слова ФИО), а
+если точных совпадений мало, добавляются похожие по триграммам — на
+случай опечаток ("ивонов"). Активных гостей — сотни, сравнение
+триграмм по ним в Python тоже занимает миллисекунды.
+"""
+import re
+
+from .models import Dish
+
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+# разделитель названия и названия для кухни в search_text
+FIELD_SEPARATOR = " | "
+
+
+def normalize_search(value: str) -> str:
+    """Строка для поиска: casefold, ё -> е, слова через один пробел."""
+    value = (value or "").casefold().replace("ё", "е")
+    return " ".join(_NON_WORD.sub(" ", value).split())
+
+
+def trigrams(word: str) -> set[str]:
+    """Триграммы слова (с отступами по краям, как в pg_trgm)."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    """Сходство слов по триграммам (коэффициент Жаккара), от 0 до 1."""
+    ta, tb = trigrams(a), trigrams(b)
+    return len(ta & tb) / len(ta | tb)
+
+
+def dish_search_text(name: str, short_name: str = "") -> str:
+    """Значение Dish.search_text для названия и названия для кухни."""
+    parts = [normalize_search(name)]
+    short = normalize_search(short_name)
+    if short and short != parts[0]:
+        parts.append(short)
+    return FIELD_SEPARATOR.join(parts)
+
+
+def _rank(search_text: str, query: str, words: list[str]) -> int:
+    name = search_text.split(FIELD_SEPARATOR, 1)[0]
+    if name == query:
+        return 0
+    if name.startswith(query):
+        return 1
+    name_words = name.split()
+    if all(any(w.startswith(word) for w in name_words) for word in words):
+        return 2
+    return 3
+
+
+def search_dishes(query: str, queryset=None) -> list[Dish]:
+    """
+    Блюда, у которых в названии или названии для кухни есть все слова
+    запроса, в порядке ранжирования (см. описание модуля).
+    """
+    qs = Dish.objects.all() if queryset is None else queryset
+    normalized = normalize_search(query)
+    if not normalized:
+        return list(qs.order_by("name"))
+
+    words = normalized.split()
+    for word in words:
+        qs = qs.filter(search_text__contains=word)
+
+    dishes = list(qs)
+    dishes.sort(key=lambda d: (_rank(d.search_text, normalized, words), d.name.casefold(), d.id))
+    return dishes
+
+
+# ---------- Гости ----------
+
+# если точных совпадений меньше — добавляем похожие (опечатки)
+GUEST_FUZZY_MIN_RESULTS = 5
+# минимальное сходство слова запроса и слова ФИО по триграммам
+GUEST_TRIGRAM_THRESHOLD = 0.35
+
+
+def _word_similarity(token: str, words: list[str]) -> float:
+    """Лучшее сходство слова запроса со словом ФИО (или его началом той же длины)."""
+    return max(
+        (max(trigram_similarity(token, w), trigram_similarity(token, w[:len(token)])) for w in words),
+        default=0.0,
+    )
+
+
+def _guest_rank(search_name: str, query: str, tokens: list[str]) -> int | None:
+    """
+    0 — ФИО начинается с запроса; 1 — каждое слово запроса — начало слова ФИО
+    ("иван а" -> "Иванов Алексей"); 2 — все слова запроса входят подстрокой.
+    """
+    if search_name.startswith(query):
+        return 0
+    words = search_name.split()
+    if all(any(w.startswith(token) for w in words) for token in tokens):
+        return 1
+    if all(token in search_name for token in tokens):
+        return 2
+    return None
+
+
+def guest_search_ids(query: str, queryset) -> list[int]:
+    """
+    id гостей из queryset, подходящих под запрос, в порядке ранжирования:
+    точные совпадения (см. _guest_rank), затем похожие по триграммам —
+    если точных меньше GUEST_FUZZY_MIN_RESULTS ("ивонов" -> "Иванов").
+    """
+    normalized = normalize_search(query)
+    if not normalized:
+        return []
+    tokens = normalized.split()
+
+    exact_qs = queryset
+    for token in tokens:
+        exact_qs = exact_qs.filter(search_name__contains=token)
+    ranked = []
+    for guest_id, search_name in exact_qs.values_list("id", "search_name"):
+        rank = _guest_rank(search_name, normalized, tokens)
+        if rank is not None:
+            ranked.append((rank, 0.0, search_name, guest_id))
+
+    if len(ranked) < GUEST_FUZZY_MIN_RESULTS and any(len(token) >= 3 for token in tokens):
+        found = {guest_id for *_rest, guest_id in ranked}
+        for guest_id, search_name in queryset.values_list("id", "search_name"):
+            if guest_id in found:
+                continue
+            words = search_name.split()
+            scores = [_word_similarity(token, words) for token in tokens]
+            if min(scores) >= GUEST_TRIGRAM_THRESHOLD:
+                ranked.append((3, -sum(scores), search_name, guest_id))
+
+    ranked.sort()
+    return [guest_id for *_rest, guest_id in ranked]
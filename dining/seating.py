@@ -0,0 +1,82 @@
+"""
+Посадка гостей за столы на дату.
+
+Вместо prefetch всей истории посадок каждого гостя и перебора в Python
+("for s in guest.seat_assignments.all(): if s.start_date <= d <= s.end_date")
+— один запрос по пересечению интервалов, который сразу даёт карту
+guest_id -> (стол, место) на дату или на диапазон дат.
+
+Карты на дату запоминаются на время запроса (request) и сбрасываются
+при любом изменении посадок в этом процессе (см. signals.py).
+"""
+import threading
+from datetime import date, timedelta
+from typing import NamedTuple
+
+from .models import SeatAssignment
+
+
+class Seat(NamedTuple):
+    assignment_id: int
+    table_number: int
+    place_number: int
+    start_date: date
+    end_date: date
+
+
+_lock = threading.Lock()
+_generation = 0
+
+
+def bump_seat_generation() -> None:
+    """Помечает запомненные карты посадок устаревшими."""
+    global _generation
+    with _lock:
+        _generation += 1
+
+
+def seat_maps_for_range(date_from: date, date_to: date, guest_ids=None) -> dict[date, dict[int, Seat]]:
+    """
+    Карты посадок на каждую дату из [date_from; date_to]: {дата: {guest_id: Seat}}.
+    Один запрос. Если у гостя на дату несколько посадок, берётся первая
+    созданная — так же, как при переборе seat_assignments.all().
+    """
+    qs = SeatAssignment.objects.filter(start_date__lte=date_to, end_date__gte=date_from)
+    if guest_ids is not None:
+        qs = qs.filter(guest_id__in=list(guest_ids))
+    rows = qs.order_by("id").values_list(
+        "id", "guest_id", "table__number", "place_number", "start_date", "end_date",
+    )
+
+    maps: dict[date, dict[int, Seat]] = {
+        date_from + timedelta(days=i): {}
+        for i in range((date_to - date_from).days + 1)
+    }
+    for assignment_id, guest_id, table_number, place_number, start, end in rows:
+        seat = Seat(assignment_id, table_number, place_number, start, end)
+        day = max(start, date_from)
+        last = min(end, date_to)
+        while day <= last:
+            maps[day].setdefault(guest_id, seat)
+            day += timedelta(days=1)
+    return maps
+
+
+def seat_map_for_date(target_date: date, request=None) -> dict[int, Seat]:
+    """
+    Карта guest_id -> Seat на дату. С request карта запоминается
+    до конца запроса (или до первого изменения посадок).
+    """
+    if request is None:
+        return seat_maps_for_range(target_date, target_date)[target_date]
+
+    memo = request.__dict__.setdefault("_seat_maps", {})
+    key = (target_date, _generation)
+    if key not in memo:
+        memo[key] = seat_maps_for_range(target_date, target_date)[target_date]
+    return memo[key]
+
+
+def seat_for_guest(guest_id: int, target_date: date) -> Seat | None:
+    """Посадка одного гостя на дату (один запрос по его посадкам)."""
+    return seat_maps_for_range(target_date, target_date, guest_ids=[guest_id])[target_date].get(guest_id)
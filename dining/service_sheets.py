@@ -0,0 +1,145 @@
+"""
+"Замороженные" отчёты для раздачи (ServiceSheet).
+
+После закрытия окна выбора меню на день C (C-1 11:00, см.
+get_active_menu_target) гости уже не меняют заказы, поэтому сводку для
+кухни и раскладку для официантов достаточно посчитать один раз.
+Отчёты строятся командой close_ordering_window (по расписанию в 11:00,
+вместе с назначением стандартного меню, см. maintenance.py) или
+build_service_sheets, после назначения меню диетсестрой или лениво — при первом открытии,
+и дальше отдаются одним чтением.
+
+Правки после закрытия окна (заказы, посадки, блюда) увеличивают
+ServiceSheet.version (см. signals.py и orders.save_orders); устаревший
+отчёт пересобирается при следующем открытии.
+"""
+from datetime import date, datetime, time, timedelta
+
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ServiceSheet
+from .reports import build_kitchen_summary, build_waiter_meal_blocks
+
+
+# конец окна выбора меню на день C — C-1 в это время
+ORDER_CUTOFF_TIME = time(11, 0)
+
+# ключ раскладки официантов для всех столов (без фильтра по официанту)
+ALL_TABLES_KEY = "all"
+
+
+def order_cutoff(target_date: date) -> datetime:
+    """Момент закрытия окна выбора меню на target_date."""
+    return timezone.make_aware(
+        datetime.combine(target_date - timedelta(days=1), ORDER_CUTOFF_TIME)
+    )
+
+
+def is_after_cutoff(target_date: date, now: datetime | None = None) -> bool:
+    """Закрыто ли уже окно выбора меню на target_date."""
+    now = now or timezone.localtime()
+    return now >= order_cutoff(target_date)
+
+
+def _waiter_payload(target_date: date) -> dict:
+    # импорт здесь, чтобы не было циклического импорта views <-> service_sheets
+    from .views import MAX_TABLE_NUMBER, WAITER_RANGES
+
+    payload = {ALL_TABLES_KEY: build_waiter_meal_blocks(target_date, 1, MAX_TABLE_NUMBER)}
+    for waiter_num, (table_from, table_to) in WAITER_RANGES.items():
+        payload[str(waiter_num)] = build_waiter_meal_blocks(target_date, table_from, table_to)
+    return payload
+
+
+BUILDERS = {
+    ServiceSheet.KIND_KITCHEN: build_kitchen_summary,
+    ServiceSheet.KIND_WAITER: _waiter_payload,
+}
+
+
+def build_service_sheets(target_date: date, kinds=None) -> list[ServiceSheet]:
+    """
+    Строит (пересобирает) отчёты на target_date.
+
+    Версию данных читаем до расчёта: если заказы изменятся во время
+    построения, отчёт останется устаревшим и пересоберётся при открытии.
+    """
+    kinds = list(kinds or BUILDERS)
+    ServiceSheet.objects.bulk_create(
+        [ServiceSheet(date=target_date, kind=kind) for kind in kinds],
+        ignore_conflicts=True,
+    )
+    versions = dict(
+        ServiceSheet.objects
+        .filter(date=target_date, kind__in=kinds)
+        .values_list("kind", "version")
+    )
+
+    built_at = timezone.now()
+    sheets = []
+    for kind in kinds:
+        payload = BUILDERS[kind](target_date)
+        ServiceSheet.objects.filter(date=target_date, kind=kind).update(
+            payload=payload,
+            built_version=versions[kind],
+            built_at=built_at,
+        )
+        sheets.append(ServiceSheet(
+            date=target_date,
+            kind=kind,
+            payload=payload,
+            version=versions[kind],
+            built_version=versions[kind],
+            built_at=built_at,
+        ))
+    return sheets
+
+
+def get_service_sheet(target_date: date, kind: str):
+    """
+    Данные отчёта на target_date: одно чтение, если отчёт актуален,
+    иначе — пересборка этого отчёта.
+    """
+    sheet = ServiceSheet.objects.filter(date=target_date, kind=kind).first()
+    if sheet is None or not sheet.is_fresh:
+        sheet = build_service_sheets(target_date, kinds=[kind])[0]
+    return sheet.payload
+
+
+def invalidate_service_sheets(dates=None, date_from: date | None = None, date_to: date | None = None) -> None:
+    """
+    Помечает отчёты устаревшими: на конкретные даты (dates) и/или
+    на диапазон дат [date_from; date_to] (любая из границ может быть открытой).
+    """
+    qs = ServiceSheet.objects.all()
+    if dates is not None:
+        qs = qs.filter(date__in=list(dates))
+    if date_from is not None:
+        qs = qs.filter(date__gte=date_from)
+    if date_to is not None:
+        qs = qs.filter(date__lte=date_to)
+    qs.update(version=F("version") + 1)
+
+
+def waiter_meal_blocks(target_date: date, table_from: int, table_to: int, waiter_num=None) -> list[dict]:
+    """
+    Раскладка для официантов: после закрытия окна выбора — из готового
+    отчёта (для официанта или всех столов), иначе — расчёт по заказам.
+    """
+    # импорт здесь, чтобы не было циклического импорта views <-> service_sheets
+    from .views import MAX_TABLE_NUMBER, WAITER_RANGES
+
+    if waiter_num in WAITER_RANGES:
+        sheet_key = str(waiter_num)
+    elif (table_from, table_to) == (1, MAX_TABLE_NUMBER):
+        sheet_key = ALL_TABLES_KEY
+    else:
+        sheet_key = None  # произвольный диапазон столов в отчёт не сохраняем
+
+    meal_blocks = None
+    if sheet_key and is_after_cutoff(target_date):
+        meal_blocks = get_service_sheet(target_date, ServiceSheet.KIND_WAITER).get(sheet_key)
+    if meal_blocks is None:
+        meal_blocks = build_waiter_meal_blocks(target_date, table_from, table_to)
+    return meal_blocks
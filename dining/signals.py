@@ -0,0 +1,81 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .access_codes import release_access_codes
+from .menu_calendar import rebuild_menu_calendar
+from .menu_cache import bump_menu_version
+from .models import (
+    DailyMenu,
+    DiningTable,
+    Dish,
+    Guest,
+    MenuCycle,
+    MenuItem,
+    MenuRotationConfig,
+    SeatAssignment,
+)
+from .rotation import invalidate_rotation_cache
+from .seating import bump_seat_generation
+from .service_sheets import invalidate_service_sheets
+
+
+@receiver(post_save, sender=Dish)
+@receiver(post_delete, sender=Dish)
+@receiver(post_save, sender=MenuItem)
+@receiver(post_delete, sender=MenuItem)
+@receiver(post_save, sender=DailyMenu)
+@receiver(post_delete, sender=DailyMenu)
+@receiver(post_save, sender=MenuCycle)
+@receiver(post_delete, sender=MenuCycle)
+@receiver(post_save, sender=MenuRotationConfig)
+@receiver(post_delete, sender=MenuRotationConfig)
+def menu_changed(sender, **kwargs):
+    """Любое изменение меню сбрасывает кэш снимков меню (menu_cache)."""
+    bump_menu_version()
+
+
+@receiver(post_save, sender=MenuCycle)
+@receiver(post_delete, sender=MenuCycle)
+@receiver(post_save, sender=MenuRotationConfig)
+@receiver(post_delete, sender=MenuRotationConfig)
+def rotation_changed(sender, **kwargs):
+    """
+    Циклы и настройки чередования запомнены в процессе (rotation.py),
+    а календарь меню построен по ним (menu_calendar.py).
+    """
+    invalidate_rotation_cache()
+    if not kwargs.get("raw"):
+        rebuild_menu_calendar()
+
+
+@receiver(post_save, sender=DailyMenu)
+def daily_menu_created(sender, created, raw=False, **kwargs):
+    """Новое меню на день может закрыть пустую клетку календаря меню."""
+    if created and not raw:
+        rebuild_menu_calendar()
+
+
+@receiver(post_save, sender=Dish)
+@receiver(post_save, sender=MenuItem)
+@receiver(post_save, sender=DiningTable)
+def service_sheet_source_changed(sender, **kwargs):
+    """Названия блюд, разделы меню и номера столов входят в готовые отчёты."""
+    invalidate_service_sheets(date_from=timezone.localdate())
+
+
+@receiver(post_delete, sender=Guest)
+def guest_deleted(sender, instance, **kwargs):
+    """Код доступа удалённого гостя (любым способом) возвращается в пул."""
+    release_access_codes([instance.access_code])
+
+
+@receiver(post_save, sender=SeatAssignment)
+@receiver(post_delete, sender=SeatAssignment)
+def seat_changed(sender, instance, **kwargs):
+    """Пересадка / выезд гостя меняет карты посадок и раскладку на даты его посадки."""
+    bump_seat_generation()
+    today = timezone.localdate()
+    if instance.end_date < today:
+        return  # прошедшие посадки (в т.ч. очистка выехавших) отчёты не меняют
+    invalidate_service_sheets(date_from=min(instance.start_date, today))
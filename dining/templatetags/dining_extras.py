@@ -14,4 +14,12 @@ def get_item(mapping, key):
     """Позволяет в шаблоне писать d.by_meal|get_item:"breakfast"."""
     if mapping is None:
         return ""
-    return mapping.get(key, 0)
\ No newline at end of file
+    return mapping.get(key, 0)
+
+
+@register.filter
+def kg(grams):
+    """Граммы -> килограммы с двумя знаками: 12500 -> "12,50". Пусто, если выход неизвестен."""
+    if grams is None:
+        return "—"
+    return f"{grams / 1000:.2f}".replace(".", ",")
@@ -0,0 +1,124 @@
+"""
+Число SQL-запросов горячих страниц не должно зависеть от объёма данных.
+
+Для каждой страницы закреплено число запросов (QUERY_BUDGET), и оно
+проверяется на двух объёмах (SCALES). Если изменение вернёт запросы
+"на каждого гостя / приём пищи" (N+1), тест упадёт на большем объёме.
+Если число запросов изменилось осознанно — поправьте QUERY_BUDGET.
+
+Каждая страница сначала запрашивается для прогрева (кэш меню, готовые
+отчёты), считается второй запрос. POST-запросы выполняются в
+транзакции, которая откатывается, — оба запроса видят одни и те же данные.
+"""
+import random
+from datetime import datetime, time as dt_time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import Client, TestCase
+from django.utils import timezone
+
+from .models import Guest, Order
+from .perf import frozen_localtime
+from .population import first_choice_post_data, seed_menus, seed_population
+
+
+# число гостей в дату меню
+SCALES = (5, 40)
+
+# страница -> число SQL-запросов (после прогрева)
+QUERY_BUDGET = {
+    "landing": 1,
+    "landing_login": 7,
+    "guest_menu": 6,
+    "guest_menu_post": 14,
+    "waiter_print_compact": 3,
+    "waiter_print_compact_sheet": 3,
+    "kitchen_summary": 3,
+    "kitchen_summary_sheet": 3,
+    "missing_menu": 5,
+    "missing_menu_post": 10,
+    "missing_menu_counts": 4,
+    "missing_menu_fill": 5,
+    "missing_menu_fill_post": 11,
+    "seating_overview": 3,
+    "guest_list": 5,
+    "guest_autocomplete": 5,
+}
+
+
+class HotViewQueryCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_menus(random.Random(1))
+        cls.staff_user = get_user_model().objects.create_user("staff", is_staff=True)
+
+    def setUp(self):
+        today = timezone.localdate()
+        self.target_date = today + timedelta(days=2)
+        # окно выбора на target_date открыто (C-2 17:05) / уже закрыто (C-1 12:00)
+        self.window_open = datetime.combine(today, dt_time(17, 5))
+        self.window_closed = datetime.combine(today + timedelta(days=1), dt_time(12, 0))
+        self.staff = Client()
+        self.staff.force_login(self.staff_user)
+
+    def _populate(self, count):
+        """count гостей в target_date; гость для входа — без заказов на эту дату."""
+        Guest.objects.all().delete()
+        seed_population(count, self.target_date, 1, random.Random(count))
+        guest = (
+            Guest.objects
+            .filter(end_date__gt=self.target_date)
+            .order_by("id")
+            .first()
+        )
+        Order.objects.filter(guest=guest, date=self.target_date).delete()
+        return guest
+
+    def _requests(self, guest):
+        day = f"date={self.target_date.isoformat()}"
+        fill_url = f"/diet/missing/fill/{guest.diet_kind}/?{day}"
+        menu_post_data = first_choice_post_data(self.target_date, guest.diet_kind)
+        guest_client = Client()
+        guest_client.post("/", {"access_code": guest.access_code})
+        anonymous = Client()
+
+        # (страница, запрос, момент времени, POST с откатом)
+        open_, closed = self.window_open, self.window_closed
+        return [
+            ("landing", lambda: anonymous.get("/"), open_, False),
+            ("landing_login", lambda: anonymous.post("/", {"access_code": guest.access_code}), open_, True),
+            ("guest_menu", lambda: guest_client.get("/guest/menu/"), open_, False),
+            ("guest_menu_post", lambda: guest_client.post("/guest/menu/", menu_post_data), open_, True),
+            ("waiter_print_compact", lambda: self.staff.get(f"/waiter/print-compact/?{day}"), open_, False),
+            ("waiter_print_compact_sheet", lambda: self.staff.get(f"/waiter/print-compact/?{day}"), closed, False),
+            ("kitchen_summary", lambda: self.staff.get(f"/kitchen/?{day}"), open_, False),
+            ("kitchen_summary_sheet", lambda: self.staff.get(f"/kitchen/?{day}"), closed, False),
+            ("missing_menu", lambda: self.staff.get(f"/diet/missing/?{day}"), open_, False),
+            ("missing_menu_post", lambda: self.staff.post(f"/diet/missing/?{day}", {"diet_kind": "all"}), open_, True),
+            ("missing_menu_counts", lambda: self.staff.get(f"/diet/missing/counts/?{day}"), open_, False),
+            ("missing_menu_fill", lambda: self.staff.get(fill_url), open_, False),
+            ("missing_menu_fill_post", lambda: self.staff.post(fill_url, menu_post_data), open_, True),
+            ("seating_overview", lambda: self.staff.get("/diet/seating/"), open_, False),
+            ("guest_list", lambda: self.staff.get(f"/diet/guests/?{day}"), open_, False),
+            ("guest_autocomplete", lambda: self.staff.get(f"/diet/guests/autocomplete/?{day}&q=ив"), open_, False),
+        ]
+
+    def _call(self, request, rollback, expected_queries=None):
+        with transaction.atomic():
+            if expected_queries is None:
+                response = request()
+            else:
+                with self.assertNumQueries(expected_queries):
+                    response = request()
+            transaction.set_rollback(rollback)
+        return response
+
+    def test_query_count_does_not_grow_with_guests(self):
+        for count in SCALES:
+            guest = self._populate(count)
+            for name, request, now, rollback in self._requests(guest):
+                with self.subTest(view=name, guests=count), frozen_localtime(now):
+                    response = self._call(request, rollback)
+                    self.assertEqual(response.status_code, 302 if rollback else 200)
+                    self._call(request, rollback, QUERY_BUDGET[name])
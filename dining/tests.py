@@ -1,3 +1,336 @@
-from django.test import TestCase
+import random
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
 
-# Create your tests here.
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .access_codes import rebuild_access_code_pool, reserved_access_codes
+from .dedup import find_duplicate_groups, merge_dishes, review_rows
+from .fill import fill_missing_orders, find_missing
+from .maintenance import purge_departed_guests
+from .menu_calendar import calendar_menu_ids
+from .menu_data import (
+    MENU_FIELDS,
+    MenuDataError,
+    export_menu_rows,
+    import_menus,
+    menu_row_values,
+    read_menu_rows,
+)
+from .menu_sync import DesiredItem, sync_menu_items
+from .models import (
+    DIET_TYPE_CHOICES,
+    DailyMenu,
+    DiningTable,
+    Dish,
+    FreeAccessCode,
+    Guest,
+    MenuCycle,
+    MenuItem,
+    Order,
+    OrderItem,
+    SeatAssignment,
+    ServiceSheet,
+)
+from .orders import save_orders
+from .population import seed_guests, seed_menus
+from .reports import kitchen_rows_for_date, waiter_rows_for_date
+from .rotation import cycle_and_day_for_date, invalidate_rotation_cache
+from .views import ensure_menu_cycles_exist
+
+
+class FillMissingOrdersTests(TestCase):
+    target_date = date(2025, 12, 17)
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_menus(random.Random(1))
+        # прогреваем кэш меню (menu_cache, rotation) — его чтение не в счёт
+        find_missing(cls.target_date)
+
+    def _seed(self, count):
+        Guest.objects.all().delete()
+        return seed_guests(count, date(2025, 12, 15), date(2025, 12, 20), random.Random(count))
+
+    def _fill_queries(self, count):
+        self._seed(count)
+        with CaptureQueriesContext(connection) as ctx:
+            summary = fill_missing_orders(self.target_date)
+        self.assertEqual(summary.guests_filled, count)
+        return len(ctx.captured_queries)
+
+    def test_query_count_does_not_grow_with_guests(self):
+        self.assertEqual(self._fill_queries(5), self._fill_queries(60))
+
+    def test_keeps_existing_choice_and_fills_the_rest(self):
+        first = self._seed(3)[0]
+        default_id = find_missing(self.target_date).default_items_by_diet[first.diet_kind]["breakfast"]
+        # гость успел сам выбрать завтрак — не "стандартное" блюдо
+        own_id = (
+            MenuItem.objects
+            .filter(daily_menu__items=default_id, meal_time="breakfast", is_common=False)
+            .exclude(id=default_id)
+            .values_list("id", flat=True)
+            .first()
+        )
+        save_orders(self.target_date, {(first.id, "breakfast"): [own_id]})
+
+        summary = fill_missing_orders(self.target_date)
+
+        self.assertEqual(summary.guests_filled, 3)
+        self.assertEqual(summary.meals_filled, 3 * 3 - 1)
+        kept = Order.objects.get(guest_id=first.id, date=self.target_date, meal_time="breakfast")
+        self.assertEqual(list(kept.items.values_list("menu_item_id", flat=True)), [own_id])
+        self.assertEqual(find_missing(self.target_date).guests, [])
+
+
+class AccessCodeTests(TestCase):
+    def test_codes_return_to_pool_on_failed_create_and_on_delete(self):
+        rebuild_access_code_pool()
+        pool_size = FreeAccessCode.objects.count()
+
+        with self.assertRaises(ValueError):
+            with reserved_access_codes(2):
+                raise ValueError("гостя создать не удалось")
+        self.assertEqual(FreeAccessCode.objects.count(), pool_size)
+
+        guest = seed_guests(1, date(2025, 12, 15), date(2025, 12, 20), random.Random(1))[0]
+        self.assertFalse(FreeAccessCode.objects.filter(code=guest.access_code).exists())
+        Guest.objects.get(id=guest.id).delete()
+        self.assertTrue(FreeAccessCode.objects.filter(code=guest.access_code).exists())
+
+    def test_purge_returns_codes_with_one_insert_per_batch(self):
+        rebuild_access_code_pool()
+        pool_size = FreeAccessCode.objects.count()
+        seed_guests(7, date(2025, 12, 1), date(2025, 12, 10), random.Random(1))
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(purge_departed_guests(date(2025, 12, 11), batch_size=5), 7)
+
+        inserts = [
+            q for q in ctx.captured_queries
+            if q["sql"].startswith("INSERT") and '"dining_freeaccesscode"' in q["sql"]
+        ]
+        self.assertEqual(len(inserts), 2)
+        self.assertEqual(FreeAccessCode.objects.count(), pool_size)
+
+    def test_admin_code_change_returns_old_code(self):
+        rebuild_access_code_pool()
+        seeded = seed_guests(1, date(2025, 12, 15), date(2025, 12, 20), random.Random(1))[0]
+        guest = Guest.objects.get(id=seeded.id)
+        old_code = guest.access_code
+        guest.access_code = "AB12"
+        form = SimpleNamespace(changed_data=["access_code"], initial={"access_code": old_code})
+
+        admin.site._registry[Guest].save_model(None, guest, form, change=True)
+
+        self.assertTrue(FreeAccessCode.objects.filter(code=old_code).exists())
+
+
+class StaffPageTransactionTests(TestCase):
+    def test_get_pages_do_not_open_a_transaction(self):
+        # в SQLite транзакция берёт блокировку на запись (BEGIN IMMEDIATE)
+        guest_id = seed_guests(1, date(2025, 12, 15), date(2025, 12, 20), random.Random(1))[0].id
+        staff = Client()
+        staff.force_login(get_user_model().objects.create_user("staff", is_staff=True))
+
+        for url in ("/diet/seating/table/1/", "/add-guest/", f"/diet/seating/move/{guest_id}/"):
+            with self.subTest(url=url), CaptureQueriesContext(connection) as ctx:
+                self.assertEqual(staff.get(url).status_code, 200)
+            self.assertFalse([q for q in ctx.captured_queries if q["sql"].startswith("SAVEPOINT")])
+
+
+class SaveOrdersTests(TestCase):
+    target_date = date(2025, 12, 17)
+
+    def test_replaces_existing_choice_in_place(self):
+        seed_menus(random.Random(1))
+        guest = seed_guests(1, date(2025, 12, 15), date(2025, 12, 20), random.Random(1))[0]
+        breakfast = list(
+            MenuItem.objects
+            .filter(meal_time="breakfast", is_common=False, daily_menu__diet_kind=guest.diet_kind)
+            .values_list("id", flat=True)[:2]
+        )
+        lunch = MenuItem.objects.filter(meal_time="lunch", is_common=False).values_list("id", flat=True)[0]
+        save_orders(self.target_date, {(guest.id, "breakfast"): [breakfast[0]], (guest.id, "lunch"): [lunch]})
+        order_id = Order.objects.get(guest_id=guest.id, meal_time="breakfast").id
+
+        summary = save_orders(self.target_date, {(guest.id, "breakfast"): [breakfast[1]], (guest.id, "lunch"): []})
+
+        self.assertEqual((summary.created_orders, summary.updated_orders, summary.deleted_orders), (0, 1, 1))
+        order = Order.objects.get(guest_id=guest.id, date=self.target_date)
+        self.assertEqual(order.id, order_id)
+        self.assertEqual(list(order.items.values_list("menu_item_id", flat=True)), [breakfast[1]])
+        # тот же выбор ещё раз — ничего не пишется
+        again = save_orders(self.target_date, {(guest.id, "breakfast"): [breakfast[1]]})
+        self.assertEqual((again.updated_orders, again.items_written), (0, 0))
+
+
+class DishDuplicatesTests(TestCase):
+    def test_finds_and_merges_abbreviated_duplicate(self):
+        keep = Dish.objects.create(name="Каша гречневая рассыпчатая", short_name="Гречка")
+        dup = Dish.objects.create(name="Каша грeчневая рассып.", kcal=150)  # латинская "e"
+        other = Dish.objects.create(name="Каша пшенная вязкая")
+        menu = DailyMenu.objects.create(cycle=MenuCycle.objects.create(name="Меню №1"), day_index=1)
+        kept_item = MenuItem.objects.create(daily_menu=menu, meal_time="lunch", category="ГАРНИРЫ", dish=keep)
+        dup_item = MenuItem.objects.create(daily_menu=menu, meal_time="lunch", category="ГАРНИРЫ", dish=dup)
+        MenuItem.objects.create(daily_menu=menu, meal_time="lunch", category="ГАРНИРЫ", dish=other)
+        guest = seed_guests(1, date(2025, 12, 15), date(2025, 12, 20), random.Random(1))[0]
+        order = Order.objects.create(guest_id=guest.id, date=date(2025, 12, 16), meal_time="lunch")
+        OrderItem.objects.create(order=order, menu_item=dup_item)
+
+        groups = find_duplicate_groups()
+        self.assertEqual([(g.keep.id, [m.dish.id for m in g.duplicates]) for g in groups], [(keep.id, [dup.id])])
+        # сокращение — сходство 1.0, но к слиянию сразу не отмечено
+        self.assertEqual(groups[0].duplicates[0].score, 1.0)
+        self.assertEqual([row[2] for row in review_rows(groups)][1:], ["", ""])
+
+        summary = merge_dishes({dup.id: keep.id})
+
+        self.assertEqual((summary.dishes_merged, summary.menu_items_collapsed, summary.order_items_repointed), (1, 1, 1))
+        self.assertFalse(Dish.objects.filter(id=dup.id).exists())
+        self.assertEqual(Dish.objects.get(id=keep.id).kcal, 150)
+        self.assertEqual(list(order.items.values_list("menu_item_id", flat=True)), [kept_item.id])
+
+
+class MenuSyncTests(TestCase):
+    def test_sync_keeps_ids_and_items_with_orders(self):
+        menu = DailyMenu.objects.create(cycle=MenuCycle.objects.create(name="Меню №1"), day_index=1)
+        soup, porridge, tea = (Dish.objects.create(name=name) for name in ("Суп", "Каша", "Чай"))
+        first = [
+            DesiredItem("lunch", "1-е БЛЮДА", soup.id, 1, False),
+            DesiredItem("lunch", "2-е БЛЮДА", porridge.id, 1, False),
+        ]
+        self.assertEqual(sync_menu_items({menu.id: first}).created, 2)
+        soup_item = MenuItem.objects.get(dish=soup)
+        porridge_item = MenuItem.objects.get(dish=porridge)
+        guest = seed_guests(1, date(2025, 12, 15), date(2025, 12, 20), random.Random(1))[0]
+        order = Order.objects.create(guest_id=guest.id, date=date(2025, 12, 16), meal_time="lunch")
+        OrderItem.objects.create(order=order, menu_item=porridge_item)
+
+        # каши больше нет в меню, суп стал вторым, добавился чай
+        second = [
+            DesiredItem("lunch", "1-е БЛЮДА", tea.id, 1, True),
+            DesiredItem("lunch", "1-е БЛЮДА", soup.id, 2, False),
+        ]
+        summary = sync_menu_items({menu.id: second})
+
+        self.assertEqual((summary.created, summary.updated, summary.deleted, summary.retired), (1, 1, 0, 1))
+        self.assertEqual(MenuItem.objects.get(dish=soup).id, soup_item.id)
+        # позиция с заказом осталась, но снята с меню
+        porridge_item.refresh_from_db()
+        self.assertEqual((porridge_item.is_active, porridge_item.order_index), (False, 0))
+        self.assertFalse(sync_menu_items({menu.id: second}).changed)
+
+        # каша вернулась в файл — та же позиция снова в меню
+        self.assertEqual(sync_menu_items({menu.id: second + first[1:]}).updated, 1)
+        porridge_item.refresh_from_db()
+        self.assertTrue(porridge_item.is_active)
+
+
+class MenuSetupTests(TestCase):
+    """Циклы и меню создаются через bulk_create — без сигналов post_save."""
+
+    def setUp(self):
+        # кэш процесса мог остаться от других тестов (их данные откатаны)
+        invalidate_rotation_cache()
+
+    def test_ensure_menu_cycles_resets_rotation(self):
+        today = timezone.localdate()
+        self.assertEqual(cycle_and_day_for_date(today), (None, None))  # запомнено "циклов нет"
+        ensure_menu_cycles_exist()
+        cycle, _day_index = cycle_and_day_for_date(today)
+        self.assertIsNotNone(cycle)
+
+    def test_seed_menus_builds_calendar(self):
+        today = timezone.localdate()
+        self.assertEqual(calendar_menu_ids(today), {})
+        seed_menus(random.Random(1))
+        self.assertEqual(len(calendar_menu_ids(today)), len(DIET_TYPE_CHOICES))
+
+
+class ServiceSheetInvalidationTests(TestCase):
+    def test_dish_delete_marks_sheets_stale(self):
+        menu = DailyMenu.objects.create(cycle=MenuCycle.objects.create(name="Меню №1"), day_index=1)
+        dish = Dish.objects.create(name="Суп")
+        item = MenuItem.objects.create(daily_menu=menu, meal_time="lunch", category="1-е БЛЮДА", dish=dish)
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        guest = seed_guests(1, tomorrow, tomorrow + timedelta(days=3), random.Random(1))[0]
+        order = Order.objects.create(guest_id=guest.id, date=tomorrow, meal_time="lunch")
+        OrderItem.objects.create(order=order, menu_item=item)
+        sheet = ServiceSheet.objects.create(
+            date=tomorrow, kind=ServiceSheet.KIND_KITCHEN, version=1, built_version=1,
+        )
+        staff = Client()
+        staff.force_login(get_user_model().objects.create_user("staff", is_staff=True))
+
+        staff.post(f"/dishes/{dish.id}/delete/")
+
+        sheet.refresh_from_db()
+        self.assertFalse(sheet.is_fresh)
+
+
+class MenuDataTests(TestCase):
+    def _read(self, *lines):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "menu.csv"
+            path.write_text("\n".join([";".join(MENU_FIELDS), *lines]) + "\n", encoding="utf-8")
+            return read_menu_rows([path])
+
+    def test_dish_values_must_match_across_rows(self):
+        rows = self._read(
+            "Меню №1;1;P;breakfast;НАПИТКИ;;Нектар;1;0.2;0.0;10.3;42.4;200",
+            "Меню №1;1;B;breakfast;НАПИТКИ;;Нектар;1;0.2;0.0;10.3;42.4;200",
+        )
+        self.assertEqual(len(rows), 2)
+        with self.assertRaisesMessage(MenuDataError, "строка 3: «Нектар» — is_diet, kcal не как в"):
+            self._read(
+                "Меню №1;1;P;breakfast;НАПИТКИ;;Нектар;1;0.2;0.0;10.3;42.4;200",
+                "Меню №1;1;B;breakfast;НАПИТКИ;;Нектар;;0.2;0.0;10.3;84.0;200",
+            )
+
+    def test_import_export_round_trip(self):
+        lines = [
+            "Меню №1;1;B;breakfast;НАПИТКИ;;Нектар;1;0.2;0.0;10.3;42.4;200",
+            "Меню №1;1;B;breakfast;НАПИТКИ;1;Чай;;;;;;200",
+            "Меню №1;1;B;lunch;1-е БЛЮДА;;Суп;;2.1;3.0;7.5;68.0;250",
+            "Меню №1;1;P;breakfast;НАПИТКИ;;Нектар;1;0.2;0.0;10.3;42.4;200",
+            "Меню №1;2;P;dinner;2-е БЛЮДА;;Суп;;2.1;3.0;7.5;68.0;250",
+        ]
+        import_menus(self._read(*lines))
+
+        exported = [";".join(menu_row_values(row)) for _cycle, row in export_menu_rows()]
+        self.assertEqual(exported, lines)
+        again = import_menus(self._read(*exported))
+        self.assertFalse(again.items.changed)
+        self.assertEqual((again.dishes_created, again.dishes_updated, again.dishes_differing), (0, 0, []))
+
+
+class WaiterRowsTests(TestCase):
+    def test_overlapping_seats_count_guest_once(self):
+        menu = DailyMenu.objects.create(cycle=MenuCycle.objects.create(name="Меню №1"), day_index=1)
+        item = MenuItem.objects.create(
+            daily_menu=menu, meal_time="lunch", category="1-е БЛЮДА", dish=Dish.objects.create(name="Суп"),
+        )
+        target_date = date(2025, 12, 16)
+        guest = seed_guests(1, date(2025, 12, 15), date(2025, 12, 20), random.Random(1))[0]
+        # вторая посадка пересекается с первой (пересадка без закрытия старой)
+        SeatAssignment.objects.create(
+            guest_id=guest.id, table=DiningTable.objects.create(number=2), place_number=3,
+            start_date=target_date, end_date=date(2025, 12, 20),
+        )
+        order = Order.objects.create(guest_id=guest.id, date=target_date, meal_time="lunch")
+        OrderItem.objects.create(order=order, menu_item=item)
+
+        rows = waiter_rows_for_date(target_date, 1, 10)
+
+        self.assertEqual([(row.table_number, row.place_number) for row in rows], [(1, 1)])
+        kitchen = kitchen_rows_for_date(target_date)
+        self.assertEqual([(row.table_number, row.portions) for row in kitchen], [(1, 1)])
@@ -11,10 +11,12 @@ urlpatterns = [
     path("diet/seating/", views.seating_overview_view, name="seating_overview"),
     path("diet/seating/table/<int:table_number>/", views.table_detail_view, name="table_detail"),
     path("diet/missing/", views.missing_menu_view, name="missing_menu"),
+    path("diet/missing/counts/", views.missing_menu_counts_view, name="missing_menu_counts"),
     path("diet/seating/move/<int:guest_id>/", views.move_guest_view, name="move_guest"),
     path("diet/missing/fill/<str:diet_kind>/", views.missing_menu_fill_view, name="missing_menu_fill"),
     path("diet/menu-settings/", views.menu_settings_view, name="menu_settings"),
     path("diet/guests/", views.guest_list_view, name="guest_list"),
+    path("diet/guests/autocomplete/", views.guest_autocomplete_view, name="guest_autocomplete"),
     path("diet/guests/<int:guest_id>/meals/", views.guest_meals_edit_view, name="guest_meals_edit"),
     path("diet/guests/<int:guest_id>/departure/", views.guest_departure_edit_view, name="guest_departure_edit"),
     
@@ -42,6 +44,10 @@ urlpatterns = [
     # Отчёт для кухни (сразу печатная страница с выбором даты)
     path("kitchen/", views.kitchen_summary_view, name="kitchen_summary"),
     path("kitchen/summary/", views.kitchen_summary_view),  # необязательно
+    path("kitchen/production/", views.kitchen_production_view, name="kitchen_production"),
+
+    # Выгрузка отчётов (CSV / XLSX): kitchen или waiter
+    path("reports/<str:report>/export/", views.report_export_view, name="report_export"),
 
     # Отдыхающие
     path("guest/menu/", views.guest_menu_view, name="guest_menu"),
@@ -1,5 +1,3 @@
-import random
-import string
 import re   
 
 from urllib.parse import urlencode
@@ -11,12 +9,37 @@ from django.urls import reverse
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.db import transaction
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from datetime import date, datetime, time, timedelta
 from functools import wraps
 from django.db.models.deletion import ProtectedError
 
 
+from .access_codes import AccessCodePoolExhausted, reserved_access_codes
+from .exports import (
+    CONTENT_TYPES,
+    FORMAT_CSV,
+    FORMATS,
+    kitchen_export_rows,
+    stream_rows,
+    waiter_export_rows,
+)
+from .fill import fill_missing_orders, find_missing, missing_counts
+from .menu_calendar import calendar_menu_ids, rebuild_menu_calendar
+from .menu_cache import get_day_menus, get_menu_snapshot
+from .orders import save_orders
+from .reports import build_kitchen_summary, build_production_report
+from .rotation import cycle_and_day_for_date, invalidate_rotation_cache
+from .search import guest_search_ids, search_dishes
+from .seating import seat_for_guest, seat_map_for_date
+from .service_sheets import (
+    build_service_sheets,
+    get_service_sheet,
+    invalidate_service_sheets,
+    is_after_cutoff,
+    waiter_meal_blocks,
+)
 from .forms import (
     AddGuestForm,
     DishForm,
@@ -40,8 +63,8 @@ from .models import (
     OrderItem,
     MEAL_CHOICES,
     DIET_TYPE_CHOICES,
-    MEAL_TIMES,
     MenuRotationConfig,
+    ServiceSheet,
 )
 
 
@@ -128,6 +151,8 @@ def allowed_meals_for_guest_on_date(guest: Guest, target_date: date) -> dict[str
 
     ВАЖНО: lunch_allowed/dinner_allowed в день выезда НЕ ограничивают платные,
     иначе получится путаница. Решение: в выездной день смотрим только departure_*.
+
+    То же правило для запросов к базе — fill.meal_eligibility.
     """
     if target_date == guest.end_date:
         return {
@@ -143,182 +168,73 @@ def allowed_meals_for_guest_on_date(guest: Guest, target_date: date) -> dict[str
     }
 
 
-def get_daily_menu_for_date_and_diet(target_date: date, diet_kind: str) -> DailyMenu | None:
-    """Получаем дневное меню (DailyMenu) на дату и диету."""
-    cycle, day_index = get_cycle_and_day_for_date(target_date)
-    if not cycle:
-        return None
-    return DailyMenu.objects.filter(cycle=cycle, day_index=day_index, diet_kind=diet_kind).first()
-
-def build_meal_blocks_from_daily_menu(daily_menu: DailyMenu):
-    """
-    Строит структуру meal_blocks для работы и в missing_menu_view, и в missing_menu_fill_view.
-
-    Возвращает список:
-    [
-      {
-        "code": "breakfast",
-        "label": "Завтрак",
-        "time": "08:00" или None,
-        "categories": [
-            { "key": "breakfast_cat_0", "category": "НАПИТКИ", "items": [MenuItem,...] },
-            { "key": "breakfast_cat_1", "category": "ЗАКУСКИ", "items": [...] },
-            ...
-        ]
-      },
-      ...
-    ]
-    """
-    meal_blocks = []
-
-    for meal_code, meal_label in MEAL_CHOICES:
-        # Берём все позиции этого приёма пищи
-        items = list(
-            daily_menu.items
-            .filter(meal_time=meal_code)
-            .select_related("dish")
-            .order_by("order_index", "id")
-        )
-        if not items:
-            continue
-
-        # Группируем по category
-        cat_map: dict[str, list[MenuItem]] = {}
-        for it in items:
-            cat = it.category or ""
-            cat_map.setdefault(cat, []).append(it)
-
-        # Собираем категории в нужном порядке (НАПИТКИ, ЗАКУСКИ, 1-е, 2-е, ДОПОЛНИТЕЛЬНО)
-        categories = []
-        idx = 0
-        for cat_name, cat_items in sorted(
-            cat_map.items(), key=lambda kv: category_sort_key(kv[0])
-        ):
-            key = f"{meal_code}_cat_{idx}"
-            categories.append({
-                "key": key,
-                "category": cat_name,
-                "items": cat_items,
-            })
-            idx += 1
-
-        meal_blocks.append({
-            "code": meal_code,
-            "label": meal_label,
-            "time": MEAL_TIMES.get(meal_code),
-            "categories": categories,
-        })
-
-    return meal_blocks
-
-def required_keys_and_meals(meal_blocks):
-    """
-    Определяем:
-    - required_keys: какие radio-поля обязательны (где есть выборные блюда is_common=False)
-    - required_meals: какие meal_code вообще требуют заказа (есть хотя бы один is_common=False)
-    """
-    required_keys = set()
-    required_meals = set()
-
-    for meal in meal_blocks:
-        meal_code = meal["code"]
-        for cat in meal["categories"]:
-            if any(not it.is_common for it in cat["items"]):
-                required_keys.add(cat["key"])
-                required_meals.add(meal_code)
-
-    return required_keys, required_meals
-
-
-def orders_items_count_map_for_date(target_date: date, guests_qs):
-    """
-    Карта: (guest_id, meal_time) -> количество позиций в заказе (OrderItem).
-    Если заказ есть, но items=0 — считаем как 0 (то есть меню не выбрано).
-    """
-    m = {}
-    rows = (
-        Order.objects
-        .filter(date=target_date, guest__in=guests_qs)
-        .values("guest_id", "meal_time")
-        .annotate(cnt=Count("items"))
-    )
-    for r in rows:
-        m[(r["guest_id"], r["meal_time"])] = int(r["cnt"] or 0)
-    return m
-
 def get_cycle_and_day_for_date(target_date: date):
     """
     Возвращает (cycle, day_index) для заданной даты.
 
     Логика:
     - есть несколько циклов MenuCycle (обычно 2: Меню №1 и Меню №2), days_count = 7;
-    - считаем, какой это номер недели от BASE_MENU_CYCLE_DATE;
+    - считаем, какой это номер недели от базовой даты (MenuRotationConfig.base_date);
     - по чётности недели выбираем нужный цикл;
     - day_index = день недели (1 - понедельник, 7 - воскресенье).
 
     Если в базе всего один MenuCycle — используем его, как раньше.
+    Циклы и настройки берутся из кэша процесса (см. rotation.py).
     """
-    cycles = list(MenuCycle.objects.order_by("id"))
-    if not cycles:
-        return None, None
-
-    # день недели 1..7
-    day_index = target_date.weekday() + 1
-
-    cfg = get_menu_rotation_config()
+    return cycle_and_day_for_date(target_date)
 
-    # Если диетсестра принудительно выбрала цикл — всегда используем его
-    if cfg.forced_cycle_id:
-        cycle = cfg.forced_cycle
-        if cycle and cycle.days_count and day_index > cycle.days_count:
-            day_index = cycle.days_count
-        return cycle, day_index
-
-    # иначе — автоматическое чередование от cfg.base_date
-    base_date = cfg.base_date
-    days_diff = (target_date - base_date).days
-    week_index = days_diff // 7
-    cycle = cycles[week_index % len(cycles)]
-
-    if cycle.days_count and day_index > cycle.days_count:
-        day_index = cycle.days_count
-
-    return cycle, day_index
-
-    # Если циклов 2 и более — чередуем по неделям
-    days_diff = (target_date - BASE_MENU_CYCLE_DATE).days
-    week_index = days_diff // 7  # номер недели от базы (может быть отрицательным)
+def parse_waiter_tables(request) -> tuple[int | None, int, int]:
+    """
+    (официант, стол с, стол по) из GET-параметров waiter / table_from / table_to.
+    Номер официанта задаёт диапазон из WAITER_RANGES, иначе берутся table_from..table_to.
+    """
+    waiter_str = request.GET.get("waiter") or ""
+    table_from_str = request.GET.get("table_from") or ""
+    table_to_str = request.GET.get("table_to") or ""
 
-    cycle_index = week_index % len(cycles)
-    cycle = cycles[cycle_index]
+    waiter_num = None
+    if waiter_str:
+        try:
+            waiter_num = int(waiter_str)
+        except ValueError:
+            waiter_num = None
 
-    if cycle.days_count and day_index > cycle.days_count:
-        day_index = cycle.days_count
+    # Фильтр по столам
+    if waiter_num in WAITER_RANGES:
+        table_from, table_to = WAITER_RANGES[waiter_num]
+    else:
+        try:
+            table_from = int(table_from_str) if table_from_str else 1
+        except ValueError:
+            table_from = 1
+        try:
+            table_to = int(table_to_str) if table_to_str else MAX_TABLE_NUMBER
+        except ValueError:
+            table_to = MAX_TABLE_NUMBER
 
-    return cycle, day_index
+    return waiter_num, max(1, table_from), min(MAX_TABLE_NUMBER, table_to)
 
-def generate_access_code(length: int = 4) -> str:
-    """Простой генератор цифрового кода доступа."""
-    digits = string.digits
-    return "".join(random.choice(digits) for _ in range(length))
 
+def parse_date_range(request, default_days: int, max_days: int) -> tuple[date, date]:
+    """
+    Диапазон дат из GET-параметров date_from (по умолчанию — завтра)
+    и days (сколько дней, 1..max_days).
+    """
+    default_from = date.today() + timedelta(days=1)
 
-def generate_unique_access_code(length: int = 4) -> str:
-    """Генератор кода, который не повторяется среди текущих гостей."""
-    while True:
-        code = generate_access_code(length)
-        if not Guest.objects.filter(access_code=code).exists():
-            return code
+    try:
+        date_from = date.fromisoformat(request.GET.get("date_from") or "")
+    except ValueError:
+        date_from = default_from
 
+    try:
+        days_count = int(request.GET.get("days") or default_days)
+    except ValueError:
+        days_count = default_days
+    days_count = max(1, min(max_days, days_count))
 
-def cleanup_departed_guests():
-    """Удаляем гостей, у которых дата выезда уже прошла."""
-    today = timezone.localdate()
+    return date_from, date_from + timedelta(days=days_count - 1)
 
-    departed = Guest.objects.filter(end_date__lt=today)
-    if departed.exists():
-        departed.delete()   # каскадно удалит и SeatAssignment
-    # ничего не возвращаем, функция просто чистит данные
 
 def guest_required(view_func):
     """Простой декоратор: проверяет, что в сессии есть авторизованный гость."""
@@ -337,6 +253,22 @@ def guest_required(view_func):
     return _wrapped
 
 
+def atomic_post(view_func):
+    """
+    transaction.atomic только для изменяющих запросов. В SQLite транзакция
+    сразу берёт блокировку на запись (BEGIN IMMEDIATE, см. settings.DATABASES),
+    поэтому страницы, открытые GET, в транзакцию не оборачиваем — иначе они
+    ждали бы записи заказов.
+    """
+    @wraps(view_func)
+    def _wrapped(request, *args, **kwargs):
+        if request.method in ("GET", "HEAD"):
+            return view_func(request, *args, **kwargs)
+        with transaction.atomic():
+            return view_func(request, *args, **kwargs)
+    return _wrapped
+
+
 def ensure_menu_cycles_exist():
     """Убедиться, что есть два 7-дневных меню: Меню №1 и Меню №2."""
     if MenuCycle.objects.count() == 0:
@@ -346,7 +278,12 @@ def ensure_menu_cycles_exist():
                 MenuCycle(name="Меню №2", days_count=7),
             ]
         )
-    
+        # bulk_create не посылает post_save: сбрасываем запомненное
+        # чередование и строим календарь сами (он же сбросит кэш меню)
+        invalidate_rotation_cache()
+        rebuild_menu_calendar()
+
+
 def get_active_menu_target(now: datetime):
     """
     Возвращает (target_date, window_start, window_end) или (None, None, None),
@@ -384,7 +321,6 @@ def diet_home_view(request):
     """
     Кабинет диетсестры.
     """
-    cleanup_departed_guests()
     ensure_menu_cycles_exist()
     return render(request, "dining/home.html")
 
@@ -394,8 +330,6 @@ def seating_overview_view(request):
     Обзор рассадки на выбранную дату:
     показывает какие столы заняты/свободны.
     """
-    cleanup_departed_guests()
-
     target_date = timezone.localdate()  
 
     # Все посадки, актуальные на дату
@@ -450,14 +384,12 @@ def seating_overview_view(request):
 
 
 @login_required
-@transaction.atomic
+@atomic_post
 def table_detail_view(request, table_number: int):
     """
     Детальная страница стола: кто на каких местах на выбранную дату
     + возможность добавить отдыхающего сразу на этот стол.
     """
-    cleanup_departed_guests()
-
     target_date = timezone.localdate()  # ВСЕГДА сегодня
 
 
@@ -499,34 +431,37 @@ def table_detail_view(request, table_number: int):
                 if not table:
                     table = DiningTable.objects.create(number=table_number, places_count=4)
 
-                access_code = generate_unique_access_code(4)
-
-                guest = Guest.objects.create(
-                    full_name=full_name,
-                    start_date=target_date,
-                    end_date=end_date,
-                    access_code=access_code,
-                    diet_kind=diet_kind,
-                    # Приёмы пищи
-                    breakfast_allowed=True,
-                    lunch_allowed=True,
-                    snack_allowed=False,
-                    dinner_allowed=True,
-                    # Платный выезд
-                    departure_lunch=form.cleaned_data.get("departure_lunch", False),
-                    departure_dinner=form.cleaned_data.get("departure_dinner", False),
-                )
-
-                SeatAssignment.objects.create(
-                    guest=guest,
-                    table=table,
-                    place_number=place_number,
-                    start_date=target_date,
-                    end_date=end_date,
-                )
+                try:
+                    # код выдаётся в одной транзакции с созданием гостя
+                    with reserved_access_codes(1) as (access_code,):
+                        guest = Guest.objects.create(
+                            full_name=full_name,
+                            start_date=target_date,
+                            end_date=end_date,
+                            access_code=access_code,
+                            diet_kind=diet_kind,
+                            # Приёмы пищи
+                            breakfast_allowed=True,
+                            lunch_allowed=True,
+                            snack_allowed=False,
+                            dinner_allowed=True,
+                            # Платный выезд
+                            departure_lunch=form.cleaned_data.get("departure_lunch", False),
+                            departure_dinner=form.cleaned_data.get("departure_dinner", False),
+                        )
 
-                messages.success(request, f"Отдыхающий добавлен. Код доступа: {access_code}")
-                return redirect(reverse('table_detail', args=[table_number]))
+                        SeatAssignment.objects.create(
+                            guest=guest,
+                            table=table,
+                            place_number=place_number,
+                            start_date=target_date,
+                            end_date=end_date,
+                        )
+                except AccessCodePoolExhausted as exc:
+                    form.add_error(None, str(exc))
+                else:
+                    messages.success(request, f"Отдыхающий добавлен. Код доступа: {access_code}")
+                    return redirect(reverse('table_detail', args=[table_number]))
 
         # если не валидно — покажем ошибки внизу
         add_form = form
@@ -556,7 +491,6 @@ def landing_view(request):
     - ссылка для входа сотрудника (диетсестра/официант) по логину/паролю,
     - форма входа отдыхающего по коду.
     """
-    cleanup_departed_guests()
     ensure_menu_cycles_exist()
 
     now = timezone.localtime()
@@ -593,15 +527,13 @@ def landing_view(request):
 
 
 @login_required
-@transaction.atomic
+@atomic_post
 def add_guest_view(request):
     """
     Страница для диетсестры:
     - ввод ФИО, ДАТЫ ВЫЕЗДА, стола и места
     - создание гостя, посадки и кода доступа
     """
-    cleanup_departed_guests()   # перед каждой операцией освобождаем уехавших
-
     if request.method == "POST":
         form = AddGuestForm(request.POST)
         if form.is_valid():
@@ -634,41 +566,44 @@ def add_guest_view(request):
                     f"Стол №{table_number}, место {place_number} уже занято в этот период.",
                 )
             else:
-                access_code = generate_unique_access_code(4)
-
-                guest = Guest.objects.create(
-                    full_name=full_name,
-                    start_date=start_date,
-                    end_date=end_date,
-                    access_code=access_code,
-                    diet_kind=diet_kind,
-                    # Приёмы пищи
-                    breakfast_allowed=form.cleaned_data.get("breakfast_allowed", True),
-                    lunch_allowed=form.cleaned_data.get("lunch_allowed", True),
-                    snack_allowed=False,  # скрыто
-                    dinner_allowed=form.cleaned_data.get("dinner_allowed", True),
-                    # Платный выезд
-                    departure_lunch=form.cleaned_data.get("departure_lunch", False),
-                    departure_dinner=form.cleaned_data.get("departure_dinner", False),
-                )
-
-                SeatAssignment.objects.create(
-                    guest=guest,
-                    table=table,
-                    place_number=place_number,
-                    start_date=start_date,
-                    end_date=end_date,
-                )
+                try:
+                    # код выдаётся в одной транзакции с созданием гостя
+                    with reserved_access_codes(1) as (access_code,):
+                        guest = Guest.objects.create(
+                            full_name=full_name,
+                            start_date=start_date,
+                            end_date=end_date,
+                            access_code=access_code,
+                            diet_kind=diet_kind,
+                            # Приёмы пищи
+                            breakfast_allowed=form.cleaned_data.get("breakfast_allowed", True),
+                            lunch_allowed=form.cleaned_data.get("lunch_allowed", True),
+                            snack_allowed=False,  # скрыто
+                            dinner_allowed=form.cleaned_data.get("dinner_allowed", True),
+                            # Платный выезд
+                            departure_lunch=form.cleaned_data.get("departure_lunch", False),
+                            departure_dinner=form.cleaned_data.get("departure_dinner", False),
+                        )
 
-                return render(
-                    request,
-                    "dining/guest_created.html",
-                    {
-                        "guest": guest,
-                        "table": table,
-                        "place_numbe    r": place_number,
-                    },
-                )
+                        SeatAssignment.objects.create(
+                            guest=guest,
+                            table=table,
+                            place_number=place_number,
+                            start_date=start_date,
+                            end_date=end_date,
+                        )
+                except AccessCodePoolExhausted as exc:
+                    form.add_error(None, str(exc))
+                else:
+                    return render(
+                        request,
+                        "dining/guest_created.html",
+                        {
+                            "guest": guest,
+                            "table": table,
+                            "place_numbe    r": place_number,
+                        },
+                    )
     else:
         form = AddGuestForm()
 
@@ -684,27 +619,16 @@ def dish_list_view(request):
     """
     q = (request.GET.get("q") or "").strip()
 
-    dishes_qs = Dish.objects.all()
-
-    if q:
-        # Поиск без учёта регистра (для кириллицы в SQLite — через разные варианты)
-        q_clean = q.lower()
-        dishes_qs = dishes_qs.filter(
-            Q(name__contains=q_clean) |
-            Q(name__contains=q_clean.capitalize()) |
-            Q(name__contains=q_clean.upper())
-        )
-
-    dishes_qs = dishes_qs.order_by("name")
-    count = dishes_qs.count()
+    # без учёта регистра, с ранжированием, по названию и названию для кухни
+    dishes = search_dishes(q)
 
     return render(
         request,
         "dining/dish_list.html",
         {
-            "dishes": list(dishes_qs),
+            "dishes": dishes,
             "q": q,
-            "count": count,
+            "count": len(dishes),
         },
     )
 
@@ -761,6 +685,11 @@ def daily_menu_select_view(request):
                     "error": "Не найдено меню (MenuCycle). Создайте Меню №1 и Меню №2.",
                 })
 
+            # разовая замена в календаре меню — редактируем то меню, что подаётся в эту дату
+            calendar_menu_id = calendar_menu_ids(selected_date).get(diet_kind)
+            if calendar_menu_id:
+                return redirect("daily_menu_edit", menu_id=calendar_menu_id)
+
             daily_menu, _ = DailyMenu.objects.get_or_create(
                 cycle=cycle,
                 day_index=day_index,
@@ -793,7 +722,7 @@ def daily_menu_edit_view(request, menu_id: int):
     daily_menu = get_object_or_404(DailyMenu, id=menu_id)
     # сортируем приёмы пищи в порядке: завтрак, обед, полдник, ужин
     meal_order = {code: idx for idx, (code, _label) in enumerate(MEAL_CHOICES)}
-    items_qs = daily_menu.items.select_related("dish").all()
+    items_qs = daily_menu.items.filter(is_active=True).select_related("dish")
     items = sorted(
         items_qs,
         key=lambda i: (meal_order.get(i.meal_time, 99), i.order_index, -i.id),
@@ -828,6 +757,7 @@ def daily_menu_edit_view(request, menu_id: int):
                     daily_menu=daily_menu,
                     meal_time=item.meal_time,
                     category=item.category,
+                    is_active=True,
                 ).order_by("order_index", "id")
 
                 same_list = list(same_group)
@@ -913,7 +843,7 @@ from django.db.models import Count  # вверху файла, рядом с Q
 # ...
 
 @login_required
-@transaction.atomic
+@atomic_post
 def dish_delete_view(request, dish_id):
     """
     Удаление блюда из справочника.
@@ -944,6 +874,9 @@ def dish_delete_view(request, dish_id):
         # 4) Чистим заказы, в которых не осталось ни одной позиции
         Order.objects.annotate(cnt=Count("items")).filter(cnt=0).delete()
 
+        # 5) Готовые отчёты считали это блюдо (сигналы post_save удаление не ловят)
+        invalidate_service_sheets(date_from=timezone.localdate())
+
         messages.success(
             request,
             f"Блюдо «{name}» и все его позиции в меню/заказах удалены."
@@ -956,7 +889,15 @@ def dish_delete_view(request, dish_id):
 def menu_item_delete_view(request, item_id: int):
     item = get_object_or_404(MenuItem, id=item_id)
     menu_id = item.daily_menu_id
-    item.delete()
+    if OrderItem.objects.filter(menu_item=item).exists():
+        # на позицию есть заказы — удалить нельзя, снимаем с меню (см. menu_sync.py)
+        item.is_active = False
+        item.order_index = 0
+        item.save(update_fields=["is_active", "order_index"])
+    else:
+        item.delete()
+        # позиция могла попасть в готовые отчёты (раздел меню, порядок)
+        invalidate_service_sheets(date_from=timezone.localdate())
     return redirect("daily_menu_edit", menu_id=menu_id)
 
 @guest_required
@@ -1009,15 +950,9 @@ def guest_menu_view(request):
     cutoff_date = window_end.date()
     can_edit = True  # если мы здесь, мы внутри окна выбора
 
-    # Определяем цикл и день цикла для target_date
-    cycle, day_index = get_cycle_and_day_for_date(target_date)
-    daily_menu = None
-    if cycle:
-        qs = DailyMenu.objects.filter(cycle=cycle, day_index=day_index)
-        if qs.filter(diet_kind=guest.diet_kind).exists():
-            daily_menu = qs.filter(diet_kind=guest.diet_kind).first()
-        else:
-            daily_menu = qs.first()
+    # Меню на target_date для диеты гостя — общий для всех гостей снимок из кэша
+    snapshot = get_menu_snapshot(target_date, guest.diet_kind)
+    daily_menu = snapshot.daily_menu
 
     if not daily_menu:
         return render(
@@ -1036,17 +971,6 @@ def guest_menu_view(request):
             },
         )
 
-    # --- Группируем позиции меню по приёмам пищи и разделам ---
-    items_by_meal = {code: {} for code, _ in MEAL_CHOICES}
-    for item in daily_menu.items.select_related("dish"):
-        if item.meal_time not in items_by_meal:
-            continue  # старые snack и т.п.
-        meal_dict = items_by_meal[item.meal_time]
-        category = item.category or ""
-        if category not in meal_dict:
-            meal_dict[category] = []
-        meal_dict[category].append(item)
-
     # --- Уже сохранённый выбор гостя на эту дату ---
     existing_orders = (
         Order.objects.filter(guest=guest, date=target_date)
@@ -1091,35 +1015,23 @@ def guest_menu_view(request):
         if not can_edit:
             return redirect("guest_menu")
 
-        # Для каждого приёма пищи проверим, есть ли вообще выборные блюда
-        has_choice_for_meal = {}
-        for meal_code, _label in MEAL_CHOICES:
-            meal_categories = items_by_meal.get(meal_code, {})
-            has_choice_for_meal[meal_code] = any(
-                any(not it.is_common for it in items)
-                for items in meal_categories.values()
-            )
-
         per_meal_selected_ids: dict[str, list[int]] = {}
         validation_errors = []
 
-        for meal_code, _label in MEAL_CHOICES:
-            meal_categories = items_by_meal.get(meal_code, {})
+        for meal in snapshot.meals:
+            meal_code = meal.code
             selected_ids: list[int] = []
 
-            # порядок категорий должен совпадать с тем, как мы их рисуем
-            for idx, (category, items) in enumerate(
-                sorted(meal_categories.items(), key=lambda kv: category_sort_key(kv[0]))
-            ):
-                field_name = f"{meal_code}_cat_{idx}"
-                value = request.POST.get(field_name)
+            # ключи полей (meal_cat_idx) — те же, что при отрисовке
+            for cat in meal.categories:
+                value = request.POST.get(cat.key)
                 if not value:
                     continue
                 try:
                     mid = int(value)
                 except ValueError:
                     continue
-                if any(it.id == mid for it in items):
+                if any(it.id == mid for it in cat.items):
                     selected_ids.append(mid)
 
             per_meal_selected_ids[meal_code] = selected_ids
@@ -1128,7 +1040,7 @@ def guest_menu_view(request):
             # то нужно выбрать хотя бы одно блюдо.
             if (
                 meal_code in allowed_meal_times
-                and has_choice_for_meal.get(meal_code)
+                and meal.has_choices
                 and not selected_ids
             ):
                 validation_errors.append(
@@ -1139,25 +1051,11 @@ def guest_menu_view(request):
             # Не сохраняем, просто показываем ошибку
             form_error = " ".join(validation_errors)
         else:
-            # Сохраняем выбор
-            for meal_code, _label in MEAL_CHOICES:
-                selected_ids = per_meal_selected_ids.get(meal_code, [])
-                if selected_ids:
-                    order, _ = Order.objects.get_or_create(
-                        guest=guest,
-                        date=target_date,
-                        meal_time=meal_code,
-                    )
-                    order.items.all().delete()
-                    OrderItem.objects.bulk_create(
-                        [OrderItem(order=order, menu_item_id=mid) for mid in selected_ids]
-                    )
-                else:
-                    Order.objects.filter(
-                        guest=guest,
-                        date=target_date,
-                        meal_time=meal_code,
-                    ).delete()
+            # Сохраняем выбор на весь день одной транзакцией
+            save_orders(target_date, {
+                (guest.id, meal_code): per_meal_selected_ids.get(meal_code, [])
+                for meal_code, _label in MEAL_CHOICES
+            })
 
             # Автоматический выход гостя после сохранения
             request.session.pop("guest_id", None)
@@ -1172,39 +1070,30 @@ def guest_menu_view(request):
         allowed_meals_display = ["Завтрак"]
 
     meal_blocks = []
-    for code, label in MEAL_CHOICES:
+    for meal in snapshot.meals:
         # Пропускаем запрещённые приёмы пищи
-        if code not in allowed_meal_times:
-            continue
-
-        meal_categories = items_by_meal.get(code, {})
-        if not meal_categories:
+        if meal.code not in allowed_meal_times:
             continue
 
-        category_blocks = []
-        # сортируем разделы (НАПИТКИ, ЗАКУСКИ, 1-е, 2-е, ДОПОЛНИТЕЛЬНО)
-        for idx, (category, items) in enumerate(
-            sorted(meal_categories.items(), key=lambda kv: category_sort_key(kv[0]))
-        ):
-            field_name = f"{code}_cat_{idx}"
-            selected_id = selected_by_mealcat.get((code, category))
-            category_blocks.append(
-                {
-                    "key": field_name,
-                    "category": category,
-                    "items": items,
-                    "selected_id": selected_id,
-                    # есть ли в этом разделе выборные (не is_common) блюда
-                    "has_choices": any(not it.is_common for it in items),
-                }
-            )
+        # разделы в снимке уже отсортированы (НАПИТКИ, ЗАКУСКИ, 1-е, 2-е, ДОПОЛНИТЕЛЬНО)
+        category_blocks = [
+            {
+                "key": cat.key,
+                "category": cat.category,
+                "items": cat.items,
+                "selected_id": selected_by_mealcat.get((meal.code, cat.category)),
+                # есть ли в этом разделе выборные (не is_common) блюда
+                "has_choices": cat.has_choices,
+            }
+            for cat in meal.categories
+        ]
 
         if category_blocks:
             meal_blocks.append(
                 {
-                    "code": code,
-                    "label": label,
-                    "time": MEAL_TIMES.get(code),
+                    "code": meal.code,
+                    "label": meal.label,
+                    "time": meal.time,
                     "categories": category_blocks,
                 }
             )
@@ -1233,12 +1122,11 @@ def waiter_overview_view(request):
     - по дате и приёму пищи показывает, какие блюда нести на какие столы/места;
     - можно фильтровать по блюду и по официанту (диапазон столов).
     """
-    cleanup_departed_guests()
-
     today = date.today()
     default_date = today + timedelta(days=1)
 
     date_str = request.GET.get("date") or default_date.isoformat()
+    meal_time = request.GET.get("meal_time") or ""
     allowed_meals = [code for code, _ in MEAL_CHOICES]
     if meal_time not in allowed_meals:
         meal_time = allowed_meals[0]
@@ -1259,9 +1147,9 @@ def waiter_overview_view(request):
 
     orders = (
         Order.objects.filter(date=selected_date, meal_time=meal_time)
-        .select_related("guest")
-        .prefetch_related("items__menu_item__dish", "guest__seat_assignments__table")
+        .prefetch_related("items__menu_item__dish")
     )
+    seats = seat_map_for_date(selected_date, request)
 
     table_map: dict[int, dict[int, list]] = {}  # стол -> место -> [Dish,...]
     all_dishes_set = set()
@@ -1274,14 +1162,8 @@ def waiter_overview_view(request):
             dish_filter_id = None
 
     for order in orders:
-        guest = order.guest
-
-        # ищем актуальное место за столом на эту дату
-        seat = None
-        for s in guest.seat_assignments.all():
-            if s.start_date <= selected_date <= s.end_date:
-                seat = s
-                break
+        # актуальное место за столом на эту дату
+        seat = seats.get(order.guest_id)
         if not seat:
             continue
 
@@ -1298,11 +1180,8 @@ def waiter_overview_view(request):
             if not dishes:
                 continue
 
-        table_no = seat.table.number
-        place_no = seat.place_number
-
-        table_entry = table_map.setdefault(table_no, {})
-        place_entry = table_entry.setdefault(place_no, [])
+        table_entry = table_map.setdefault(seat.table_number, {})
+        place_entry = table_entry.setdefault(seat.place_number, [])
         place_entry.extend(dishes)
 
     # фильтр по официанту (диапазон столов)
@@ -1336,186 +1215,20 @@ def waiter_print_compact_view(request):
     Печать для официантов:
     Структура: ПРИЁМ ПИЩИ -> РАЗДЕЛ (Категория) -> БЛЮДО (короткое имя) -> ИТОГО -> СТОЛЫ
     """
-    cleanup_departed_guests()
-
     today = date.today()
     default_date = today + timedelta(days=1)
 
     date_str = request.GET.get("date") or default_date.isoformat()
-    waiter_str = request.GET.get("waiter") or ""
-    table_from_str = request.GET.get("table_from") or ""
-    table_to_str = request.GET.get("table_to") or ""
 
     try:
         selected_date = date.fromisoformat(date_str)
     except ValueError:
         selected_date = default_date
 
-    waiter_num = None
-    if waiter_str:
-        try:
-            waiter_num = int(waiter_str)
-        except ValueError:
-            waiter_num = None
-
-    # Фильтр по столам
-    if waiter_num in WAITER_RANGES:
-        table_from, table_to = WAITER_RANGES[waiter_num]
-    else:
-        try:
-            table_from = int(table_from_str) if table_from_str else 1
-        except ValueError:
-            table_from = 1
-        try:
-            table_to = int(table_to_str) if table_to_str else MAX_TABLE_NUMBER
-        except ValueError:
-            table_to = MAX_TABLE_NUMBER
-
-    table_from = max(1, table_from)
-    table_to = min(MAX_TABLE_NUMBER, table_to)
-
-    # 1. Получаем все заказы
-    orders = (
-        Order.objects.filter(date=selected_date)
-        .select_related("guest")
-        .prefetch_related(
-            "items__menu_item__dish", 
-            "guest__seat_assignments__table"
-        )
-    )
-
-    # 2. Структура для агрегации:
-    # aggregated[meal_code][category_name][dish_id] = {
-    #    'dish': dish_obj,
-    #    'order_index': int (для сортировки внутри категории),
-    #    'total': int,
-    #    'tables': { table_num: [place_num, ...] }
-    # }
-    aggregated = {code: {} for code, _ in MEAL_CHOICES}
-
-    # Вспомогательный словарь для порядка категорий: { (meal, category): min_id }
-    # Мы будем сортировать категории по тому, как рано они встречаются в базе (приблизительно)
-    # или можно просто по алфавиту. Попробуем сохранять порядок добавления.
-    
-    for order in orders:
-        guest = order.guest
-        
-        # Определяем стол
-        seat = None
-        for s in guest.seat_assignments.all():
-            if s.start_date <= selected_date <= s.end_date:
-                seat = s
-                break
-        if not seat:
-            continue
-
-        table_no = seat.table.number
-        place_no = seat.place_number
-
-        # Фильтр столов
-        if not (table_from <= table_no <= table_to):
-            continue
-
-        meal_dict = aggregated.setdefault(order.meal_time, {})
+    waiter_num, table_from, table_to = parse_waiter_tables(request)
 
-        for oi in order.items.all():
-            dish = oi.menu_item.dish
-            # Категория из MenuItem. Если нет - "Разное"
-            cat_name = oi.menu_item.category.strip() if oi.menu_item.category else "—"
-            
-            cat_dict = meal_dict.setdefault(cat_name, {})
-            
-            dish_entry = cat_dict.setdefault(dish.id, {
-                "dish": dish,
-                "order_index": oi.menu_item.order_index, # сохраняем порядок из меню
-                "total": 0,
-                "tables": {}
-            })
-
-            table_places = dish_entry["tables"].setdefault(table_no, set())
-            
-            # Увеличиваем счетчик, только если это место еще не посчитано для этого блюда
-            # (защита от дублей, если вдруг в базе сбой, хотя unique protect)
-            if place_no not in table_places:
-                table_places.add(place_no)
-                dish_entry["total"] += 1
-
-    # 3. Преобразуем в список для шаблона
-    # meal_blocks = [ { 'meal_label': ..., 'categories': [ { 'name': ..., 'dishes': [...] } ] } ]
-    
-    meal_blocks = []
-    
-    # Порядок категорий: ЗАКУСКИ, 1-е, 2-е... 
-    # Эвристика: сортируем категории по минимальному order_index входящих в них блюд
-    
-    for code, label in MEAL_CHOICES:
-        cats_data = aggregated.get(code, {})
-        if not cats_data:
-            continue
-
-        # Сортируем категории. 
-        # Чтобы "ЗАКУСКИ" были раньше "2-е БЛЮДА", найдем минимальный order_index в каждой категории
-        def get_cat_sort_key(cat_item):
-            name, dishes_map = cat_item
-            # берем минимальный order_index среди блюд этой категории
-            if not dishes_map: return 999
-            return min(d['order_index'] for d in dishes_map.values())
-
-        sorted_cats = sorted(cats_data.items(), key=get_cat_sort_key)
-        
-        categories_list = []
-        for cat_name, dishes_map in sorted_cats:
-            # Сортируем блюда внутри категории (по order_index, затем по имени)
-            sorted_dishes = sorted(
-                dishes_map.values(),
-                key=lambda x: (x["order_index"], x["dish"].name)
-            )
-
-            # Список полных названий (со скобками) для поиска общего префикса
-            full_names = [entry["dish"].name for entry in sorted_dishes]
-            prefix = common_word_prefix(full_names)
-
-            rows = []
-            for entry in sorted_dishes:
-                dish = entry["dish"]
-                base_name = dish.name  # показываем полное название, включая скобки
-
-                if prefix and base_name.startswith(prefix):
-                    # Отрезаем общий префикс
-                    display_name = base_name[len(prefix):].lstrip()
-                    # убираем ведущую запятую, если она сразу после префикса
-                    if display_name.startswith(","):
-                        display_name = display_name[1:].lstrip()
-                else:
-                    display_name = base_name
-
-                # Формируем строку столов: "1(1,2); 5(3)"
-                tables_data = []
-                for t_no in sorted(entry["tables"].keys()):
-                    places = sorted(entry["tables"][t_no])
-                    places_str = ",".join(str(p) for p in places)
-                    tables_data.append({
-                        "number": t_no,
-                        "formatted": f"{t_no}({places_str})",
-                    })
-
-                rows.append({
-                    "dish_name": display_name,
-                    "total": entry["total"],
-                    "tables_data": tables_data,
-                    "tables_str": "; ".join([t["formatted"] for t in tables_data]),
-                })
-
-            categories_list.append({
-                "name": cat_name,
-                "rows": rows,
-            })
-
-        meal_blocks.append({
-            "meal_code": code,
-            "meal_label": label,
-            "categories": categories_list,
-        })
+    # После закрытия окна выбора — готовая раскладка (одно чтение)
+    meal_blocks = waiter_meal_blocks(selected_date, table_from, table_to, waiter_num)
 
     return render(
         request,
@@ -1529,278 +1242,119 @@ def waiter_print_compact_view(request):
             "meal_blocks": meal_blocks,
         },
     )
-    """
-    Компактная печать для официантов:
-    ПРИЁМ ПИЩИ -> БЛЮДО -> КОЛ-ВО -> СТОЛЫ(места)
 
-    Формат: Суп — 3 — 50(1,2,3); 72(1,4)
+@login_required
+def kitchen_summary_view(request):
+    """
+    Отчёт для кухни:
+    - по выбранной дате показывает, сколько порций каждого блюда заказано,
+      с разбивкой по приёмам пищи и по столам.
     """
-    cleanup_departed_guests()
-
     today = date.today()
-    default_date = today + timedelta(days=1)
+    default_date = today + timedelta(days=1)  # по умолчанию — завтра
 
     date_str = request.GET.get("date") or default_date.isoformat()
-    waiter_str = request.GET.get("waiter") or ""
-    table_from_str = request.GET.get("table_from") or ""
-    table_to_str = request.GET.get("table_to") or ""
-
     try:
         selected_date = date.fromisoformat(date_str)
     except ValueError:
         selected_date = default_date
 
-    waiter_num = None
-    if waiter_str:
-        try:
-            waiter_num = int(waiter_str)
-        except ValueError:
-            waiter_num = None
-
-    # диапазон столов
-    if waiter_num in WAITER_RANGES:
-        table_from, table_to = WAITER_RANGES[waiter_num]
+    # После закрытия окна выбора — готовая сводка (одно чтение)
+    if is_after_cutoff(selected_date):
+        summary = get_service_sheet(selected_date, ServiceSheet.KIND_KITCHEN)
     else:
-        try:
-            table_from = int(table_from_str) if table_from_str else 1
-        except ValueError:
-            table_from = 1
-        try:
-            table_to = int(table_to_str) if table_to_str else MAX_TABLE_NUMBER
-        except ValueError:
-            table_to = MAX_TABLE_NUMBER
+        summary = build_kitchen_summary(selected_date)
 
-    table_from = max(1, table_from)
-    table_to = min(MAX_TABLE_NUMBER, table_to)
+    dishes_summary = summary["dishes_summary"]
+    all_tables = summary["all_tables"]
+    meal_labels = dict(MEAL_CHOICES)
 
-    orders = (
-        Order.objects.filter(date=selected_date)
-        .select_related("guest")
-        .prefetch_related("items__menu_item__dish", "guest__seat_assignments__table")
-    )
+    context = {
+        "selected_date": selected_date,
+        "dishes_summary": dishes_summary,
+        "all_tables": all_tables,
+        "meal_choices": MEAL_CHOICES,
+        "meal_labels": meal_labels,
+    }
+    return render(request, "dining/kitchen_summary.html", context)
 
-    # meal_map[meal_time][dish_id] = {
-    #   "dish": Dish,
-    #   "total": int,
-    #   "tables": {table_no: set(places)}
-    # }
-    meal_map: dict[str, dict[int, dict]] = {code: {} for code, _ in MEAL_CHOICES}
+# горизонт производственного отчёта: по умолчанию и максимум, дней
+PRODUCTION_DEFAULT_DAYS = 3
+PRODUCTION_MAX_DAYS = 14
 
-    for order in orders:
-        guest = order.guest
-
-        # посадка на дату
-        seat = None
-        for s in guest.seat_assignments.all():
-            if s.start_date <= selected_date <= s.end_date:
-                seat = s
-                break
-        if not seat:
-            continue
+@login_required
+def kitchen_production_view(request):
+    """
+    Производственный отчёт для кухни на несколько дней вперёд:
+    порции и масса выхода по блюдам, приёмам пищи и диетам.
+    """
+    date_from, date_to = parse_date_range(request, PRODUCTION_DEFAULT_DAYS, PRODUCTION_MAX_DAYS)
+    report = build_production_report(date_from, date_to)
+
+    return render(request, "dining/kitchen_production.html", {
+        "report": report,
+        "date_from": date_from,
+        "days_count": (date_to - date_from).days + 1,
+        "days_options": range(1, PRODUCTION_MAX_DAYS + 1),
+        "diet_choices": DIET_TYPE_CHOICES,
+    })
 
-        table_no = seat.table.number
-        place_no = seat.place_number
+@login_required
+def report_export_view(request, report: str):
+    """
+    Выгрузка отчёта (kitchen / waiter) за несколько дней в CSV или XLSX.
+    Файл формируется и отдаётся потоком, по одному дню.
+    """
+    fmt = request.GET.get("format") or FORMAT_CSV
+    if fmt not in FORMATS:
+        fmt = FORMAT_CSV
+
+    date_from, date_to = parse_date_range(request, 1, PRODUCTION_MAX_DAYS)
+
+    if report == "kitchen":
+        rows = kitchen_export_rows(date_from, date_to)
+        sheet_name = "Кухня"
+    elif report == "waiter":
+        waiter_num, table_from, table_to = parse_waiter_tables(request)
+        rows = waiter_export_rows(date_from, date_to, table_from, table_to, waiter_num)
+        sheet_name = "Официанты"
+    else:
+        raise Http404("Неизвестный отчёт")
 
-        # фильтр по диапазону столов
-        if not (table_from <= table_no <= table_to):
-            continue
+    filename = f"{report}_{date_from:%Y-%m-%d}_{date_to:%Y-%m-%d}.{fmt}"
+    response = StreamingHttpResponse(
+        stream_rows(rows, fmt, sheet_name),
+        content_type=CONTENT_TYPES[fmt],
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
-        for oi in order.items.all():
-            dish = oi.menu_item.dish
-            meal_dict = meal_map.setdefault(order.meal_time, {})
+@login_required
+def missing_menu_fill_view(request, diet_kind: str):
+    """
+    Диетсестра выбирает блюда и назначает их всем гостям,
+    которые НЕ выбрали меню на дату, для конкретного вида диеты (P/B/BD).
 
-            entry = meal_dict.setdefault(
-                dish.id,
-                {"dish": dish, "total": 0, "tables": {}}
-            )
-            table_places = entry["tables"].setdefault(table_no, set())
+    КРИТИЧНОЕ ИЗМЕНЕНИЕ:
+    - в день выезда назначаем ТОЛЬКО те приёмы, которые разрешены (departure_*),
+      и не считаем отсутствующие запрещённые приёмы как "не выбрал".
+    - не удаляем все заказы гостя на дату: дополняем только недостающие meal_time.
+    """
+    diet_labels = dict(DIET_TYPE_CHOICES)
+    if diet_kind not in diet_labels:
+        return redirect("missing_menu")
 
-            # увеличиваем total только если место для этого блюда в этом столе ещё не учтено
-            if place_no not in table_places:
-                table_places.add(place_no)
-                entry["total"] += 1
+    date_str = request.GET.get("date")
+    if not date_str:
+        return redirect("missing_menu")
+    try:
+        target_date = date.fromisoformat(date_str)
+    except ValueError:
+        return redirect("missing_menu")
 
-    # готовим блоки для шаблона в порядке MEAL_CHOICES
-    meal_blocks = []
-    for code, label in MEAL_CHOICES:
-        dishes = meal_map.get(code, {})
-        if not dishes:
-            continue
-
-        rows = []
-        for dish_id, entry in sorted(dishes.items(), key=lambda x: x[1]["dish"].name):
-            table_parts = []
-            for t_no in sorted(entry["tables"].keys()):
-                places = sorted(entry["tables"][t_no])
-                places_str = ",".join(str(p) for p in places)
-                # Собираем данные о столах в список словарей
-            tables_data = []
-            for t_no in sorted(entry["tables"].keys()):
-                places = sorted(entry["tables"][t_no])
-                places_str = ",".join(str(p) for p in places)
-                tables_data.append({
-                    "number": t_no,
-                    "places": places,
-                    "formatted": f"{t_no}({places_str})"
-                })
-
-            rows.append({
-                "dish_name": entry["dish"].name,
-                "total": entry["total"],
-                "tables_data": tables_data,  # Передаем структурированные данные
-                "tables_str": "; ".join([t["formatted"] for t in tables_data]),  # Оставляем для совместимости
-            })
-
-        meal_blocks.append({
-            "meal_code": code,
-            "meal_label": label,
-            "rows": rows,
-        })
-
-    return render(
-        request,
-        "dining/waiter_print_compact.html",
-        {
-            "selected_date": selected_date,
-            "waiter_num": waiter_num,
-            "waiter_ranges": WAITER_RANGES,
-            "table_from": table_from,
-            "table_to": table_to,
-            "meal_blocks": meal_blocks,
-        },
-    )
-
-@login_required
-def kitchen_summary_view(request):
-    """
-    Отчёт для кухни:
-    - по выбранной дате показывает, сколько порций каждого блюда заказано,
-      с разбивкой по приёмам пищи и по столам.
-    """
-    cleanup_departed_guests()
-
-    today = date.today()
-    default_date = today + timedelta(days=1)  # по умолчанию — завтра
-
-    date_str = request.GET.get("date") or default_date.isoformat()
-    try:
-        selected_date = date.fromisoformat(date_str)
-    except ValueError:
-        selected_date = default_date
-
-    # Берём все заказы на эту дату
-    orders = (
-        Order.objects.filter(date=selected_date)
-        .exclude(meal_time="snack")
-        .select_related("guest")
-        .prefetch_related("items__menu_item__dish", "guest__seat_assignments__table")
-    )
-
-    # dish_map[dish_id] = {
-    #   "dish": Dish,
-    #   "total": int,
-    #   "by_meal": {meal_time: int},
-    #   "tables": set(table_numbers),
-    # }
-    dish_map: dict[int, dict] = {}
-    all_tables_set = set()
-
-    for order in orders:
-        guest = order.guest
-
-        # ищем актуальную посадку гостя на эту дату
-        seat = None
-        for s in guest.seat_assignments.all():
-            if s.start_date <= selected_date <= s.end_date:
-                seat = s
-                break
-        if not seat:
-            continue
-
-        table_no = seat.table.number
-        all_tables_set.add(table_no)
-
-        meal_time = order.meal_time
-
-        # все блюда в этом заказе
-        for oi in order.items.all():
-            dish = oi.menu_item.dish
-            entry = dish_map.setdefault(
-                dish.id,
-                {
-                    "dish": dish,
-                    "total": 0,
-                    "by_meal": {code: 0 for code, _ in MEAL_CHOICES},
-                    "tables": set(),
-                },
-            )
-            entry["total"] += 1
-            entry["by_meal"][meal_time] += 1
-            entry["tables"].add(table_no)
-
-    # приводим к списку для шаблона
-    meal_labels = dict(MEAL_CHOICES)
-    dishes_summary = []
-
-    for dish_id, entry in dish_map.items():
-        dishes_summary.append(
-            {
-                "dish": entry["dish"],
-                "total": entry["total"],
-                "by_meal": entry["by_meal"],
-                "tables": sorted(entry["tables"]),
-            }
-        )
-
-    # сортировка блюд по названию
-    dishes_summary.sort(key=lambda x: x["dish"].name)
-
-    all_tables = sorted(all_tables_set)
-
-    context = {
-        "selected_date": selected_date,
-        "dishes_summary": dishes_summary,
-        "all_tables": all_tables,
-        "meal_choices": MEAL_CHOICES,
-        "meal_labels": meal_labels,
-    }
-    return render(request, "dining/kitchen_summary.html", context)
-
-@login_required
-def missing_menu_fill_view(request, diet_kind: str):
-    """
-    Диетсестра выбирает блюда и назначает их всем гостям,
-    которые НЕ выбрали меню на дату, для конкретного вида диеты (P/B/BD).
-
-    КРИТИЧНОЕ ИЗМЕНЕНИЕ:
-    - в день выезда назначаем ТОЛЬКО те приёмы, которые разрешены (departure_*),
-      и не считаем отсутствующие запрещённые приёмы как "не выбрал".
-    - не удаляем все заказы гостя на дату: дополняем только недостающие meal_time.
-    """
-    cleanup_departed_guests()
-
-    diet_labels = dict(DIET_TYPE_CHOICES)
-    if diet_kind not in diet_labels:
-        return redirect("missing_menu")
-
-    date_str = request.GET.get("date")
-    if not date_str:
-        return redirect("missing_menu")
-    try:
-        target_date = date.fromisoformat(date_str)
-    except ValueError:
-        return redirect("missing_menu")
-
-    active_guests = (
-        Guest.objects.filter(
-            diet_kind=diet_kind,
-            start_date__lte=target_date,
-            end_date__gte=target_date,
-        )
-    )
-
-    daily_menu = get_daily_menu_for_date_and_diet(target_date, diet_kind)
-    if not daily_menu:
+    # меню всех диет на дату (кэш, см. menu_cache.py); без подмены чужой диетой
+    menu = get_day_menus(target_date).menus.get(diet_kind)
+    if not menu:
         return render(request, "dining/missing_menu_fill.html", {
             "target_date": target_date,
             "diet_kind": diet_kind,
@@ -1811,33 +1365,13 @@ def missing_menu_fill_view(request, diet_kind: str):
             "error": "На эту дату нет настроенного меню для выбранного вида диеты.",
         })
 
-    meal_blocks = build_meal_blocks_from_daily_menu(daily_menu)
-    required_keys, required_meals = required_keys_and_meals(meal_blocks)
+    daily_menu = menu.daily_menu
+    meal_blocks = menu.meal_blocks
+    required_keys = menu.required_keys
 
-    # карта заказов: (guest_id, meal_time) -> count(OrderItem)
-    orders_map = orders_items_count_map_for_date(target_date, active_guests)
-
-    # кто "не выбрал" (по разрешённым и требующим выбора приёмам)
-    missing_guests = []
-    for g in active_guests:
-        allowed = allowed_meals_for_guest_on_date(g, target_date)
-
-        # если нет выборных блюд — нечего назначать
-        if not required_meals:
-            continue
-
-        is_missing = False
-        for meal_code in required_meals:
-            if not allowed.get(meal_code, False):
-                continue
-            if orders_map.get((g.id, meal_code), 0) <= 0:
-                is_missing = True
-                break
-
-        if is_missing:
-            missing_guests.append(g)
-
-    missing_count = len(missing_guests)
+    # кто "не выбрал" (по разрешённым и требующим выбора приёмам) — см. fill.py
+    missing = find_missing(target_date, [diet_kind])
+    missing_count = len(missing.guests)
 
     if request.method == "POST":
         if missing_count == 0:
@@ -1862,14 +1396,14 @@ def missing_menu_fill_view(request, diet_kind: str):
 
         valid_for_key = {}
         for meal in meal_blocks:
-            for cat in meal["categories"]:
-                ids = [it.id for it in cat["items"] if not it.is_common]  # общие нельзя выбирать
-                valid_for_key[cat["key"]] = set(ids)
+            for cat in meal.categories:
+                ids = [it.id for it in cat.items if not it.is_common]  # общие нельзя выбирать
+                valid_for_key[cat.key] = set(ids)
 
         for meal in meal_blocks:
-            meal_code = meal["code"]
-            for cat in meal["categories"]:
-                key = cat["key"]
+            meal_code = meal.code
+            for cat in meal.categories:
+                key = cat.key
                 val = request.POST.get(key)
                 if not val:
                     continue
@@ -1885,32 +1419,13 @@ def missing_menu_fill_view(request, diet_kind: str):
             messages.warning(request, "Вы не выбрали ни одного блюда. Ничего не назначено.")
             return redirect(request.path + f"?date={target_date.isoformat()}")
 
-        # 3) Применяем ко всем, кто "не выбрал"
-        for g in missing_guests:
-            allowed = allowed_meals_for_guest_on_date(g, target_date)
-
-            for meal_code in required_meals:
-                if not allowed.get(meal_code, False):
-                    # в день выезда многие meal_time запрещены — пропускаем
-                    continue
-
-                ids = selected_by_meal.get(meal_code) or []
-                if not ids:
-                    continue
-
-                # если у гостя уже есть выбор по этому meal_time — не трогаем
-                if orders_map.get((g.id, meal_code), 0) > 0:
-                    continue
-
-                order, _ = Order.objects.get_or_create(
-                    guest=g,
-                    date=target_date,
-                    meal_time=meal_code,
-                )
-                order.items.all().delete()
-                OrderItem.objects.bulk_create(
-                    [OrderItem(order=order, menu_item_id=mid) for mid in ids]
-                )
+        # 3) Применяем ко всем, кто "не выбрал" (только разрешённые и незаполненные приёмы)
+        summary = fill_missing_orders(
+            target_date, [diet_kind], items_by_diet={diet_kind: selected_by_meal}, missing=missing,
+        )
+        if summary.orders.changed and is_after_cutoff(target_date):
+            # окно выбора закрыто — сразу пересобираем отчёты для кухни и официантов
+            build_service_sheets(target_date)
 
         messages.success(
             request,
@@ -1929,167 +1444,39 @@ def missing_menu_fill_view(request, diet_kind: str):
         "error": None,
     })
 
-    """
-    Диетсестра выбирает блюда из меню на дату и назначает их всем гостям,
-    которые НЕ выбрали меню на эту дату, для конкретного вида диеты (P/B/BD).
-    """
-    cleanup_departed_guests()
 
-    diet_labels = dict(DIET_TYPE_CHOICES)
-    if diet_kind not in diet_labels:
-        return redirect("missing_menu")
+def parse_missing_menu_date(request) -> date:
+    """Дата для страниц "не выбрали меню": ?date=, иначе дата активного меню, иначе завтра."""
+    now = timezone.localtime()
 
     # дата из query string
     date_str = request.GET.get("date")
-    if not date_str:
-        return redirect("missing_menu")
-    try:
-        target_date = date.fromisoformat(date_str)
-    except ValueError:
-        return redirect("missing_menu")
-
-    # список активных гостей этой диеты на дату
-    active_guests = Guest.objects.filter(
-        diet_kind=diet_kind,
-        start_date__lte=target_date,
-        end_date__gte=target_date,
-    )
-
-    # гости, у кого уже есть заказы на эту дату
-    guests_with_orders = set(
-        Order.objects.filter(date=target_date).values_list("guest_id", flat=True)
-    )
-
-    # те, кто не выбрал
-    missing_guests = list(active_guests.exclude(id__in=guests_with_orders))
-    missing_count = len(missing_guests)
-
-    # определяем цикл/день недели для этой даты
-    cycle, day_index = get_cycle_and_day_for_date(target_date)
-    daily_menu = None
-    if cycle:
-        daily_menu = DailyMenu.objects.filter(
-            cycle=cycle,
-            day_index=day_index,
-            diet_kind=diet_kind,
-        ).first()
-
-    if not daily_menu:
-        # меню не настроено
-        return render(request, "dining/missing_menu_fill.html", {
-            "target_date": target_date,
-            "diet_kind": diet_kind,
-            "diet_label": diet_labels.get(diet_kind, diet_kind),
-            "missing_count": missing_count,
-            "daily_menu": None,
-            "meal_blocks": [],
-            "error": "На эту дату нет настроенного меню для выбранного вида диеты.",
-        })
-
-    # строим структуру: meal -> categories -> items
-    # category_blocks: [{"key": "...", "category": "...", "items": [MenuItem...]}]
-    meal_blocks = []
-    for meal_code, meal_label in MEAL_CHOICES:
-        items = list(
-            daily_menu.items.filter(meal_time=meal_code).select_related("dish").order_by("order_index", "id")
-        )
-        if not items:
-            continue
-
-        # группируем по category, сохраняя порядок появления
-        cat_map = {}
-        for it in items:
-            cat = it.category or ""
-            cat_map.setdefault(cat, []).append(it)
-
-        categories = []
-        idx = 0
-        for cat_name, cat_items in cat_map.items():
-            # ключ поля для формы
-            key = f"{meal_code}_cat_{idx}"
-            idx += 1
-            categories.append({
-                "key": key,
-                "category": cat_name,
-                "items": cat_items,
-            })
-
-        meal_blocks.append({
-            "code": meal_code,
-            "label": meal_label,
-            "time": MEAL_TIMES.get(meal_code),
-            "categories": categories,
-        })
-
-    # POST: назначаем выбранные блюда всем missing_guests
-    if request.method == "POST":
-        if missing_count == 0:
-            messages.warning(request, "Нет отдыхающих без выбора на эту дату.")
-            return redirect(f"{reverse('missing_menu')}?date={target_date.isoformat()}")
-
-        # соберём выбранные menu_item_id по приёмам пищи
-        selected_by_meal = {code: [] for code, _ in MEAL_CHOICES}
-
-        # для валидации подготовим допустимые id для каждого поля
-        valid_for_key = {}
-        for meal in meal_blocks:
-            for cat in meal["categories"]:
-                ids = [it.id for it in cat["items"] if not it.is_common]  # общие нельзя выбирать
-                valid_for_key[cat["key"]] = set(ids)
-
-        for meal in meal_blocks:
-            meal_code = meal["code"]
-            for cat in meal["categories"]:
-                key = cat["key"]
-                val = request.POST.get(key)
-                if not val:
-                    continue
-                try:
-                    mid = int(val)
-                except ValueError:
-                    continue
-                if mid in valid_for_key.get(key, set()):
-                    selected_by_meal[meal_code].append(mid)
-
-        # если вообще ничего не выбрали — не делаем
-        if not any(selected_by_meal.values()):
-            messages.warning(request, "Вы не выбрали ни одного блюда. Ничего не назначено.")
-            return redirect(request.path + f"?date={target_date.isoformat()}")
-
-        # применяем ко всем гостям без выбора
-        for g in missing_guests:
-            # на всякий случай чистим любые заказы на эту дату (хотя они missing)
-            Order.objects.filter(guest=g, date=target_date).delete()
+    if date_str:
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            return now.date()
 
-            for meal_code, ids in selected_by_meal.items():
-                if not ids:
-                    continue
-                order = Order.objects.create(
-                    guest=g,
-                    date=target_date,
-                    meal_time=meal_code,
-                )
-                OrderItem.objects.bulk_create(
-                    [OrderItem(order=order, menu_item_id=mid) for mid in ids]
-                )
+    # пробуем использовать "активное" меню, иначе завтра
+    t_date, _, _ = get_active_menu_target(now)
+    return t_date if t_date is not None else now.date() + timedelta(days=1)
 
-        messages.success(
-            request,
-            f"Назначено выбранное меню для {missing_count} чел. "
-            f"({diet_labels.get(diet_kind)}) на {target_date.strftime('%d.%m.%Y')}.",
-        )
-        return redirect(f"{reverse('missing_menu')}?date={target_date.isoformat()}")
 
-    return render(request, "dining/missing_menu_fill.html", {
-        "target_date": target_date,
-        "diet_kind": diet_kind,
-        "diet_label": diet_labels.get(diet_kind, diet_kind),
-        "missing_count": missing_count,
-        "daily_menu": daily_menu,
-        "meal_blocks": meal_blocks,
-        "error": None,
+@login_required
+def missing_menu_counts_view(request):
+    """
+    JSON: сколько гостей не выбрали меню на дату, по видам диеты.
+    Считается одним сгруппированным запросом (см. fill.missing_counts).
+    """
+    target_date = parse_missing_menu_date(request)
+    by_diet = missing_counts(target_date)
+    return JsonResponse({
+        "date": target_date.isoformat(),
+        "total": sum(by_diet.values()),
+        "by_diet": by_diet,
     })
 
+
 @login_required
 def missing_menu_view(request):
     """
@@ -2103,66 +1490,11 @@ def missing_menu_view(request):
         (а) разрешены гостю на эту дату
         (б) имеют в меню выборные блюда (is_common=False)
     """
-    cleanup_departed_guests()
-    now = timezone.localtime()
-
-    # дата из query string
-    date_str = request.GET.get("date")
-    if date_str:
-        try:
-            target_date = date.fromisoformat(date_str)
-        except ValueError:
-            target_date = now.date()
-    else:
-        # пробуем использовать "активное" меню, иначе завтра
-        t_date, _, _ = get_active_menu_target(now)
-        target_date = t_date if t_date is not None else now.date() + timedelta(days=1)
-
-    # активные гости на дату (берём сразу с посадками, чтобы меньше запросов)
-    active_guests = (
-        Guest.objects.filter(start_date__lte=target_date, end_date__gte=target_date)
-        .prefetch_related("seat_assignments__table")
-    )
-
-    # карта заказов: (guest_id, meal_time) -> count(OrderItem)
-    orders_map = orders_items_count_map_for_date(target_date, active_guests)
-
-    # для каждой диеты: какие приёмы пищи реально "требуют выбора" (есть is_common=False)
-    required_meals_by_diet = {}
-    for diet_code, _label in DIET_TYPE_CHOICES:
-        dm = get_daily_menu_for_date_and_diet(target_date, diet_code)
-        if not dm:
-            required_meals_by_diet[diet_code] = set()
-            continue
-        meal_blocks = build_meal_blocks_from_daily_menu(dm)
-        _required_keys, required_meals = required_keys_and_meals(meal_blocks)
-        required_meals_by_diet[diet_code] = required_meals
-
-    # считаем список "не выбрали"
-    missing_guests = []
-    for g in active_guests:
-        allowed = allowed_meals_for_guest_on_date(g, target_date)
-        required_meals = required_meals_by_diet.get(g.diet_kind, set())
-
-        # если на эту диету/дату нет выборных блюд — нечего выбирать => не считаем missing
-        if not required_meals:
-            continue
-
-        is_missing = False
-        for meal_code in required_meals:
-            if not allowed.get(meal_code, False):
-                continue
-            if orders_map.get((g.id, meal_code), 0) <= 0:
-                is_missing = True
-                break
+    target_date = parse_missing_menu_date(request)
 
-        if is_missing:
-            missing_guests.append(g)
-
-    # группируем missing по виду диеты
-    by_diet = {code: [] for code, _ in DIET_TYPE_CHOICES}
-    for g in missing_guests:
-        by_diet.setdefault(g.diet_kind, []).append(g)
+    # кто не выбрал меню (по разрешённым приёмам, где есть выборные блюда) — см. fill.py
+    missing = find_missing(target_date)
+    by_diet = missing.by_diet()
 
     # POST: автоматическое назначение стандартного меню (первое не-общее блюдо по meal_time),
     # но только для разрешённых приёмов пищи и только для тех meal_time, где есть выборные блюда.
@@ -2174,66 +1506,15 @@ def missing_menu_view(request):
         else:
             diets = [diet_to_fill] if diet_to_fill else []
 
-        filled_guest_ids = set()
-
-        for diet_code in diets:
-            guests_for_diet = by_diet.get(diet_code) or []
-            if not guests_for_diet:
-                continue
-
-            dm = get_daily_menu_for_date_and_diet(target_date, diet_code)
-            if not dm:
-                continue
-
-            meal_blocks = build_meal_blocks_from_daily_menu(dm)
-            _required_keys, required_meals = required_keys_and_meals(meal_blocks)
-            if not required_meals:
-                continue
-
-            # "стандартные" блюда: первое не-общее блюдо на каждый приём пищи
-            default_item_by_meal = {}
-            for meal_code in required_meals:
-                first_item = (
-                    dm.items
-                    .filter(meal_time=meal_code, is_common=False)
-                    .order_by("order_index", "id")
-                    .first()
-                )
-                if first_item:
-                    default_item_by_meal[meal_code] = first_item
-
-            for guest in guests_for_diet:
-                allowed = allowed_meals_for_guest_on_date(guest, target_date)
-
-                any_created = False
-                for meal_code in required_meals:
-                    if not allowed.get(meal_code, False):
-                        continue
-
-                    default_item = default_item_by_meal.get(meal_code)
-                    if not default_item:
-                        continue
-
-                    # если уже есть выбор (items_count > 0) — не трогаем
-                    if orders_map.get((guest.id, meal_code), 0) > 0:
-                        continue
+        summary = fill_missing_orders(target_date, diets, missing=missing) if diets else None
+        if summary and summary.orders.changed and is_after_cutoff(target_date):
+            # окно выбора закрыто — сразу пересобираем отчёты для кухни и официантов
+            build_service_sheets(target_date)
 
-                    order, _ = Order.objects.get_or_create(
-                        guest=guest,
-                        date=target_date,
-                        meal_time=meal_code,
-                    )
-                    order.items.all().delete()
-                    OrderItem.objects.create(order=order, menu_item=default_item)
-                    any_created = True
-
-                if any_created:
-                    filled_guest_ids.add(guest.id)
-
-        if filled_guest_ids:
+        if summary and summary.guests_filled:
             messages.success(
                 request,
-                f"Назначено стандартное меню для {len(filled_guest_ids)} отдыхающих на {target_date.strftime('%d.%m.%Y')}.",
+                f"Назначено стандартное меню для {summary.guests_filled} отдыхающих на {target_date.strftime('%d.%m.%Y')}.",
             )
         else:
             messages.warning(
@@ -2248,21 +1529,19 @@ def missing_menu_view(request):
     stats = []
     total_missing = 0
 
+    seats = seat_map_for_date(target_date, request)
+
     for code, label in DIET_TYPE_CHOICES:
         guests_for_diet = by_diet.get(code) or []
         entries = []
 
         for g in guests_for_diet:
-            # ищем место за столом на эту дату
-            seat = None
-            for s in g.seat_assignments.all():
-                if s.start_date <= target_date <= s.end_date:
-                    seat = s
-                    break
+            # место за столом на эту дату
+            seat = seats.get(g.id)
 
             entries.append({
                 "guest": g,
-                "table": seat.table.number if seat else None,
+                "table": seat.table_number if seat else None,
                 "place": seat.place_number if seat else None,
             })
 
@@ -2295,10 +1574,8 @@ def guest_logout_view(request):
     return redirect("landing")
 
 @login_required
-@transaction.atomic
+@atomic_post
 def move_guest_view(request, guest_id: int):
-    cleanup_departed_guests()
-
     guest = get_object_or_404(Guest, id=guest_id)
 
     date_str = request.GET.get("date")
@@ -2323,14 +1600,10 @@ def move_guest_view(request, guest_id: int):
         })
 
     # находим текущую посадку на эту дату
-    current = None
-    for s in guest.seat_assignments.all():
-        if s.start_date <= move_date <= s.end_date:
-            current = s
-            break
+    current_seat = seat_for_guest(guest.id, move_date)
 
-    current_table = current.table.number if current else None
-    current_place = current.place_number if current else None
+    current_table = current_seat.table_number if current_seat else None
+    current_place = current_seat.place_number if current_seat else None
 
     if request.method == "POST":
         try:
@@ -2386,6 +1659,8 @@ def move_guest_view(request, guest_id: int):
                 "new_place_number": new_place_number,
             })
 
+        current = SeatAssignment.objects.get(id=current_seat.assignment_id) if current_seat else None
+
         # если текущей посадки нет — просто создаём новую с move_date до end_date
         if not current:
             SeatAssignment.objects.create(
@@ -2532,127 +1807,31 @@ def guest_departure_edit_view(request, guest_id: int):
         },
     )
 
-@login_required
-def guest_list_view(request):
-    """
-    Список отдыхающих с поиском по ФИО.
-    Показываем активных на выбранную дату (по умолчанию сегодня).
-    """
-    cleanup_departed_guests()
+GUEST_PAGE_SIZE = 100
+GUEST_AUTOCOMPLETE_LIMIT = 10
 
-    # дата просмотра
+
+def _guest_list_date(request) -> date:
     date_str = request.GET.get("date")
     if date_str:
         try:
-            target_date = date.fromisoformat(date_str)
+            return date.fromisoformat(date_str)
         except ValueError:
-            target_date = date.today()
-    else:
-        target_date = date.today()
-
-    q = (request.GET.get("q") or "").strip()
-
-    guests_qs = Guest.objects.filter(
-        start_date__lte=target_date,
-        end_date__gte=target_date,
-    )
-
-    if q:
-        q_clean = q.lower()
-        guests_qs = guests_qs.filter(
-            Q(full_name__contains=q_clean) |
-            Q(full_name__contains=q_clean.capitalize()) |
-            Q(full_name__contains=q_clean.upper())
-        )
-
-    guests_qs = guests_qs.order_by("full_name")
-
-    seats = (
-        SeatAssignment.objects
-        .filter(start_date__lte=target_date, end_date__gte=target_date)
-        .select_related("table", "guest")
-    )
-    seat_by_guest_id = {s.guest_id: s for s in seats}
+            pass
+    return date.today()
 
-    guests = []
-    for g in guests_qs:
-        s = seat_by_guest_id.get(g.id)
-        guests.append({
-            "guest": g,
-            "table": s.table.number if s else None,
-            "place": s.place_number if s else None,
-        })
 
-    return render(request, "dining/guest_list.html", {
-        "target_date": target_date,
-        "q": q,
-        "guests": guests,
-        "count": len(guests),
-    })
+@login_required
+def guest_list_view(request):
     """
-    Список отдыхающих с поиском по ФИО.
-    Показываем активных на выбранную дату (по умолчанию сегодня).
-    Диетсестра может менять дату выезда прямо в таблице.
+    Список отдыхающих с поиском по ФИО (см. search.py).
+    Показываем активных на выбранную дату (по умолчанию сегодня),
+    страницами по GUEST_PAGE_SIZE: ?after=<id последнего показанного>.
     """
-    cleanup_departed_guests()
-
-    # --- POST: изменение даты выезда ---
-    if request.method == "POST":
-        guest_id = request.POST.get("guest_id")
-        new_date_str = request.POST.get("new_end_date") or ""
-        orig_date_str = request.POST.get("orig_date") or ""
-        orig_q = request.POST.get("orig_q") or ""
-
-        if guest_id and new_date_str:
-            try:
-                g = Guest.objects.get(id=int(guest_id))
-            except (Guest.DoesNotExist, ValueError):
-                messages.error(request, "Не удалось найти отдыхающего.")
-            else:
-                try:
-                    new_end = date.fromisoformat(new_date_str)
-                except ValueError:
-                    messages.error(request, "Некорректная дата выезда.")
-                else:
-                    if new_end < g.start_date:
-                        messages.error(
-                            request,
-                            f"Дата выезда не может быть раньше даты заезда ({g.start_date:%d.%m.%Y})."
-                        )
-                    else:
-                        g.end_date = new_end
-                        g.save(update_fields=["end_date"])
-                        messages.success(
-                            request,
-                            f"Дата выезда для «{g.full_name}» изменена на {new_end:%d.%m.%Y}."
-                        )
-
-        # Возвращаемся на список с исходными фильтрами (date, q)
-        params = {}
-        if orig_date_str:
-            params["date"] = orig_date_str
-        if orig_q:
-            params["q"] = orig_q
-
-        url = reverse("guest_list")
-        if params:
-            url += "?" + urlencode(params)
-
-        return redirect(url)
-
-    # --- GET: отображение списка ---
-
-    # дата просмотра
-    date_str = request.GET.get("date")
-    if date_str:
-        try:
-            target_date = date.fromisoformat(date_str)
-        except ValueError:
-            target_date = date.today()
-    else:
-        target_date = date.today()
-
+    target_date = _guest_list_date(request)
     q = (request.GET.get("q") or "").strip()
+    after_str = request.GET.get("after") or ""
+    after_id = int(after_str) if after_str.isdigit() else None
 
     guests_qs = Guest.objects.filter(
         start_date__lte=target_date,
@@ -2660,94 +1839,86 @@ def guest_list_view(request):
     )
 
     if q:
-        # Для корректного поиска кириллицы в SQLite без учета регистра
-        q_clean = q.lower()
-        guests_qs = guests_qs.filter(
-            Q(full_name__contains=q_clean) |
-            Q(full_name__contains=q_clean.capitalize()) |
-            Q(full_name__contains=q_clean.upper())
-        )
-
-    guests_qs = guests_qs.order_by("full_name")
+        # порядок задаёт ранжирование (считается в Python, см. search.py), поэтому
+        # keyset по нему невозможен: на каждой странице заново строится весь
+        # список подходящих id, страница — его срез после after
+        ids = guest_search_ids(q, guests_qs)
+        count = len(ids)
+        start = ids.index(after_id) + 1 if after_id in ids else 0
+        page_ids = ids[start:start + GUEST_PAGE_SIZE + 1]
+        by_id = guests_qs.in_bulk(page_ids)
+        page = [by_id[guest_id] for guest_id in page_ids if guest_id in by_id]
+    else:
+        # keyset-пагинация по (ФИО, id): без OFFSET, страница читается по индексу
+        # guest_full_name_id с отбором по датам
+        count = guests_qs.count()
+        page_qs = guests_qs.order_by("full_name", "id")
+        last = guests_qs.filter(id=after_id).values_list("full_name", flat=True).first() if after_id else None
+        if last is not None:
+            page_qs = page_qs.filter(Q(full_name__gt=last) | Q(full_name=last, id__gt=after_id))
+        page = list(page_qs[:GUEST_PAGE_SIZE + 1])
+
+    has_more = len(page) > GUEST_PAGE_SIZE
+    page = page[:GUEST_PAGE_SIZE]
 
     # посадки на эту дату (чтобы показать стол/место)
-    seats = (
-        SeatAssignment.objects
-        .filter(start_date__lte=target_date, end_date__gte=target_date)
-        .select_related("table", "guest")
-    )
-    seat_by_guest_id = {s.guest_id: s for s in seats}
+    seats = seat_map_for_date(target_date, request)
 
     guests = []
-    for g in guests_qs:
-        s = seat_by_guest_id.get(g.id)
+    for g in page:
+        s = seats.get(g.id)
         guests.append({
             "guest": g,
-            "table": s.table.number if s else None,
+            "table": s.table_number if s else None,
             "place": s.place_number if s else None,
         })
 
+    next_url = ""
+    if has_more:
+        params = {"date": target_date.isoformat(), "after": page[-1].id}
+        if q:
+            params["q"] = q
+        next_url = f"{reverse('guest_list')}?{urlencode(params)}"
+
     return render(request, "dining/guest_list.html", {
         "target_date": target_date,
         "q": q,
         "guests": guests,
-        "count": len(guests),
+        "count": count,
+        "next_url": next_url,
     })
-    """
-    Список отдыхающих с поиском по ФИО.
-    Показываем активных на выбранную дату (по умолчанию сегодня).
-    """
-    cleanup_departed_guests()
 
-    # дата просмотра
-    date_str = request.GET.get("date")
-    if date_str:
-        try:
-            target_date = date.fromisoformat(date_str)
-        except ValueError:
-            target_date = date.today()
-    else:
-        target_date = date.today()
 
+@login_required
+def guest_autocomplete_view(request):
+    """
+    JSON для подсказок при поиске гостя: ?q=иван а&date=YYYY-MM-DD&limit=10.
+    Активные на дату гости в порядке ранжирования, с посадкой на эту дату.
+    """
+    target_date = _guest_list_date(request)
     q = (request.GET.get("q") or "").strip()
+    limit_str = request.GET.get("limit") or ""
+    limit = min(int(limit_str), 50) if limit_str.isdigit() and int(limit_str) > 0 else GUEST_AUTOCOMPLETE_LIMIT
+
+    results = []
+    if len(q) >= 2:
+        guests_qs = Guest.objects.filter(start_date__lte=target_date, end_date__gte=target_date)
+        ids = guest_search_ids(q, guests_qs)[:limit]
+        by_id = guests_qs.in_bulk(ids)
+        seats = seat_map_for_date(target_date, request) if ids else {}
+        for guest_id in ids:
+            g = by_id.get(guest_id)
+            if g is None:
+                continue
+            seat = seats.get(guest_id)
+            results.append({
+                "id": g.id,
+                "full_name": g.full_name,
+                "diet_kind": g.diet_kind,
+                "end_date": g.end_date.isoformat(),
+                "table": seat.table_number if seat else None,
+                "place": seat.place_number if seat else None,
+                "move_url": f"{reverse('move_guest', args=[g.id])}?date={target_date.isoformat()}",
+            })
 
-    guests_qs = Guest.objects.filter(
-        start_date__lte=target_date,
-        end_date__gte=target_date,
-    )
-
-    if q:
-        # Для корректного поиска кириллицы в SQLite без учета регистра
-        # проверяем варианты: "текст", "Текст", "ТЕКСТ"
-        q_clean = q.lower()
-        guests_qs = guests_qs.filter(
-            Q(full_name__contains=q_clean) | 
-            Q(full_name__contains=q_clean.capitalize()) | 
-            Q(full_name__contains=q_clean.upper())
-        )
-
-    guests_qs = guests_qs.order_by("full_name")
-
-    # посадки на эту дату (чтобы показать стол/место)
-    seats = (
-        SeatAssignment.objects
-        .filter(start_date__lte=target_date, end_date__gte=target_date)
-        .select_related("table", "guest")
-    )
-    seat_by_guest_id = {s.guest_id: s for s in seats}
-
-    guests = []
-    for g in guests_qs:
-        s = seat_by_guest_id.get(g.id)
-        guests.append({
-            "guest": g,
-            "table": s.table.number if s else None,
-            "place": s.place_number if s else None,
-        })
-
-    return render(request, "dining/guest_list.html", {
-        "target_date": target_date,
-        "q": q,
-        "guests": guests,
-        "count": len(guests),
-    })
\ No newline at end of file
+    return JsonResponse({"date": target_date.isoformat(), "q": q, "results": results})
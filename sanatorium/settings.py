@@ -77,6 +77,15 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # транзакции сразу берут блокировку на запись (BEGIN IMMEDIATE):
+            # save_orders сначала читает заказы, потом пишет, и в отложенной
+            # транзакции параллельный запрос получал "database is locked"
+            # без ожидания; теперь ждёт освобождения до timeout секунд
+            # (страницы с GET в транзакцию не оборачиваются — см. views.atomic_post)
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
     }
 }
 